@@ -0,0 +1,105 @@
+"""
+# Github Authors: https://github.com/JulianStiebler/
+# Github Contributors: https://github.com/JulianStiebler/
+
+# GitHub Repository: https://github.com/JulianStiebler/GameSaveVault
+# Github License: MIT // https://github.com/JulianStiebler/GameSaveVault/blob/main/LICENSE
+
+# Last Edited: 18.10.2026
+"""
+
+# Parses a fixture directory of synthetic appmanifest_*.acf files with the former line-splitting
+# reader, the KeyValues parser (cold) and the per-file manifest cache (warm). Runs on any OS.
+# Usage (from the repository root): python -m benchmarks.benchACFParsing [fileCount]
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+
+from modules.steamManifests import SteamManifestCache
+
+ACF_TEMPLATE = '''"AppState"
+{{
+\t"appid"\t\t"{appid}"
+\t"Universe"\t\t"1"
+\t"name"\t\t"{name}"
+\t"StateFlags"\t\t"4"
+\t"installdir"\t\t"{installdir}"
+\t"SizeOnDisk"\t\t"{size}"
+\t"UserConfig"
+\t{{
+\t\t"name"\t\t"{name} (user config)"
+\t\t"language"\t\t"english"
+\t}}
+\t"InstalledDepots"
+\t{{
+\t\t"{depot}"
+\t\t{{
+\t\t\t"manifest"\t\t"{manifest}"
+\t\t\t"size"\t\t"{size}"
+\t\t}}
+\t}}
+}}
+'''
+
+
+def writeFixtures(directory, count):
+    paths = []
+    for i in range(count):
+        appid = 100000 + i
+        path = os.path.join(directory, f"appmanifest_{appid}.acf")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(ACF_TEMPLATE.format(
+                appid=appid, name=f'Synthetic \\"Game\\" {i}', installdir=f"Synthetic Game {i}",
+                size=1_000_000 + i, depot=appid + 1, manifest=7_000_000_000_000 + i,
+            ))
+        paths.append(path)
+    return paths
+
+
+def legacyParse(ACFFilePath):
+    # The reader GetInstalledGames used before the KeyValues parser, kept here as the baseline
+    gameDetails = {}
+    with open(ACFFilePath, 'r', encoding='utf-8') as file:
+        lines = file.readlines()
+    for line in lines:
+        if '"appid"' in line:
+            gameDetails['appid'] = line.split('"')[3]
+        elif '"name"' in line:
+            gameDetails['name'] = line.split('"')[3]
+        elif '"installdir"' in line:
+            gameDetails['installdir'] = line.split('"')[3]
+    return gameDetails
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main(count=3000):
+    directory = tempfile.mkdtemp(prefix="gsv-acf-")
+    try:
+        paths = writeFixtures(directory, count)
+        cachePath = os.path.join(directory, "acfCache.json")
+
+        legacy, legacyTime = timed(lambda: [legacyParse(path) for path in paths])
+        cold, coldTime = timed(lambda: SteamManifestCache(cachePath).parseAll(paths))
+        warm, warmTime = timed(lambda: SteamManifestCache(cachePath).parseAll(paths))
+
+        assert cold == warm and cold[0]["name"] == 'Synthetic "Game" 0'
+        legacyWrong = sum(1 for old, new in zip(legacy, cold) if old.get("name") != new.get("name"))
+
+        print(f"{count} manifests")
+        print(f"legacy line split   {legacyTime * 1000:8.1f} ms   ({legacyWrong} wrong names)")
+        print(f"KeyValues cold      {coldTime * 1000:8.1f} ms")
+        print(f"KeyValues warm      {warmTime * 1000:8.1f} ms   (cache hit on every file)")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,71 @@
+"""
+# Github Authors: https://github.com/JulianStiebler/
+# Github Contributors: https://github.com/JulianStiebler/
+
+# GitHub Repository: https://github.com/JulianStiebler/GameSaveVault
+# Github License: MIT // https://github.com/JulianStiebler/GameSaveVault/blob/main/LICENSE
+
+# Last Edited: 18.10.2026
+"""
+
+# Writes and restores the same synthetic save tree with every archive codec and reports the
+# compression ratio, compression MB/s and decompression MB/s. Restores are verified byte for byte.
+# Usage (from the repository root): python -m benchmarks.benchArchiveCodecs [smallFiles] [largeFiles] [largeMB] [preset]
+
+import os
+import sys
+import time
+import shutil
+import filecmp
+import tempfile
+
+import core.util as util
+from core import archiveCodecs
+from core.compressionPolicy import CompressionPolicy
+from benchmarks.benchParallelZip import writeFixtures
+
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def sameTree(left, right):
+    comparison = filecmp.dircmp(left, right)
+    if comparison.left_only or comparison.right_only or comparison.diff_files:
+        return False
+    _, mismatch, errors = filecmp.cmpfiles(left, right, comparison.common_files, shallow=False)
+    return not mismatch and not errors and all(sameTree(os.path.join(left, sub), os.path.join(right, sub)) for sub in comparison.common_dirs)
+
+
+def main(smallFiles=2000, largeFiles=2, largeMB=16, preset="balanced"):
+    directory = tempfile.mkdtemp(prefix="gsv-codec-")
+    try:
+        source = os.path.join(directory, "save")
+        writeFixtures(source, smallFiles, largeFiles, largeMB)
+        files = util.listFolder(source)
+        totalMB = sum(os.path.getsize(path) for path, _ in files) / 1024 ** 2
+        workers = os.cpu_count() or 1
+
+        print(f"{len(files)} files, {totalMB:.1f} MB, preset {preset}, {workers} workers")
+        print(f"{'codec':<8} {'ratio':>7} {'compress MB/s':>14} {'decompress MB/s':>16}")
+        for name, codec in archiveCodecs.CODECS.items():
+            archivePath = os.path.join(directory, f"backup{codec.EXTENSION}")
+            target = os.path.join(directory, f"restore-{name}")
+            os.makedirs(target)
+
+            createTime = timed(lambda: codec.create(files, archivePath, None, workers, CompressionPolicy(preset)))
+            extractTime = timed(lambda: archiveCodecs.detectCodec(archivePath).extract(archivePath, target))
+            assert sameTree(source, target), f"{name} restore differs from the source"
+
+            ratio = os.path.getsize(archivePath) / 1024 ** 2 / totalMB
+            print(f"{name:<8} {ratio:7.3f} {totalMB / createTime:14.1f} {totalMB / extractTime:16.1f}")
+            shutil.rmtree(target)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    arguments = sys.argv[1:5]
+    main(*(int(arg) for arg in arguments[:3]), *arguments[3:])
@@ -0,0 +1,63 @@
+"""
+# Github Authors: https://github.com/JulianStiebler/
+# Github Contributors: https://github.com/JulianStiebler/
+
+# GitHub Repository: https://github.com/JulianStiebler/GameSaveVault
+# Github License: MIT // https://github.com/JulianStiebler/GameSaveVault/blob/main/LICENSE
+
+# Last Edited: 18.10.2026
+"""
+
+# Starts fresh interpreters and compares the cold start of the GUI's imports (main.py up to the window)
+# with the headless command line, then checks that no CLI command loaded tkinter or ttkbootstrap.
+# Usage (from the repository root): python -m benchmarks.benchColdStart [runs]
+
+import sys
+import time
+import statistics
+import subprocess
+
+COMMANDS = [
+    ("interpreter", [sys.executable, "-c", "pass"]),
+    ("gui imports", [sys.executable, "-c", "import main"]),
+    ("cli --help", [sys.executable, "-m", "gamesavevault", "--help"]),
+    ("cli list", [sys.executable, "-m", "gamesavevault", "list"]),
+    ("cli verify", [sys.executable, "-m", "gamesavevault", "verify", "--all"]),
+]
+TK_MODULES = ("tkinter", "ttkbootstrap", "_tkinter")
+
+
+def run(command):
+    # A command that fails early would only time its error, so every run has to succeed
+    result = subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"{' '.join(command)} exited with {result.returncode}:\n{result.stderr[-2000:]}")
+    return result
+
+
+def timedRun(command):
+    start = time.perf_counter()
+    run(command)
+    return (time.perf_counter() - start) * 1000
+
+
+def importedModules(command):
+    # -X importtime lists every module the interpreter imported on stderr
+    result = run([command[0], "-X", "importtime", *command[1:]])
+    return {line.rsplit("|", 1)[-1].strip() for line in result.stderr.splitlines() if line.startswith("import time:")}
+
+
+def main(runs=10):
+    print(f"{'command':<14} {'median ms':>10} {'min ms':>8} {'modules':>8}  tk")
+    for name, command in COMMANDS:
+        # The first run fills the bytecode and OS file caches
+        timedRun(command)
+        samples = [timedRun(command) for _ in range(runs)]
+        modules = importedModules(command)
+        usesTk = any(module.split(".")[0] in TK_MODULES for module in modules)
+        print(f"{name:<14} {statistics.median(samples):10.1f} {min(samples):8.1f} {len(modules):8}  {'yes' if usesTk else 'no'}")
+        assert usesTk == (name == "gui imports") or name == "interpreter", f"unexpected tkinter import state for '{name}'"
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10)
@@ -0,0 +1,60 @@
+"""
+# Github Authors: https://github.com/JulianStiebler/
+# Github Contributors: https://github.com/JulianStiebler/
+
+# GitHub Repository: https://github.com/JulianStiebler/GameSaveVault
+# Github License: MIT // https://github.com/JulianStiebler/GameSaveVault/blob/main/LICENSE
+
+# Last Edited: 18.10.2026
+"""
+
+# Types a few search terms one keystroke at a time against every known game name and reports the
+# latency of each query, for the previous full scan and for GameSearchIndex. Results are compared.
+# Usage (from the repository root): python -m benchmarks.benchGameSearch [term ...]
+
+import sys
+import time
+
+from core.knownPathsIndex import loadKnownGamePaths
+from core.gameSearch import GameSearchIndex
+
+SOURCE = "data/knownGamePaths.json"
+INDEX = "data/knownGamePaths.idx"
+TERMS = ["dark souls", "the witcher", "stardew", "final fantasy", "xyz"]
+
+
+def linearSearch(names, query):
+    # What updateLIST_games did on every keystroke, minus the Treeview work
+    query = query.lower()
+    return [position for position, name in enumerate(names) if query in name.lower()]
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main(terms=TERMS):
+    names = sorted(name for name, _ in loadKnownGamePaths(SOURCE, INDEX).items())
+    index, buildTime = timed(GameSearchIndex, names)
+    grams, gramTime = timed(index.buildGrams)
+    print(f"{len(names)} names, index {buildTime:.1f} ms + {grams} trigrams in {gramTime:.1f} ms (background)")
+    print(f"{'query':<16} {'matches':>8} {'scan ms':>9} {'index ms':>9}")
+
+    scanTotal = indexTotal = 0.0
+    for term in terms:
+        for length in range(1, len(term) + 1):
+            query = term[:length]
+            expected, scanTime = timed(linearSearch, names, query)
+            result, indexTime = timed(index.search, query)
+            # casefold and lower only differ for a handful of characters, e.g. the German sharp s
+            assert result == expected or query.casefold() != query.lower(), f"results differ for '{query}'"
+            scanTotal += scanTime
+            indexTotal += indexTime
+            print(f"{query!r:<16} {len(result):>8} {scanTime:9.2f} {indexTime:9.2f}")
+    print(f"{'total':<16} {'':>8} {scanTotal:9.2f} {indexTotal:9.2f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:] or TERMS)
@@ -0,0 +1,75 @@
+"""
+# Github Authors: https://github.com/JulianStiebler/
+# Github Contributors: https://github.com/JulianStiebler/
+
+# GitHub Repository: https://github.com/JulianStiebler/GameSaveVault
+# Github License: MIT // https://github.com/JulianStiebler/GameSaveVault/blob/main/LICENSE
+
+# Last Edited: 18.10.2026
+"""
+
+# Compares loading knownGamePaths.json with json.load against the compiled index.
+# Every variant runs in a fresh interpreter so load time and peak RSS are not shared.
+# Usage (from the repository root): python -m benchmarks.benchKnownPathsIndex
+
+import os
+import sys
+import json
+import subprocess
+
+SOURCE = "data/knownGamePaths.json"
+INDEX = "data/knownGamePaths.idx"
+
+CHILD = r"""
+import sys, time, json
+try:
+    import resource
+except ImportError:
+    resource = None
+from core.knownPathsIndex import loadKnownGamePaths
+from core.savePathIndex import SavePathIndex
+
+def rss():
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform != "darwin" else peak // 1024
+
+before = rss()
+start = time.perf_counter()
+if sys.argv[1] == "json":
+    with open(sys.argv[2], "r") as f:
+        paths = json.load(f)["Savepaths"]
+else:
+    paths = loadKnownGamePaths(sys.argv[2], sys.argv[3])
+loaded = time.perf_counter() - start
+# The full scans of a launch: the template index for detection, the names for the matcher and the game list
+SavePathIndex.FromTemplates(paths)
+sorted(paths, key=str.lower)
+total = time.perf_counter() - start
+print(json.dumps({"load": loaded, "loadAndScan": total, "rssKB": rss(), "baseRssKB": before}))
+"""
+
+
+def runVariant(*args):
+    output = subprocess.run([sys.executable, "-c", CHILD, *args], capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main(rounds=5):
+    if os.path.exists(INDEX):
+        os.remove(INDEX)
+    cold = runVariant("index", SOURCE, INDEX)
+    print(f"index (compile)  load {cold['load'] * 1000:7.1f} ms")
+
+    for name, args in (("json", ("json", SOURCE)), ("index", ("index", SOURCE, INDEX))):
+        results = [runVariant(*args) for _ in range(rounds)]
+        best = min(results, key=lambda r: r["load"])
+        print(
+            f"{name:<16} load {best['load'] * 1000:7.1f} ms   load+scan {best['loadAndScan'] * 1000:7.1f} ms   "
+            f"peak RSS {best['rssKB'] / 1024:6.1f} MB (+{(best['rssKB'] - best['baseRssKB']) / 1024:.1f} MB)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+# Github Authors: https://github.com/JulianStiebler/
+# Github Contributors: https://github.com/JulianStiebler/
+
+# GitHub Repository: https://github.com/JulianStiebler/GameSaveVault
+# Github License: MIT // https://github.com/JulianStiebler/GameSaveVault/blob/main/LICENSE
+
+# Last Edited: 18.10.2026
+"""
+
+# Compresses a synthetic save tree (many small files, a few large ones) with the single-threaded
+# zipfile path and the parallel writer, checks the archive with zipfile and prints the throughput.
+# Usage (from the repository root): python -m benchmarks.benchParallelZip [smallFiles] [largeFiles] [largeMB] [workers]
+
+import os
+import sys
+import time
+import random
+import shutil
+import zipfile
+import tempfile
+
+import core.util as util
+from core.parallelZip import zipFilesParallel
+
+
+def writeFixtures(directory, smallFiles, largeFiles, largeMB):
+    # Semi-compressible content: random bytes mixed with a repeated record, like binary saves
+    rng = random.Random(42)
+    record = bytes(rng.getrandbits(8) for _ in range(256))
+    for i in range(smallFiles):
+        folder = os.path.join(directory, "profiles", f"slot{i % 20}")
+        os.makedirs(folder, exist_ok=True)
+        with open(os.path.join(folder, f"save{i}.sav"), 'wb') as f:
+            f.write(record * rng.randint(1, 16) + rng.randbytes(rng.randint(0, 2048)))
+    for i in range(largeFiles):
+        with open(os.path.join(directory, f"world{i}.dat"), 'wb') as f:
+            for _ in range(largeMB * 4):
+                f.write((rng.randbytes(64 * 1024) + record * 768))
+
+
+def collectFiles(directory):
+    files = []
+    for root, _, fileNames in os.walk(directory):
+        for file in fileNames:
+            filePath = os.path.join(root, file)
+            files.append((filePath, os.path.relpath(filePath, directory)))
+    return files
+
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main(smallFiles=2000, largeFiles=4, largeMB=64, workers=os.cpu_count() or 1):
+    directory = tempfile.mkdtemp(prefix="gsv-zip-")
+    try:
+        source = os.path.join(directory, "save")
+        writeFixtures(source, smallFiles, largeFiles, largeMB)
+        files = collectFiles(source)
+        totalBytes = sum(os.path.getsize(path) for path, _ in files)
+        serialPath = os.path.join(directory, "serial.zip")
+        parallelPath = os.path.join(directory, "parallel.zip")
+
+        serialTime = timed(lambda: util.zipFiles(files, serialPath))
+        parallelTime = timed(lambda: zipFilesParallel(files, parallelPath, workers=workers))
+
+        with zipfile.ZipFile(parallelPath) as zipf:
+            assert zipf.testzip() is None and len(zipf.namelist()) == len(files)
+
+        print(f"{len(files)} files, {totalBytes / 1024 ** 2:.1f} MB, {workers} workers")
+        for label, seconds, path in (("zipfile serial ", serialTime, serialPath), ("parallel writer", parallelTime, parallelPath)):
+            print(f"{label}  {seconds * 1000:8.1f} ms  {totalBytes / 1024 ** 2 / seconds:7.1f} MB/s  archive {os.path.getsize(path) / 1024 ** 2:.1f} MB")
+        print(f"speedup {serialTime / parallelTime:.2f}x")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:5]))
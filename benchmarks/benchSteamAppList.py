@@ -0,0 +1,92 @@
+"""
+# Github Authors: https://github.com/JulianStiebler/
+# Github Contributors: https://github.com/JulianStiebler/
+
+# GitHub Repository: https://github.com/JulianStiebler/GameSaveVault
+# Github License: MIT // https://github.com/JulianStiebler/GameSaveVault/blob/main/LICENSE
+
+# Last Edited: 18.10.2026
+"""
+
+# Serves a synthetic ISteamApps/GetAppList response from a local stand-in HTTP server (with ETag
+# support) and measures the first download, the TTL short-circuit, the conditional 304 refresh and lookups.
+# Usage (from the repository root): python -m benchmarks.benchSteamAppList [appCount]
+
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import tempfile
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+from modules.steamAppList import SteamAppList
+
+ETAG = '"synthetic-applist-1"'
+
+
+def startServer(body):
+    requests = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            requests.append(dict(self.headers))
+            if self.headers.get("If-None-Match") == ETAG:
+                self.send_response(304)
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("ETag", ETAG)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, requests
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main(count=200000):
+    apps = [{"appid": appid, "name": f"Synthetic App {appid} ™"} for appid in random.sample(range(1, count * 10), count)]
+    body = json.dumps({"applist": {"apps": apps}}).encode("utf-8")
+    server, requests = startServer(body)
+    url = f"http://127.0.0.1:{server.server_port}/ISteamApps/GetAppList/v2/"
+    directory = tempfile.mkdtemp(prefix="gsv-applist-")
+    try:
+        indexPath = os.path.join(directory, "appid.bin")
+        appList = SteamAppList(indexPath, ttl=3600)
+
+        first, firstTime = timed(lambda: appList.refresh(url))
+        fresh, freshTime = timed(lambda: appList.refresh(url))
+        notModified, notModifiedTime = timed(lambda: appList.refresh(url, force=True))
+        assert (first, fresh, notModified) == ("updated", "fresh", "notModified")
+        assert requests[-1].get("If-None-Match") == ETAG and len(requests) == 2
+
+        probes = [app["appid"] for app in random.sample(apps, 10000)]
+        names, lookupTime = timed(lambda: [SteamAppList(indexPath).lookup(probes[0])] + [appList.lookup(appid) for appid in probes])
+        assert names[1:] == [f"Synthetic App {appid} ™" for appid in probes]
+
+        print(f"{count} apps, response {len(body) / 1e6:.1f} MB, index {os.path.getsize(indexPath) / 1e6:.1f} MB")
+        print(f"first download      {firstTime * 1000:8.1f} ms")
+        print(f"within TTL          {freshTime * 1000:8.1f} ms   (no request)")
+        print(f"conditional 304     {notModifiedTime * 1000:8.1f} ms")
+        print(f"10k lookups         {lookupTime * 1000:8.1f} ms   (binary search on the mapped index)")
+    finally:
+        server.shutdown()
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,138 @@
+"""
+# Github Authors: https://github.com/JulianStiebler/
+# Github Contributors: https://github.com/JulianStiebler/
+
+# GitHub Repository: https://github.com/JulianStiebler/GameSaveVault
+# Github License: MIT // https://github.com/JulianStiebler/GameSaveVault/blob/main/LICENSE
+
+# Last Edited: 18.10.2026
+"""
+
+import os
+import bz2
+import lzma
+import tarfile
+from abc import ABC, abstractmethod
+
+import core.util as util
+from core.backupStream import ProgressMeter, ProgressReader
+
+
+class ArchiveCodec(ABC):
+    """
+    A backup archive format.
+
+    create() and extract() are abstract, a codec missing one of them fails when it is instantiated.
+
+    Args of create():
+        files (iterable): (filePath, arcname) tuples, a list or a stream from scanFolder.
+        archivePath (str): Archive to create.
+        progressCallback (callable or ProgressMeter): Receives the progress in percent, by bytes and throttled.
+        workers (int): Compression threads, if the codec can use them.
+        policy (CompressionPolicy): Per-file store/deflate decisions and the compression level, if the codec supports them.
+    """
+    NAME = ""
+    EXTENSION = ""
+    MAGIC = ()
+
+    @abstractmethod
+    def create(self, files, archivePath, progressCallback=None, workers=1, policy=None):
+        pass
+
+    @abstractmethod
+    def extract(self, archivePath, targetFolder):
+        pass
+
+    def matches(self, header):
+        """Check the leading bytes of a file against the codec's magic numbers."""
+        return any(header.startswith(magic) for magic in self.MAGIC)
+
+
+class ZipCodec(ArchiveCodec):
+    """Plain .zip, readable everywhere. Uses the parallel writer and the per-file compression policy."""
+    NAME = "zip"
+    EXTENSION = ".zip"
+    # Local file header, or the end record of an empty archive
+    MAGIC = (b"PK\x03\x04", b"PK\x05\x06")
+
+    def create(self, files, archivePath, progressCallback=None, workers=1, policy=None):
+        util.zipFiles(files, archivePath, progressCallback, workers, policy)
+
+    def extract(self, archivePath, targetFolder):
+        util.extractZIPContent(archivePath, targetFolder)
+
+
+class TarCodec(ArchiveCodec):
+    """
+    Streaming tar compressed as a whole, see TarXZCodec and TarBZ2Codec.
+
+    Compressing the whole stream finds redundancy across files, which pays off for large save sets
+    with many similar files, at the cost of random access. Written and read in one sequential pass.
+    Subclasses supply the compressed stream through openStream().
+    """
+
+    def create(self, files, archivePath, progressCallback=None, workers=1, policy=None):
+        level = max(1, min(policy.level if policy else 6, 9))
+        meter = ProgressMeter.For(progressCallback, files)
+        with self.openStream(archivePath, "wb", level) as stream, tarfile.open(fileobj=stream, mode="w|") as tar:
+            for filePath, arcname in files:
+                tarInfo = tar.gettarinfo(filePath, arcname.replace(os.sep, "/"))
+                with open(filePath, 'rb') as f:
+                    tar.addfile(tarInfo, ProgressReader(f, meter))
+        meter.finish()
+
+    def extract(self, archivePath, targetFolder):
+        with self.openStream(archivePath, "rb") as stream, tarfile.open(fileobj=stream, mode="r|") as tar:
+            # The data filter refuses absolute paths, links leaving the target and device files
+            if hasattr(tarfile, "data_filter"):
+                tar.extractall(targetFolder, filter="data")
+            else:
+                tar.extractall(targetFolder)
+
+    @abstractmethod
+    def openStream(self, path, mode, level=None):
+        pass
+
+
+class TarXZCodec(TarCodec):
+    NAME = "tar.xz"
+    EXTENSION = ".tar.xz"
+    MAGIC = (b"\xfd7zXZ\x00",)
+
+    def openStream(self, path, mode, level=None):
+        return lzma.open(path, mode, preset=level) if "w" in mode else lzma.open(path, mode)
+
+
+class TarBZ2Codec(TarCodec):
+    NAME = "tar.bz2"
+    EXTENSION = ".tar.bz2"
+    MAGIC = (b"BZh",)
+
+    def openStream(self, path, mode, level=None):
+        return bz2.open(path, mode, compresslevel=level) if "w" in mode else bz2.open(path, mode)
+
+
+CODECS = {codec.NAME: codec for codec in (ZipCodec(), TarXZCodec(), TarBZ2Codec())}
+
+
+def getCodec(name):
+    """Return the codec registered under name, ValueError if there is none."""
+    try:
+        return CODECS[name]
+    except KeyError:
+        raise ValueError(f"Unknown archive codec '{name}', expected one of {', '.join(CODECS)}.") from None
+
+
+def detectCodec(archivePath):
+    """Return the codec of an existing archive from its leading bytes, ValueError if it is not recognised."""
+    with open(archivePath, 'rb') as f:
+        header = f.read(8)
+    for codec in CODECS.values():
+        if codec.matches(header):
+            return codec
+    raise ValueError(f"'{os.path.basename(archivePath)}' is not a supported backup archive.")
+
+
+def isArchiveName(fileName):
+    """Check whether a file name carries the extension of one of the codecs."""
+    return fileName.lower().endswith(tuple(codec.EXTENSION for codec in CODECS.values()))
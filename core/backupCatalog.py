@@ -0,0 +1,177 @@
+"""
+# Github Authors: https://github.com/JulianStiebler/
+# Github Contributors: https://github.com/JulianStiebler/
+
+# GitHub Repository: https://github.com/JulianStiebler/GameSaveVault
+# Github License: MIT // https://github.com/JulianStiebler/GameSaveVault/blob/main/LICENSE
+
+# Last Edited: 18.10.2026
+"""
+
+import os
+import json
+import hashlib
+import tarfile
+import zipfile
+import threading
+
+import core.util as util
+from core import archiveCodecs
+from core.backupStream import CHUNK_SIZE
+from core.chunkStore import ChunkStore
+from core.incrementalBackup import ARCHIVE_MANIFEST
+
+CATALOG_VERSION = 1
+
+# One lock for all catalogs, the GUI and the backup jobs each create their own instances
+_LOCK = threading.Lock()
+
+
+class BackupCatalog:
+    """
+    Metadata of every backup of one game, kept in a JSON file outside the game's backup folder.
+
+    Entries are recorded when a backup is written, so listing the backups needs no archive I/O.
+    The catalog remembers the backup folder's mtime; as long as it matches, the folder is not even
+    listed. When it changed (a backup was added or deleted by hand), only the names are compared and
+    only archives the catalog does not know yet are opened.
+
+    Entry fields: name, created (epoch seconds), size (bytes on disk), rawSize (bytes of save data),
+    files, codec ("zip", "tar.xz", "tar.bz2", "incremental" or "snapshot") and hash (SHA-256 of the archive file).
+    """
+
+    def __init__(self, backupFolder, catalogPath):
+        self.backupFolder = backupFolder
+        self.catalogPath = catalogPath
+
+    @staticmethod
+    def FileHash(filePath):
+        digest = hashlib.sha256()
+        with open(filePath, 'rb') as f:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def IsBackupName(fileName):
+        return archiveCodecs.isArchiveName(fileName) or ChunkStore.IsSnapshot(fileName)
+
+    @staticmethod
+    def Describe(archivePath):
+        """Read the metadata of an existing backup from the archive itself, the slow path for backups the catalog missed."""
+        name = os.path.basename(archivePath)
+        if ChunkStore.IsSnapshot(name):
+            snapshot = ChunkStore.loadSnapshot(archivePath)
+            return BackupCatalog.Entry(archivePath, "snapshot", sum(entry["size"] for entry in snapshot["files"]),
+                                       len(snapshot["files"]), snapshot.get("created"))
+
+        codec = archiveCodecs.detectCodec(archivePath)
+        if codec.NAME == "zip":
+            with zipfile.ZipFile(archivePath, 'r') as zipf:
+                infos = [info for info in zipf.infolist() if not info.is_dir()]
+                if ARCHIVE_MANIFEST in zipf.NameToInfo:
+                    # An incremental archive holds only the changed files, the manifest knows the whole state
+                    manifest = json.loads(zipf.read(ARCHIVE_MANIFEST))
+                    files = manifest["files"].values()
+                    return BackupCatalog.Entry(archivePath, "incremental", sum(entry["size"] for entry in files),
+                                               len(files), manifest.get("created"))
+            return BackupCatalog.Entry(archivePath, "zip", sum(info.file_size for info in infos), len(infos))
+
+        rawSize = files = 0
+        with codec.openStream(archivePath, "rb") as stream, tarfile.open(fileobj=stream, mode="r|") as tar:
+            for member in tar:
+                if member.isfile():
+                    rawSize += member.size
+                    files += 1
+        return BackupCatalog.Entry(archivePath, codec.NAME, rawSize, files)
+
+    @staticmethod
+    def Entry(archivePath, codec, rawSize, files, created=None):
+        """Build the catalog entry of a finished backup."""
+        return {
+            "name": os.path.basename(archivePath),
+            "created": created or os.path.getmtime(archivePath),
+            "size": os.path.getsize(archivePath),
+            "rawSize": rawSize,
+            "files": files,
+            "codec": codec,
+            "hash": BackupCatalog.FileHash(archivePath),
+        }
+
+    def entries(self):
+        """
+        Return the catalog entries of all backups in the folder.
+
+        Returns:
+            list: Entry dicts, see the class docstring, in no particular order.
+        """
+        with _LOCK:
+            folderMtime = self.__folderMtime()
+            if folderMtime is None:
+                return []
+            catalog = self.__load()
+            if catalog["folderMtime"] != folderMtime:
+                self.__reconcile(catalog)
+            return list(catalog["entries"].values())
+
+    def record(self, archivePath, codec, rawSize, files, created=None):
+        """Add a backup that was just written. Call it last, after every other file of the backup folder was written."""
+        entry = self.Entry(archivePath, codec, rawSize, files, created)
+        with _LOCK:
+            catalog = self.__load()
+            stale = catalog["folderMtime"] is None
+            catalog["entries"][entry["name"]] = entry
+            # Only trust the folder listing if the catalog was up to date before this backup
+            if stale:
+                self.__reconcile(catalog)
+            else:
+                catalog["folderMtime"] = self.__folderMtime()
+                self.__save(catalog)
+        return entry
+
+    def remove(self, name):
+        with _LOCK:
+            catalog = self.__load()
+            catalog["entries"].pop(name, None)
+            catalog["folderMtime"] = self.__folderMtime() if catalog["folderMtime"] is not None else None
+            self.__save(catalog)
+
+    def __reconcile(self, catalog):
+        folderMtime = self.__folderMtime()
+        names = [name for name in os.listdir(self.backupFolder) if self.IsBackupName(name)]
+        # Placeholders of backups that could not be read have no hash, they are described again
+        entries = {name: catalog["entries"][name] for name in names if catalog["entries"].get(name, {}).get("hash") is not None}
+        complete = True
+        for name in names:
+            if name in entries:
+                continue
+            try:
+                entries[name] = self.Describe(os.path.join(self.backupFolder, name))
+            except Exception as e:
+                # Most likely a backup that is still being written, look at it again next time
+                print(f"Could not read backup '{name}': {e}")
+                entries[name] = {"name": name, "created": None, "size": None, "rawSize": None, "files": None, "codec": None, "hash": None}
+                complete = False
+
+        catalog["entries"] = entries
+        catalog["folderMtime"] = folderMtime if complete else None
+        self.__save(catalog)
+
+    def __load(self):
+        try:
+            with open(self.catalogPath, 'r', encoding='utf-8') as f:
+                catalog = json.load(f)
+            if catalog.get("version") == CATALOG_VERSION:
+                return catalog
+        except (OSError, ValueError):
+            pass
+        return {"version": CATALOG_VERSION, "folderMtime": None, "entries": {}}
+
+    def __save(self, catalog):
+        util.writeJSONAtomic(self.catalogPath, catalog, indent=None)
+
+    def __folderMtime(self):
+        try:
+            return os.stat(self.backupFolder).st_mtime_ns
+        except FileNotFoundError:
+            return None
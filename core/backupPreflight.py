@@ -0,0 +1,102 @@
+"""
+# Github Authors: https://github.com/JulianStiebler/
+# Github Contributors: https://github.com/JulianStiebler/
+
+# GitHub Repository: https://github.com/JulianStiebler/GameSaveVault
+# Github License: MIT // https://github.com/JulianStiebler/GameSaveVault/blob/main/LICENSE
+
+# Last Edited: 18.10.2026
+"""
+
+import os
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+# What a game install has and a save folder does not: executables, Unity "<Game>_Data" and Unreal "Paks" folders
+INSTALL_FILE_EXTENSIONS = (".exe", ".dll")
+INSTALL_FOLDER_SUFFIXES = ("_data",)
+INSTALL_FOLDER_NAMES = ("paks",)
+# Markers reported at most, one is enough to warn
+MAX_MARKERS = 5
+
+
+def isInstallMarker(name, isDir):
+    name = name.lower()
+    if isDir:
+        return name in INSTALL_FOLDER_NAMES or name.endswith(INSTALL_FOLDER_SUFFIXES)
+    return name.endswith(INSTALL_FILE_EXTENSIONS)
+
+
+def estimateFolder(folder, maxBytes=None, maxFiles=None, workers=8, checkCancelled=None):
+    """
+    Estimate the size of a folder before backing it up, stopping as soon as a budget is exceeded.
+
+    Folders are listed concurrently with os.scandir, each listing queues its subfolders. Once the byte or
+    file budget is exceeded no further folders are read, the totals are then a lower bound.
+
+    Args:
+        folder (str): Folder to estimate.
+        maxBytes (int): Byte budget, None for no limit.
+        maxFiles (int): File count budget, None for no limit.
+        workers (int): Folders listed at once.
+        checkCancelled (callable): Called between listings, raises to abort (e.g. Job.checkCancelled).
+
+    Returns:
+        dict: {"files", "bytes", "folders", "exceeded", "markers", "elapsed"}, markers lists paths relative to
+        folder that look like a game install rather than a save folder.
+    """
+    start = time.perf_counter()
+    stats = {"files": 0, "bytes": 0, "folders": 0, "exceeded": False, "markers": []}
+    lock = threading.Lock()
+    stop = threading.Event()
+
+    def __scan(path):
+        if stop.is_set():
+            return []
+        subfolders = []
+        files = size = 0
+        markers = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    isDir = entry.is_dir(follow_symlinks=False)
+                    if isDir:
+                        subfolders.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        files += 1
+                        size += entry.stat(follow_symlinks=False).st_size
+                    else:
+                        continue
+                    if isInstallMarker(entry.name, isDir):
+                        markers.append(os.path.relpath(entry.path, folder))
+        except OSError:
+            return []
+
+        with lock:
+            stats["files"] += files
+            stats["bytes"] += size
+            stats["folders"] += 1
+            stats["markers"].extend(markers[:MAX_MARKERS - len(stats["markers"])])
+            if (maxBytes is not None and stats["bytes"] > maxBytes) or (maxFiles is not None and stats["files"] > maxFiles):
+                stats["exceeded"] = True
+                stop.set()
+        return subfolders
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        pending = {pool.submit(__scan, folder)}
+        try:
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                if checkCancelled:
+                    checkCancelled()
+                for future in done:
+                    for subfolder in future.result():
+                        if not stop.is_set():
+                            pending.add(pool.submit(__scan, subfolder))
+        finally:
+            # Queued listings return at once, the pool shuts down without reading further
+            stop.set()
+
+    stats["elapsed"] = time.perf_counter() - start
+    return stats
@@ -0,0 +1,142 @@
+"""
+# Github Authors: https://github.com/JulianStiebler/
+# Github Contributors: https://github.com/JulianStiebler/
+
+# GitHub Repository: https://github.com/JulianStiebler/GameSaveVault
+# Github License: MIT // https://github.com/JulianStiebler/GameSaveVault/blob/main/LICENSE
+
+# Last Edited: 18.10.2026
+"""
+
+import os
+import time
+import queue
+import threading
+
+# Bytes read or written at once by the backup writers, memory stays flat regardless of file size
+CHUNK_SIZE = 1 << 20
+
+
+class ProgressMeter:
+    """
+    Byte based backup progress, reported to a callback at most once per interval.
+
+    The total grows while scanFolder is still walking the tree, so the reported percentage never
+    moves backwards: it is the maximum of done / total seen so far.
+    """
+
+    def __init__(self, callback=None, interval=0.1):
+        self.callback = callback
+        self.interval = interval
+        self.totalBytes = 0
+        self.totalFiles = 0
+        self.doneBytes = 0
+        self.__percent = 0.0
+        self.__lastReport = 0.0
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def For(progress, files=None):
+        """
+        Return progress as a meter: meters are passed through, plain callbacks are wrapped.
+
+        For a wrapped callback the total is taken from files if it is a list of (filePath, arcname) tuples,
+        a stream from scanFolder only reports its total to the meter it was given.
+        """
+        if isinstance(progress, ProgressMeter):
+            return progress
+        meter = ProgressMeter(progress)
+        if isinstance(files, (list, tuple)):
+            for filePath, _ in files:
+                meter.expect(os.path.getsize(filePath))
+        return meter
+
+    def expect(self, size):
+        """Announce one more file of the given size."""
+        with self.__lock:
+            self.totalBytes += size
+            self.totalFiles += 1
+
+    def advance(self, size):
+        with self.__lock:
+            self.doneBytes += size
+            if not self.callback or time.monotonic() - self.__lastReport < self.interval:
+                return
+            self.__lastReport = time.monotonic()
+            percent = self.percent()
+        self.callback(percent)
+
+    def percent(self):
+        if self.totalBytes:
+            self.__percent = max(self.__percent, min(self.doneBytes / self.totalBytes * 100, 100.0))
+        return self.__percent
+
+    def finish(self):
+        self.__percent = 100.0
+        if self.callback:
+            self.callback(100.0)
+
+
+class ProgressReader:
+    """File object wrapper that reports every read to a ProgressMeter."""
+
+    def __init__(self, fileObject, meter):
+        self.fileObject = fileObject
+        self.meter = meter
+
+    def read(self, size=-1):
+        data = self.fileObject.read(size)
+        self.meter.advance(len(data))
+        return data
+
+
+def scanFolder(sourceFolder, meter=None):
+    """
+    Walk a folder once with os.scandir on a background thread and stream the files as they are found.
+
+    The scanner runs ahead of the consumer, adding each file's size to the meter's total, so byte
+    progress is available long before the writer reaches the end of the tree. Subfolders and files
+    that cannot be read are logged and skipped, like os.walk does; only an unreadable sourceFolder raises.
+
+    Yields:
+        tuple: (filePath, arcname) with arcname relative to sourceFolder.
+
+    Raises:
+        OSError: If sourceFolder itself cannot be listed.
+    """
+    found = queue.Queue()
+    done = object()
+
+    def __scan():
+        try:
+            stack = [sourceFolder]
+            while stack:
+                folder = stack.pop()
+                try:
+                    with os.scandir(folder) as entries:
+                        for entry in entries:
+                            try:
+                                if entry.is_dir(follow_symlinks=False):
+                                    stack.append(entry.path)
+                                elif entry.is_file():
+                                    if meter:
+                                        meter.expect(entry.stat().st_size)
+                                    found.put((entry.path, os.path.relpath(entry.path, sourceFolder)))
+                            except OSError as e:
+                                print(f"Skipping unreadable file '{entry.path}': {e}")
+                except OSError as e:
+                    if folder == sourceFolder:
+                        found.put(e)
+                        return
+                    print(f"Skipping unreadable folder '{folder}': {e}")
+        finally:
+            found.put(done)
+
+    threading.Thread(target=__scan, name="BackupScan", daemon=True).start()
+    while True:
+        item = found.get()
+        if item is done:
+            return
+        if isinstance(item, OSError):
+            raise item
+        yield item
@@ -0,0 +1,270 @@
+"""
+# Github Authors: https://github.com/JulianStiebler/
+# Github Contributors: https://github.com/JulianStiebler/
+
+# GitHub Repository: https://github.com/JulianStiebler/GameSaveVault
+# Github License: MIT // https://github.com/JulianStiebler/GameSaveVault/blob/main/LICENSE
+
+# Last Edited: 18.10.2026
+"""
+
+import os
+import tarfile
+import zipfile
+
+import core.util as util
+from core import archiveCodecs
+from core.backupCatalog import BackupCatalog
+from core.backupStream import ProgressMeter, scanFolder
+from core.chunkStore import ChunkStore, SNAPSHOT_EXTENSION
+from core.compressionPolicy import CompressionPolicy, PRESETS
+from core.differentialRestore import DifferentialRestore
+from core.incrementalBackup import IncrementalBackup
+
+# Backup and restore of one game without any UI, shared by the GUI's jobs and the command line.
+# Nothing here touches Tk: progress goes to a callback and errors are raised to the caller.
+
+BACKUP_MODES = ["Full", "Incremental", "Deduplicated"]
+
+
+def backupFolder(data, gameName):
+    return os.path.join(data.FOLDER_SaveGames, util.sanitizeFolderName_fix(gameName))
+
+
+def loadSettings(data, gameName):
+    """The backup mode, codec and compression preset last used for a game, or the defaults."""
+    settingsPath = os.path.join(backupFolder(data, gameName), "backup.json")
+    settings = data.loadJSON(settingsPath) if os.path.exists(settingsPath) else {}
+    return {
+        "mode": settings.get("mode") if settings.get("mode") in BACKUP_MODES else "Full",
+        "codec": settings.get("codec") if settings.get("codec") in archiveCodecs.CODECS else data.BACKUP_CODEC,
+        "compression": settings.get("compression") if settings.get("compression") in PRESETS else data.BACKUP_COMPRESSION,
+    }
+
+
+def backupCodec(settings):
+    # Incremental chains need random access and appends, they are always zip
+    return archiveCodecs.getCodec("zip" if settings["mode"] == "Incremental" else settings["codec"])
+
+
+def backupExtension(settings):
+    return SNAPSHOT_EXTENSION if settings["mode"] == "Deduplicated" else backupCodec(settings).EXTENSION
+
+
+def uniqueBackupName(data, gameName, settings):
+    """A timestamped backup name that is not taken yet, backups within the same second get a counter."""
+    folder = backupFolder(data, gameName)
+    stem = f"{util.sanitizeFolderName_fix(gameName)}-{data.getTimestamp()}"
+    extension = backupExtension(settings)
+    zipName = f"{stem}{extension}"
+    counter = 2
+    while os.path.exists(os.path.join(folder, zipName)):
+        zipName = f"{stem}-{counter}{extension}"
+        counter += 1
+    return zipName
+
+
+def createBackup(data, gameName, settings, zipName=None, progressCallback=None):
+    """
+    Back up the save folder of one game and record it in the game's catalog.
+
+    Args:
+        data (DataManger): Application data, the game must have a save path.
+        gameName (str): Game to back up.
+        settings (dict): {"mode", "codec", "compression"}, see loadSettings().
+        zipName (str): File name of the backup, replaced if it exists (the user confirmed it), a new
+            timestamped name if None. Members of an incremental chain are never replaced.
+        progressCallback (callable): Receives the progress in percent, may raise to cancel (e.g. Job.progress).
+
+    Returns:
+        dict: {"name", "path", "mode", "codec", "rawSize", "files", "size", "details"}, details is a
+        human readable summary for the mode, empty for full backups.
+    """
+    savePath = data.DATA_JSONinstalledGames[gameName].get("save_path", "")
+    if not savePath:
+        raise ValueError(f"'{gameName}' has no save path.")
+    folder = backupFolder(data, gameName)
+    codec = backupCodec(settings)
+    zipName = zipName or uniqueBackupName(data, gameName, settings)
+    zipPath = os.path.join(folder, zipName)
+
+    os.makedirs(folder, exist_ok=True)
+    if ChunkStore.IsSnapshot(zipPath) and os.path.exists(zipPath):
+        # Writing over the manifest would keep the old snapshot's chunk references forever
+        data.chunkStore.deleteSnapshot(zipPath)
+    elif settings["mode"] != "Incremental" and os.path.exists(zipPath):
+        # Incremental backups refuse taken names themselves, any other backup may only replace an archive no chain needs
+        chain = IncrementalBackup(folder)
+        dependents = chain.dependents(zipName)
+        if dependents:
+            raise FileExistsError(f"Backup '{zipName}' holds files the incremental backups {', '.join(dependents)} need, it cannot be replaced.")
+        chain.detach(zipName)
+    # Progress in bytes, reported at most every BACKUP_PROGRESSINTERVAL seconds
+    meter = ProgressMeter(progressCallback, data.BACKUP_PROGRESSINTERVAL)
+    details = ""
+    # The profile remembers per game which kinds of files compress, see CompressionPolicy
+    policy = CompressionPolicy(settings["compression"], data.BACKUP_COMPRESSIONLEVEL, os.path.join(folder, "compression.json"))
+    try:
+        if settings["mode"] == "Incremental":
+            stats = IncrementalBackup(folder, workers=data.BACKUP_WORKERS, policy=policy).create(savePath, zipName, meter)
+            kind = "Full base" if stats["base"] else "Incremental"
+            details = f"\n{kind} backup, stored {stats['storedFiles']} of {stats['totalFiles']} files."
+            catalogEntry = ("incremental", stats["totalBytes"], stats["totalFiles"])
+        elif settings["mode"] == "Deduplicated":
+            stats = data.chunkStore.createSnapshot(savePath, zipPath, meter)
+            ratio = "all data already stored" if stats["dedupRatio"] is None else f"dedup ratio {stats['dedupRatio']:.1f}x"
+            details = (f"\n{stats['files']} files, {stats['logicalBytes'] / 1024 ** 2:.2f} MB of data, "
+                       f"{stats['bytesWritten'] / 1024 ** 2:.2f} MB written ({ratio}).")
+            catalogEntry = ("snapshot", stats["logicalBytes"], stats["files"])
+        else:
+            codec.create(scanFolder(savePath, meter), zipPath, meter, data.BACKUP_WORKERS, policy)
+            catalogEntry = (codec.NAME, meter.totalBytes, meter.totalFiles)
+    except FileExistsError:
+        # Refused before anything was written, e.g. a name in the incremental chain; the existing backup stays
+        raise
+    except BaseException:
+        # A cancelled or failed backup leaves no partial archive behind
+        if os.path.exists(zipPath):
+            os.remove(zipPath)
+        raise
+    policy.save()
+    data.saveJSON(os.path.join(folder, "backup.json"), settings)
+    # Last, so the catalog sees the backup folder's final mtime
+    entry = data.backupCatalog(gameName).record(zipPath, *catalogEntry)
+    if policy.stored:
+        details += f"\n{policy.stored} already compressed files were stored without compression."
+    return {"name": zipName, "path": zipPath, "mode": settings["mode"], "codec": entry["codec"],
+            "rawSize": entry["rawSize"], "files": entry["files"], "size": entry["size"], "details": details}
+
+
+def backupDependents(data, gameName, backupName):
+    """The backups that cannot be restored without backupName, oldest first; only incremental backups have any."""
+    if ChunkStore.IsSnapshot(backupName):
+        return []
+    return IncrementalBackup(backupFolder(data, gameName)).dependents(backupName)
+
+
+def deleteBackup(data, gameName, backupName):
+    """
+    Delete a backup together with the backups that depend on it, see backupDependents().
+
+    The dependents go first, newest first, so an interrupted delete never leaves a backup behind
+    that is missing an archive of its chain.
+
+    Returns:
+        list: The names of the deleted backups.
+    """
+    folder = backupFolder(data, gameName)
+    names = [backupName] + backupDependents(data, gameName, backupName)
+    catalog = data.backupCatalog(gameName)
+    for name in reversed(names):
+        path = os.path.join(folder, name)
+        if ChunkStore.IsSnapshot(path):
+            # Chunks shared with other snapshots stay, only unreferenced ones are removed
+            data.chunkStore.deleteSnapshot(path)
+        else:
+            IncrementalBackup(folder).detach(name)
+            os.remove(path)
+        catalog.remove(name)
+    return names
+
+
+def restoreBackup(data, gameName, backupName):
+    """
+    Apply a backup to the game's save folder, only files that differ are rewritten.
+
+    The replaced files are kept in an undo archive, see DifferentialRestore. A failed restore leaves
+    the save folder unchanged, unless it raises PartialRestoreError.
+
+    Returns:
+        dict: Restore statistics, {"changed", "unchanged", "removed", ...}.
+    """
+    savePath = data.DATA_JSONinstalledGames[gameName].get("save_path", "")
+    if not savePath:
+        raise ValueError(f"'{gameName}' has no save path.")
+    folder = backupFolder(data, gameName)
+    zipPath = os.path.join(folder, backupName)
+    restore = DifferentialRestore(savePath, os.path.join(folder, "undo"), data.RESTORE_UNDOLIMIT)
+
+    if ChunkStore.IsSnapshot(zipPath):
+        return restore.restoreWith(lambda target: data.chunkStore.restoreSnapshot(zipPath, target))
+    if IncrementalBackup.IsIncremental(zipPath):
+        return restore.restoreWith(lambda target: IncrementalBackup(folder).restore(zipPath, target))
+    codec = archiveCodecs.detectCodec(zipPath)
+    if codec.NAME == "zip":
+        return restore.restoreZip(zipPath)
+    return restore.restoreWith(lambda target: codec.extract(zipPath, target))
+
+
+def verifyChain(data, gameName, archivePath):
+    """
+    Check the other archives an incremental backup takes files from, see verifyBackup().
+
+    Returns:
+        str: None if every archive is intact and holds its files (or archivePath is no incremental backup), otherwise the reason.
+    """
+    manifest = IncrementalBackup.ReadManifest(archivePath)
+    if not manifest:
+        return None
+    byArchive = {}
+    for relPath, fileEntry in manifest["files"].items():
+        byArchive.setdefault(fileEntry["archive"], []).append(relPath)
+    byArchive.pop(os.path.basename(archivePath), None)
+
+    folder = os.path.dirname(archivePath)
+    hashes = {entry["name"]: entry.get("hash") for entry in data.backupCatalog(gameName).entries()} if byArchive else {}
+    for name, relPaths in sorted(byArchive.items()):
+        path = os.path.join(folder, name)
+        if not os.path.exists(path):
+            return f"Backup '{name}' of its incremental chain is missing."
+        if hashes.get(name) and BackupCatalog.FileHash(path) != hashes[name]:
+            return f"Backup '{name}' of its incremental chain changed since it was written."
+        with zipfile.ZipFile(path, 'r') as zipf:
+            missing = [relPath for relPath in relPaths if relPath not in zipf.NameToInfo]
+            broken = zipf.testzip()
+        if missing:
+            return f"'{missing[0]}' is missing from '{name}' of its incremental chain."
+        if broken:
+            return f"'{broken}' in '{name}' of its incremental chain is corrupted."
+    return None
+
+
+def verifyBackup(data, gameName, entry):
+    """
+    Check that a backup is still readable and unchanged since it was written.
+
+    The archive's hash is compared with its catalog entry, then every file is read back: zip CRCs are
+    tested, tar streams are decompressed to the end and snapshot chunks are checked against their hashes.
+    An incremental backup also checks every archive of its chain it takes files from.
+
+    Args:
+        entry (dict): The backup's catalog entry, see BackupCatalog.
+
+    Returns:
+        str: None if the backup is intact, otherwise the reason it is not.
+    """
+    archivePath = os.path.join(backupFolder(data, gameName), entry["name"])
+    try:
+        if entry.get("hash") and BackupCatalog.FileHash(archivePath) != entry["hash"]:
+            return "The archive changed since it was written."
+        if ChunkStore.IsSnapshot(archivePath):
+            for file in ChunkStore.loadSnapshot(archivePath)["files"]:
+                for chunkHash in file["chunks"]:
+                    data.chunkStore.readChunk(chunkHash)
+            return None
+        codec = archiveCodecs.detectCodec(archivePath)
+        if codec.NAME == "zip":
+            with zipfile.ZipFile(archivePath, 'r') as zipf:
+                broken = zipf.testzip()
+            if broken:
+                return f"'{broken}' is corrupted."
+            return verifyChain(data, gameName, archivePath)
+        with codec.openStream(archivePath, "rb") as stream, tarfile.open(fileobj=stream, mode="r|") as tar:
+            for member in tar:
+                if member.isfile():
+                    reader = tar.extractfile(member)
+                    while reader.read(1 << 20):
+                        pass
+        return None
+    except Exception as e:
+        return str(e)
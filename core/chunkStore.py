@@ -0,0 +1,246 @@
+"""
+# Github Authors: https://github.com/JulianStiebler/
+# Github Contributors: https://github.com/JulianStiebler/
+
+# GitHub Repository: https://github.com/JulianStiebler/GameSaveVault
+# Github License: MIT // https://github.com/JulianStiebler/GameSaveVault/blob/main/LICENSE
+
+# Last Edited: 18.10.2026
+"""
+
+import os
+import json
+import time
+import zlib
+import hashlib
+import zipfile
+import threading
+
+import core.util as util
+from core.backupStream import ProgressMeter, scanFolder
+
+SNAPSHOT_EXTENSION = ".snapshot"
+SNAPSHOT_VERSION = 1
+
+
+class ChunkStore:
+    """
+    Content-addressed, deduplicating backup store shared by all games.
+
+    Files are cut into fixed-size chunks named after their sha256 and stored zlib-compressed
+    under chunks/<first two hex digits>/. A snapshot is a small JSON manifest listing each file
+    with its chunk hashes, so identical data across snapshots and games is stored only once.
+    refs.json counts the references to every chunk; a chunk is deleted with its last snapshot.
+    """
+
+    def __init__(self, storeFolder, chunkSize=1 << 20, compressionLevel=6):
+        self.storeFolder = storeFolder
+        self.chunkSize = chunkSize
+        self.compressionLevel = compressionLevel
+        self.chunkFolder = os.path.join(storeFolder, "chunks")
+        self.refsPath = os.path.join(storeFolder, "refs.json")
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def IsSnapshot(path):
+        return path.endswith(SNAPSHOT_EXTENSION)
+
+    def createSnapshot(self, sourceFolder, snapshotPath, progressCallback=None):
+        """
+        Store a save folder as a new snapshot.
+
+        Args:
+            sourceFolder (str): Folder to back up.
+            snapshotPath (str): Path of the snapshot manifest to write.
+            progressCallback (callable or ProgressMeter): Receives the progress in percent, by bytes and throttled.
+
+        Returns:
+            dict: {"files", "logicalBytes", "newBytes", "bytesWritten", "dedupRatio"}, where newBytes is
+            the raw size of chunks that were not stored yet, bytesWritten what actually hit the disk and
+            dedupRatio logicalBytes / newBytes (None if no new chunk was needed).
+        """
+        meter = ProgressMeter.For(progressCallback)
+        stats = {"files": 0, "logicalBytes": 0, "newBytes": 0, "bytesWritten": 0}
+        entries = []
+        added = {}
+        created = []
+        with self.__lock:
+            try:
+                for filePath, relPath in scanFolder(sourceFolder, meter):
+                    relPath = relPath.replace(os.sep, "/")
+                    info = os.stat(filePath)
+                    chunks = []
+                    with open(filePath, 'rb') as f:
+                        for data in iter(lambda: f.read(self.chunkSize), b""):
+                            chunkHash = hashlib.sha256(data).hexdigest()
+                            written = self.__writeChunk(chunkHash, data)
+                            if written:
+                                created.append(chunkHash)
+                                stats["newBytes"] += len(data)
+                                stats["bytesWritten"] += written
+                            added[chunkHash] = added.get(chunkHash, 0) + 1
+                            chunks.append(chunkHash)
+                            stats["logicalBytes"] += len(data)
+                            meter.advance(len(data))
+
+                    entries.append({"path": relPath, "size": info.st_size, "mtime": info.st_mtime_ns, "chunks": chunks})
+                    stats["files"] += 1
+                # A cancel on the final report still comes before anything is committed
+                meter.finish()
+
+                snapshot = {"version": SNAPSHOT_VERSION, "created": time.time(), "chunkSize": self.chunkSize, "files": entries}
+                # Refs, then manifest: a crash in between leaves counted chunks no manifest uses, never a manifest with uncounted chunks
+                refs = self.__loadRefs()
+                self.__addRefs(refs, added, 1)
+                self.__saveRefs(refs)
+                try:
+                    util.writeJSONAtomic(snapshotPath, snapshot, indent=None)
+                except BaseException:
+                    self.__addRefs(refs, added, -1)
+                    self.__saveRefs(refs)
+                    raise
+            except BaseException:
+                # Cancelled or failed: the chunks this snapshot stored first are referenced by nothing
+                for chunkHash in created:
+                    try:
+                        os.remove(self.__chunkPath(chunkHash))
+                    except FileNotFoundError:
+                        pass
+                raise
+            stats["bytesWritten"] += os.path.getsize(snapshotPath)
+
+        # None: every chunk was stored already
+        stats["dedupRatio"] = stats["logicalBytes"] / stats["newBytes"] if stats["newBytes"] else None if stats["logicalBytes"] else 1.0
+        return stats
+
+    def deleteSnapshot(self, snapshotPath):
+        """
+        Delete a snapshot and every chunk no other snapshot references anymore.
+
+        Returns:
+            int: Number of chunks removed.
+        """
+        snapshot = self.loadSnapshot(snapshotPath)
+        removed = 0
+        with self.__lock:
+            refs = self.__loadRefs()
+            orphaned = set()
+            for entry in snapshot["files"]:
+                for chunkHash in entry["chunks"]:
+                    count = refs.get(chunkHash, 0) - 1
+                    if count > 0:
+                        refs[chunkHash] = count
+                    else:
+                        refs.pop(chunkHash, None)
+                        orphaned.add(chunkHash)
+            # Manifest, then refs, then chunks: a crash in between leaves unreferenced chunks behind, never dangling references
+            os.remove(snapshotPath)
+            self.__saveRefs(refs)
+            for chunkHash in orphaned:
+                try:
+                    os.remove(self.__chunkPath(chunkHash))
+                    removed += 1
+                except FileNotFoundError:
+                    pass
+        return removed
+
+    def restoreSnapshot(self, snapshotPath, targetFolder):
+        """Write the files of a snapshot into targetFolder."""
+        for _ in self.iterFiles(snapshotPath, targetFolder):
+            pass
+
+    def exportZip(self, snapshotPath, zipFilePath, progressCallback=None):
+        """
+        Export a snapshot as a plain .zip archive, readable without the store.
+
+        Args:
+            progressCallback (callable or ProgressMeter): Receives the progress in percent, may raise to cancel.
+                A cancelled or failed export removes the partial archive.
+        """
+        snapshot = self.loadSnapshot(snapshotPath)
+        meter = ProgressMeter.For(progressCallback)
+        for entry in snapshot["files"]:
+            meter.expect(entry["size"])
+        try:
+            with zipfile.ZipFile(zipFilePath, 'w', zipfile.ZIP_DEFLATED, strict_timestamps=False) as zipf:
+                for entry in snapshot["files"]:
+                    zinfo = zipfile.ZipInfo(entry["path"], time.localtime(max(entry["mtime"] / 1e9, 315532800))[:6])
+                    zinfo.compress_type = zipfile.ZIP_DEFLATED
+                    with zipf.open(zinfo, 'w', force_zip64=entry["size"] >= zipfile.ZIP64_LIMIT) as target:
+                        for chunkHash in entry["chunks"]:
+                            data = self.readChunk(chunkHash)
+                            target.write(data)
+                            meter.advance(len(data))
+        except BaseException:
+            if os.path.exists(zipFilePath):
+                os.remove(zipFilePath)
+            raise
+        meter.finish()
+
+    def iterFiles(self, snapshotPath, targetFolder):
+        """Restore a snapshot file by file, yielding (entry, targetPath) after each file."""
+        snapshot = self.loadSnapshot(snapshotPath)
+        for entry in snapshot["files"]:
+            targetPath = os.path.join(targetFolder, *entry["path"].split("/"))
+            os.makedirs(os.path.dirname(targetPath), exist_ok=True)
+            with open(targetPath, 'wb') as f:
+                for chunkHash in entry["chunks"]:
+                    f.write(self.readChunk(chunkHash))
+            os.utime(targetPath, ns=(entry["mtime"], entry["mtime"]))
+            yield entry, targetPath
+
+    def readChunk(self, chunkHash):
+        with open(self.__chunkPath(chunkHash), 'rb') as f:
+            data = zlib.decompress(f.read())
+        if hashlib.sha256(data).hexdigest() != chunkHash:
+            raise ValueError(f"Chunk {chunkHash} is corrupted.")
+        return data
+
+    @staticmethod
+    def loadSnapshot(snapshotPath):
+        with open(snapshotPath, 'r', encoding='utf-8') as f:
+            snapshot = json.load(f)
+        if snapshot.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported snapshot version in {snapshotPath}.")
+        return snapshot
+
+    def __writeChunk(self, chunkHash, data):
+        """Store a chunk unless it exists already. Returns the bytes written (0 if deduplicated)."""
+        chunkPath = self.__chunkPath(chunkHash)
+        if os.path.exists(chunkPath):
+            return 0
+        os.makedirs(os.path.dirname(chunkPath), exist_ok=True)
+        compressed = zlib.compress(data, self.compressionLevel)
+        tempPath = f"{chunkPath}.tmp"
+        try:
+            with open(tempPath, 'wb') as f:
+                f.write(compressed)
+            os.replace(tempPath, chunkPath)
+        except BaseException:
+            if os.path.exists(tempPath):
+                os.remove(tempPath)
+            raise
+        return len(compressed)
+
+    def __chunkPath(self, chunkHash):
+        return os.path.join(self.chunkFolder, chunkHash[:2], chunkHash)
+
+    def __loadRefs(self):
+        try:
+            with open(self.refsPath, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    @staticmethod
+    def __addRefs(refs, counts, sign):
+        """Add (sign 1) or take back (sign -1) a snapshot's reference counts, dropping counts that reach 0."""
+        for chunkHash, count in counts.items():
+            total = refs.get(chunkHash, 0) + sign * count
+            if total > 0:
+                refs[chunkHash] = total
+            else:
+                refs.pop(chunkHash, None)
+
+    def __saveRefs(self, refs):
+        util.writeJSONAtomic(self.refsPath, refs, indent=None)
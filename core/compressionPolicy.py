@@ -0,0 +1,134 @@
+"""
+# Github Authors: https://github.com/JulianStiebler/
+# Github Contributors: https://github.com/JulianStiebler/
+
+# GitHub Repository: https://github.com/JulianStiebler/GameSaveVault
+# Github License: MIT // https://github.com/JulianStiebler/GameSaveVault/blob/main/LICENSE
+
+# Last Edited: 18.10.2026
+"""
+
+import os
+import json
+import zlib
+import zipfile
+
+import core.util as util
+
+# level: deflate level, storeAbove: files whose estimated compressed/raw ratio is above this are stored
+PRESETS = {
+    "fastest": {"level": 1, "storeAbove": 0.90},
+    "balanced": {"level": 6, "storeAbove": 0.95},
+    "smallest": {"level": 9, "storeAbove": 0.99},
+}
+PROFILE_VERSION = 1
+SAMPLE_SIZE = 16 * 1024
+# Below this the local header dominates anyway, such files are deflated without sampling
+MIN_SAMPLE_FILE = 512
+# Extensions seen this often, always with the same outcome, are decided from the profile alone,
+# except for every PROFILE_RECHECK-th file which is sampled anyway so the profile can change its mind
+PROFILE_MIN_FILES = 4
+PROFILE_RECHECK = 16
+# Larger files are always sampled, the 48 KiB of samples cost little next to compressing them
+PROFILE_MAX_FILE = 1 << 20
+
+
+class CompressionPolicy:
+    """
+    Decides per file whether a backup deflates or stores it.
+
+    Already compressed or encrypted saves (Unity/Unreal blobs, .gz, .png, ...) do not shrink, so a fast
+    trial compression of three 16 KiB samples (start, middle, end) estimates the ratio first. The outcome
+    is remembered per file extension in a per-game profile; extensions that were always stored, or always
+    deflated, skip the samples. Extensions with mixed outcomes keep being sampled.
+    """
+
+    def __init__(self, preset="balanced", level=None, profilePath=None):
+        if preset not in PRESETS:
+            raise ValueError(f"Unknown compression preset '{preset}', expected one of {', '.join(PRESETS)}.")
+        self.preset = preset
+        self.level = PRESETS[preset]["level"] if level is None else level
+        self.storeAbove = PRESETS[preset]["storeAbove"]
+        self.profilePath = profilePath
+        self.sampled = 0
+        self.stored = 0
+        self.__profile = self.__load()
+
+    @staticmethod
+    def SampleRatio(filePath, size):
+        """Estimate the compressed/raw ratio of a file from a level 1 trial compression of up to three samples."""
+        with open(filePath, 'rb') as f:
+            if size <= 3 * SAMPLE_SIZE:
+                sample = f.read()
+            else:
+                sample = b""
+                for offset in (0, size // 2 - SAMPLE_SIZE // 2, size - SAMPLE_SIZE):
+                    f.seek(offset)
+                    sample += f.read(SAMPLE_SIZE)
+        if not sample:
+            return 1.0
+        return len(zlib.compress(sample, 1)) / len(sample)
+
+    def choose(self, filePath, arcname):
+        """
+        Pick the compression of one file.
+
+        Returns:
+            tuple: (compressType, level) with compressType zipfile.ZIP_DEFLATED or zipfile.ZIP_STORED.
+        """
+        size = os.path.getsize(filePath)
+        if size < MIN_SAMPLE_FILE:
+            return zipfile.ZIP_DEFLATED, self.level
+
+        known = self.__profile.get(self.ProfileKey(arcname))
+        if (known and size <= PROFILE_MAX_FILE and known["files"] >= PROFILE_MIN_FILES
+                and known["files"] % PROFILE_RECHECK and known["stored"] in (0, known["files"])):
+            store = known["stored"] > 0
+        else:
+            store = self.SampleRatio(filePath, size) > self.storeAbove
+            self.sampled += 1
+
+        if store:
+            self.stored += 1
+            self.record(arcname, size, size, stored=True)
+            return zipfile.ZIP_STORED, None
+        return zipfile.ZIP_DEFLATED, self.level
+
+    def record(self, arcname, rawBytes, packedBytes, stored=False):
+        """Remember how a file was written and how well it compressed."""
+        if rawBytes < MIN_SAMPLE_FILE:
+            return
+        entry = self.__profile.setdefault(self.ProfileKey(arcname), {"files": 0, "stored": 0, "rawBytes": 0, "packedBytes": 0})
+        entry["files"] += 1
+        entry["stored"] += stored
+        entry["rawBytes"] += rawBytes
+        entry["packedBytes"] += packedBytes
+
+    @staticmethod
+    def ProfileKey(arcname):
+        name = os.path.basename(arcname).lower()
+        extension = os.path.splitext(name)[1]
+        # Files without an extension (e.g. "save0", "slot_1") are grouped by their name without digits
+        return extension or "".join(char for char in name if not char.isdigit())
+
+    def save(self):
+        if not self.profilePath:
+            return
+        try:
+            util.writeJSONAtomic(self.profilePath, {"version": PROFILE_VERSION, "extensions": self.__profile})
+        except Exception as e:
+            print(f"Error writing compression profile '{self.profilePath}': {e}")
+
+    def __load(self):
+        if not self.profilePath:
+            return {}
+        try:
+            with open(self.profilePath, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") == PROFILE_VERSION:
+                return data.get("extensions", {})
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Ignoring unreadable compression profile '{self.profilePath}': {e}")
+        return {}
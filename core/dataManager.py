@@ -8,11 +8,21 @@
 # Last Edited: 11.01.2025
 """
 
+import os
 import json
 from datetime import datetime
-from modules.detectEpicGames import DetectGamesEpic
-from modules.detectSteamGames import DetectGamesSteam
 from modules.detectGeneralGames import DetectGamesGeneral
+from core.knownPathsIndex import loadKnownGamePaths
+from core.detectionPipeline import DetectionPipeline
+from core.detectionCache import DetectionCache
+from modules.pathResolver import PathResolver
+from modules.steamManifests import SteamManifestCache
+from modules.steamAppList import SteamAppList
+from core.chunkStore import ChunkStore
+from core.backupCatalog import BackupCatalog
+from core.gameMatcher import GameMatcher
+from core.savePathIndex import SavePathIndex
+import core.util as util
 
 class DataManger:
     def __init__(self):
@@ -22,6 +32,8 @@ class DataManger:
         
         self.FOLDER_Data = "data"
         self.FOLDER_SaveGames = f"{self.FOLDER_Data}/savegames"
+        self.FOLDER_BackupStore = f"{self.FOLDER_SaveGames}/.store"
+        self.FOLDER_BackupCatalog = f"{self.FOLDER_SaveGames}/.catalog"
         self.FOLDER_Paths = f"{self.FOLDER_Data}/paths"
         
         self.URL_SteamAppIDs = "https://api.steampowered.com/ISteamApps/GetAppList/v2/"
@@ -29,14 +41,39 @@ class DataManger:
         self.REGISTRY_EPIC = r"SOFTWARE\WOW6432Node\Epic Games\EpicGamesLauncher"
         
         self.PATH_KNOWNPATHS = f"{self.FOLDER_Data}/knownGamePaths.json"
-        self.PATH_APPID = f"{self.FOLDER_Data}/appid.json"
+        self.PATH_APPID = f"{self.FOLDER_Data}/appid.bin"
         self.PATH_installedGames = f"{self.FOLDER_Data}/installedGames.json"
         self.PATH_knownGamePaths = f"{self.FOLDER_Data}/knownGamePaths.json"
+        self.PATH_knownGamePathsIndex = f"{self.FOLDER_Data}/knownGamePaths.idx"
         self.PATH_customGames = f"{self.FOLDER_Data}/customGames.json"
+        self.PATH_detectionCache = f"{self.FOLDER_Data}/detectionCache.json"
+        self.PATH_acfCache = f"{self.FOLDER_Data}/acfCache.json"
         
         self.DATA_JSONinstalledGames = ""
         self.DATA_JSONknownGamePaths = ""
         self.DATA_JSONcustomGames = ""
+        self.DATA_gameMatches = {}
+        self.DATA_knownSavePathIndex = None
+        self.DATA_sharedSavePaths = SavePathIndex()
+        
+        self.DETECT_WORKERS = 3
+        self.DETECT_PROBEWORKERS = 16
+        self.DETECT_FORCERESCAN = False
+        self.STEAM_APPLIST_TTL = 7 * 24 * 3600
+        self.STEAM_APPLIST_TIMEOUT = (5, 60)
+        self.BACKUP_WORKERS = os.cpu_count() or 1
+        self.BACKUP_COMPRESSION = "balanced"
+        self.BACKUP_COMPRESSIONLEVEL = None
+        self.BACKUP_CODEC = "zip"
+        self.BACKUP_PROGRESSINTERVAL = 0.1
+        self.BACKUP_BUDGETBYTES = 1 << 30
+        self.BACKUP_BUDGETFILES = 20000
+        self.BACKUP_PREFLIGHTWORKERS = 8
+        self.RESTORE_UNDOLIMIT = 5
+        self.JOBS_WORKERS = 4
+        self.JOBS_MAXIO = 2
+        self.SEARCH_DEBOUNCE = 0.15
+        self.INSPECT_WORKERS = 2
         
         self.GITHUB_VERSION = "Version 0.9.9-alpha"
         self.GITHUB_DATE = datetime.now().strftime("%d-%m-%Y")
@@ -53,27 +90,123 @@ class DataManger:
         self.URL_GitHub_FeatureRequest = f"https://github.com/{self.GITHUB_ORIGIN}/{self.GITHUB_PROJECT}/issues/new?assignees={self.GITHUB_ASSIGNEES}&labels=feature&projects=&template=feature_request.md&title=Feature+request"
         self.URL_GitHub_BugReport = f"https://github.com/{self.GITHUB_ORIGIN}/{self.GITHUB_PROJECT}/issues/new?assignees={self.GITHUB_ASSIGNEES}&labels=bug&projects=&template=bug_report.md&title=Bug+report"
 
-        self.detectEpic = DetectGamesEpic()
-        self.detectSteam = DetectGamesSteam()
+        self.detectEpic = None
+        self.detectSteam = None
         self.detectGames = DetectGamesGeneral()
+        self.detection = DetectionPipeline(self.PATH_installedGames)
+        self.detectionCache = DetectionCache(self.PATH_detectionCache)
+        self.pathResolver = PathResolver(self.DETECT_PROBEWORKERS)
+        self.steamAppList = SteamAppList(self.PATH_APPID, self.STEAM_APPLIST_TTL, self.STEAM_APPLIST_TIMEOUT)
+        self.chunkStore = ChunkStore(self.FOLDER_BackupStore)
+        self.gameMatcher = None
         
-    def initSteamLibrary(self):
-        self.detectSteam.GetAppIDList(self.URL_SteamAppIDs, self.PATH_APPID)
+    def initLibraries(self):
+        """
+        Run all game detectors along their dependencies. Returns the number of records detected.
+
+        Detectors whose inputs did not change since the last launch are served from the detection cache,
+        unless DETECT_FORCERESCAN is set.
+        """
+        # Epic and Steam read the Windows registry through winreg, they are loaded for detection only
+        from modules.detectEpicGames import DetectGamesEpic
+        from modules.detectSteamGames import DetectGamesSteam
+
+        self.detectEpic = DetectGamesEpic()
+        self.detectSteam = DetectGamesSteam()
+        # The matcher needs the app list even when the Steam detector is served from the cache
+        self.detectSteam.GetAppIDList(self.URL_SteamAppIDs, self.steamAppList)
+        return self.detection.runDetectors([
+            (DetectGamesEpic, self.detectEpicGames, self.__epicInputs),
+            (DetectGamesSteam, self.detectSteamGames, self.__steamInputs),
+            (DetectGamesGeneral, self.detectSaveFolders, self.__generalInputs),
+        ], self.DETECT_WORKERS, self.detectionCache, self.DETECT_FORCERESCAN)
+
+    def detectSteamGames(self):
+        """Detect installed Steam games."""
         self.PATH_steamExe = self.detectSteam.GetInstallPath(self.REGISTRY_STEAM)
         self.PATH_steamLibrary = self.detectSteam.GetLibraryPath(self.PATH_steamExe)
-        self.detectSteam.GetInstalledGames(self.PATH_steamLibrary, self.PATH_installedGames)
+        return self.detectSteam.GetInstalledGames(self.PATH_steamLibrary, SteamManifestCache(self.PATH_acfCache))
 
-    def initEpicLibrary(self):
+    def detectEpicGames(self):
+        """Detect installed Epic games."""
         self.PATH_epicLibrary = self.detectEpic.GetInstallPath(self.REGISTRY_EPIC)
-        self.detectEpic.GetInstalledGames(self.PATH_epicLibrary, self.PATH_installedGames)
+        return self.detectEpic.GetInstalledGames(self.PATH_epicLibrary)
+
+    def detectSaveFolders(self):
+        """Detect save folders of all known games, runs once the install paths are merged."""
+        matches = self.matchKnownGames(self.detection.installedGames)
+        return self.detectGames.GetSaveFolders(self.loadKnownGamePaths()["Savepaths"], self.detection.installedGames, self.pathResolver,
+                                               matches, self.knownSavePathIndex())
 
-    def initGeneralLibrary(self):
-        self.detectGames.GetSaveFolders(self.PATH_knownGamePaths, self.PATH_installedGames)
+    def __steamInputs(self):
+        if not self.PATH_steamExe:
+            return []
+        return [self.detectSteam.GetLibraryFoldersPath(self.PATH_steamExe), *self.detectSteam.GetManifestPaths(self.PATH_steamLibrary)]
+
+    def __epicInputs(self):
+        if not self.PATH_epicLibrary:
+            return []
+        return [self.detectEpic.GetLauncherInstalledPath(self.PATH_epicLibrary)]
+
+    def __generalInputs(self):
+        # The folders whose listing decided a save path: one appearing or vanishing changes the mtime of its parent
+        return [self.PATH_knownGamePaths, *self.pathResolver.decidingDirectories]
 
     def initApplication(self):
-        self.DATA_JSONinstalledGames = self.loadJSON(self.PATH_installedGames)
-        self.DATA_JSONknownGamePaths = self.loadJSON(self.PATH_knownGamePaths)
+        """Persist the detection result and load the application data. Returns the number of games loaded."""
+        # The detection steps only touched the in-memory model, this is the one write per launch
+        self.detection.save()
+        self.DATA_JSONinstalledGames = self.detection.installedGames
+        self.DATA_JSONknownGamePaths = self.loadKnownGamePaths()
         self.DATA_JSONcustomGames = self.loadJSON(self.PATH_customGames)
+        self.DATA_gameMatches = self.matchKnownGames(self.DATA_JSONinstalledGames)
+        self.indexSavePaths()
+        return len(self.DATA_JSONinstalledGames)
+
+    def loadInstalledGames(self):
+        """Load the installed games of the last detection run without detecting again. Returns the number of games loaded."""
+        self.DATA_JSONinstalledGames = self.detection.installedGames
+        self.indexSavePaths()
+        return len(self.DATA_JSONinstalledGames)
+
+    def knownSavePathIndex(self):
+        """Get the known games grouped by save path template, built once per session with the known paths."""
+        if self.DATA_knownSavePathIndex is None:
+            self.DATA_knownSavePathIndex = SavePathIndex.FromTemplates(self.loadKnownGamePaths()["Savepaths"])
+            print(f"Indexed {len(self.DATA_knownSavePathIndex)} distinct save path templates.")
+        return self.DATA_knownSavePathIndex
+
+    def indexSavePaths(self):
+        """Group the installed games by save path again, call it after a save path changed."""
+        self.DATA_sharedSavePaths = SavePathIndex.FromInstalled(self.DATA_JSONinstalledGames)
+        return self.DATA_sharedSavePaths
+
+    def matchKnownGames(self, installedGames):
+        """
+        Match installed games to the names of the known game paths, see GameMatcher.
+
+        Returns:
+            dict: installed game name -> {"known", "how", "ambiguous"} for every game that matched.
+        """
+        # The known names are normalized and hashed once per session
+        if self.gameMatcher is None:
+            self.gameMatcher = GameMatcher(self.loadKnownGamePaths()["Savepaths"].keys())
+        return self.gameMatcher.match(installedGames, self.steamAppList.lookup)
+
+    def knownNameFor(self, gameName):
+        """Get the name a game has in the known game paths, the game name itself if it did not match."""
+        return self.DATA_gameMatches.get(gameName, {}).get("known", gameName)
+
+    def loadKnownGamePaths(self):
+        """
+        Load the known game paths once per session through the compiled, memory-mapped index.
+
+        Returns:
+            dict: {"Savepaths": Mapping of game name -> save path template}, shaped like knownGamePaths.json.
+        """
+        if not self.DATA_JSONknownGamePaths:
+            self.DATA_JSONknownGamePaths = {"Savepaths": loadKnownGamePaths(self.PATH_knownGamePaths, self.PATH_knownGamePathsIndex)}
+        return self.DATA_JSONknownGamePaths
 
     @staticmethod
     def loadJSON(filePath):
@@ -109,12 +242,16 @@ class DataManger:
             data (dict or list): Data to save to the JSON file.
         """
         try:
-            with open(filePath, 'w') as f:
-                json.dump(data, f, indent=4)
+            util.writeJSONAtomic(filePath, data)
             print(f"Successfully saved JSON data to {filePath}.")
         except Exception as e:
             print(f"Failed to save JSON data to {filePath}: {e}")
             
+    def backupCatalog(self, gameName):
+        """Get the BackupCatalog of a game's backup folder."""
+        folderName = util.sanitizeFolderName_fix(gameName)
+        return BackupCatalog(f"{self.FOLDER_SaveGames}/{folderName}", f"{self.FOLDER_BackupCatalog}/{folderName}.json")
+
     @staticmethod
     def getTimestamp():
         """Get the current date and time as a formatted string."""
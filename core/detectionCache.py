@@ -0,0 +1,96 @@
+"""
+# Github Authors: https://github.com/JulianStiebler/
+# Github Contributors: https://github.com/JulianStiebler/
+
+# GitHub Repository: https://github.com/JulianStiebler/GameSaveVault
+# Github License: MIT // https://github.com/JulianStiebler/GameSaveVault/blob/main/LICENSE
+
+# Last Edited: 18.10.2026
+"""
+
+import os
+import json
+
+import core.util as util
+
+CACHE_VERSION = 2
+
+class DetectionCache:
+    """
+    Remembers every detector's records together with a fingerprint of the files and folders it read.
+
+    A fingerprint is [mtime_ns, size] per input path, None for a missing path. Adding, removing or
+    renaming an entry changes a folder's mtime, so checking a folder costs one stat and no listing.
+    As long as all fingerprints of a detector still match, its previous records can be reused
+    instead of running the detector again.
+    """
+
+    def __init__(self, cachePath):
+        self.cachePath = cachePath
+        self.__entries = None
+        self.__dirty = False
+
+    @staticmethod
+    def Fingerprint(path):
+        """Return [mtime_ns, size] for a path, or None if it does not exist."""
+        try:
+            info = os.stat(path)
+        except OSError:
+            return None
+        return [info.st_mtime_ns, info.st_size]
+
+    def lookup(self, platform):
+        """
+        Return the cached records of a detector if none of its inputs changed, otherwise None.
+        """
+        entry = self.__load().get(platform)
+        if not entry or not entry.get("inputs"):
+            return None
+
+        for path, fingerprint in entry["inputs"].items():
+            if self.Fingerprint(path) != fingerprint:
+                print(f"Detection cache for {platform} invalidated by {path}.")
+                return None
+        return entry["records"]
+
+    def records(self, platform):
+        """Return the last stored records of a detector, valid or not."""
+        return self.__load().get(platform, {}).get("records")
+
+    def store(self, platform, records, inputs):
+        """
+        Store the records of a detector together with the current fingerprints of its inputs.
+
+        Args:
+            platform (str): Detector platform.
+            records (dict): The detector's records.
+            inputs (iterable): Paths the records were derived from.
+        """
+        self.__load()[platform] = {
+            "inputs": {path: self.Fingerprint(path) for path in dict.fromkeys(inputs)},
+            "records": records,
+        }
+        self.__dirty = True
+
+    def save(self):
+        if not self.__dirty:
+            return
+        try:
+            util.writeJSONAtomic(self.cachePath, {"version": CACHE_VERSION, "detectors": self.__entries}, indent=None)
+            self.__dirty = False
+        except Exception as e:
+            print(f"Error writing detection cache '{self.cachePath}': {e}")
+
+    def __load(self):
+        if self.__entries is None:
+            self.__entries = {}
+            try:
+                with open(self.cachePath, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get("version") == CACHE_VERSION:
+                    self.__entries = data.get("detectors", {})
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                print(f"Ignoring unreadable detection cache '{self.cachePath}': {e}")
+        return self.__entries
@@ -0,0 +1,210 @@
+"""
+# Github Authors: https://github.com/JulianStiebler/
+# Github Contributors: https://github.com/JulianStiebler/
+
+# GitHub Repository: https://github.com/JulianStiebler/GameSaveVault
+# Github License: MIT // https://github.com/JulianStiebler/GameSaveVault/blob/main/LICENSE
+
+# Last Edited: 18.10.2026
+"""
+
+import copy
+import json
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+import core.util as util
+
+class DetectionPipeline:
+    """
+    Shared in-memory model of installedGames.json.
+
+    Every detector contributes its records through merge(), the platform precedence is applied
+    there, and save() persists the result once at the end of the detection run.
+    runDetectors() schedules the detectors along their PLATFORM/DEPENDS declarations.
+    """
+
+    def __init__(self, outputFile):
+        self.outputFile = outputFile
+        self.timings = {}
+        self.failed = set()
+        self.__installedGames = None
+        self.__persisted = None
+        self.__lock = threading.Lock()
+
+    @property
+    def installedGames(self):
+        """The merged installed games, loaded from the previous run on first access."""
+        if self.__installedGames is None:
+            self.__installedGames = self.__load()
+            self.__persisted = copy.deepcopy(self.__installedGames)
+        return self.__installedGames
+
+    def merge(self, platform, records):
+        """
+        Merge the records of one detector into the model.
+
+        Steam and Epic records take over games that are only known as "General" (or have no platform yet),
+        "General" records only add the save path and never replace an existing platform.
+
+        Args:
+            platform (str): "Epic", "Steam" or "General".
+            records (dict): game name -> fields detected for that game.
+        """
+        with self.__lock:
+            self.__merge(platform, records)
+
+    def runDetectors(self, detectors, workers=4, cache=None, forceRescan=False):
+        """
+        Run detectors concurrently along their dependency graph and merge their records.
+
+        A detector starts as soon as every platform listed in its class DEPENDS has been merged.
+        Finished records are merged in declaration order, moved behind their dependencies where needed
+        (see MergeOrder), so the precedence between detectors does not depend on which one happens to finish first.
+        With a cache, a detector whose inputs and dependencies are unchanged is not run again,
+        its previous records are merged instead. Records of a detector that raised, or that ran after
+        a dependency raised, are merged but never cached, so the next launch runs it again.
+
+        Args:
+            detectors (list): (detectorClass, func, inputsFunc) tuples, func returns the detector's records,
+                inputsFunc the paths those records were read from (called after func).
+            workers (int): Maximum number of detectors running at once.
+            cache (DetectionCache): Optional warm-start cache.
+            forceRescan (bool): Run every detector, ignoring the cache.
+
+        Returns:
+            int: The number of records merged.
+        """
+        funcs = {detectorClass.PLATFORM: (func, inputsFunc) for detectorClass, func, inputsFunc in detectors}
+        depends = {detectorClass.PLATFORM: set(detectorClass.DEPENDS) for detectorClass, _, _ in detectors}
+        for platform, dependencies in depends.items():
+            if not dependencies <= funcs.keys():
+                raise ValueError(f"Detector '{platform}' depends on unknown detectors: {dependencies - funcs.keys()}")
+        order = self.MergeOrder([detectorClass.PLATFORM for detectorClass, _, _ in detectors], depends)
+
+        self.timings = {}
+        self.failed = set()
+        pending = list(order)
+        running = {}
+        finished = {}
+        merged = set()
+        changed = set()
+        mergedRecords = 0
+        self.installedGames  # Load the previous run before any detector reads the model
+
+        with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="detector") as executor:
+            while pending or running:
+                for platform in [platform for platform in pending if depends[platform] <= merged]:
+                    pending.remove(platform)
+                    cached = None
+                    if cache is not None and not forceRescan and not depends[platform] & changed:
+                        cached = cache.lookup(platform)
+
+                    if cached is not None:
+                        print(f"Reusing cached {platform} detection.")
+                        self.timings[platform] = 0.0
+                        finished[platform] = cached
+                    else:
+                        running[executor.submit(self.__runTimed, platform, funcs[platform][0])] = platform
+
+                if running:
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        platform = running.pop(future)
+                        records = finished[platform] = future.result()
+                        if platform in self.failed or depends[platform] & self.failed:
+                            # Incomplete records, the cache keeps the last complete run for the next launch
+                            self.failed.add(platform)
+                            changed.add(platform)
+                        elif cache is not None:
+                            if records != cache.records(platform):
+                                changed.add(platform)
+                            cache.store(platform, records, funcs[platform][1]())
+                        else:
+                            changed.add(platform)
+
+                while len(merged) < len(order) and order[len(merged)] in finished:
+                    platform = order[len(merged)]
+                    records = finished.pop(platform)
+                    self.merge(platform, records)
+                    mergedRecords += len(records)
+                    merged.add(platform)
+
+        if cache is not None:
+            cache.save()
+        print("Detector timings: " + ", ".join(f"{platform} {elapsed:.2f}s" for platform, elapsed in self.timings.items()))
+        return mergedRecords
+
+    @staticmethod
+    def MergeOrder(platforms, depends):
+        """
+        Order the platforms so every detector comes after the ones it DEPENDS on, otherwise keeping the declaration order.
+
+        Raises:
+            ValueError: If the dependencies form a cycle.
+        """
+        order = []
+        remaining = list(platforms)
+        while remaining:
+            ready = next((platform for platform in remaining if depends[platform] <= set(order)), None)
+            if ready is None:
+                raise ValueError(f"Cyclic detector dependencies between: {', '.join(remaining)}")
+            order.append(ready)
+            remaining.remove(ready)
+        return order
+
+    def __runTimed(self, platform, func):
+        start = time.perf_counter()
+        try:
+            records = func() or {}
+        except Exception as e:
+            print(f"Error in {platform} detector: {e}")
+            self.failed.add(platform)
+            records = {}
+        self.timings[platform] = time.perf_counter() - start
+        return records
+
+    def __merge(self, platform, records):
+        installedGames = self.installedGames
+        for gameName, record in records.items():
+            entry = installedGames.setdefault(gameName, {})
+            if platform == "General":
+                entry.update(record)
+                if not entry.get('platform'):
+                    entry['platform'] = "General"
+            else:
+                if entry.get('platform', "") in ["General", ""]:
+                    entry['platform'] = platform
+                entry.update(record)
+
+    def save(self):
+        """
+        Persist the model with a single atomic write, but only if it differs from what is on disk.
+
+        Returns:
+            bool: True if the file was written.
+        """
+        if self.__installedGames is None or self.__installedGames == self.__persisted:
+            print(f"Installed games unchanged, {self.outputFile} not rewritten.")
+            return False
+
+        try:
+            util.writeJSONAtomic(self.outputFile, self.__installedGames)
+        except Exception as e:
+            print(f"Error writing to '{self.outputFile}': {e}")
+            return False
+
+        self.__persisted = copy.deepcopy(self.__installedGames)
+        print(f"Installed games saved to {self.outputFile}.")
+        return True
+
+    def __load(self):
+        try:
+            with open(self.outputFile, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(f"Error reading '{self.outputFile}': {e}")
+            return {}
@@ -0,0 +1,258 @@
+"""
+# Github Authors: https://github.com/JulianStiebler/
+# Github Contributors: https://github.com/JulianStiebler/
+
+# GitHub Repository: https://github.com/JulianStiebler/GameSaveVault
+# Github License: MIT // https://github.com/JulianStiebler/GameSaveVault/blob/main/LICENSE
+
+# Last Edited: 18.10.2026
+"""
+
+import os
+import json
+import time
+import zlib
+import shutil
+import zipfile
+import tempfile
+
+from core.backupStream import scanFolder, CHUNK_SIZE
+
+# Stored inside every undo archive: the files the restore added, which undoing it removes again
+UNDO_MANIFEST = ".gsv-undo.json"
+
+
+class PartialRestoreError(Exception):
+    """A restore failed while changing the save folder and could not put the replaced files back."""
+
+
+class DifferentialRestore:
+    """
+    Restores a backup into a save folder by rewriting only the files that differ.
+
+    The backup is compared with the live folder by size and CRC-32 (read from the zip central directory,
+    other formats are unpacked first). Changed files are extracted into a sibling staging folder, the
+    replaced and removed live files are saved to an undo archive, and only then are the staged files
+    moved into place one os.replace() at a time. Until that last step the save folder is untouched;
+    if it fails, the files it touched are put back from the undo archive.
+    """
+
+    def __init__(self, savePath, undoFolder, undoLimit=5):
+        self.savePath = savePath
+        self.undoFolder = undoFolder
+        self.undoLimit = undoLimit
+
+    @staticmethod
+    def FileCRC(filePath):
+        crc = 0
+        with open(filePath, 'rb') as f:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                crc = zlib.crc32(chunk, crc)
+        return crc
+
+    @staticmethod
+    def SafeRelPath(name):
+        """Normalise an archive member name, None if it would leave the target folder."""
+        relPath = os.path.normpath(name.replace("\\", "/"))
+        if os.path.isabs(relPath) or os.path.splitdrive(relPath)[0] or relPath.split(os.sep)[0] in ("..", "."):
+            return None
+        return relPath
+
+    def restoreZip(self, zipPath):
+        """
+        Restore a plain zip backup, comparing against its central directory without unpacking it.
+
+        Returns:
+            dict: {"changed", "unchanged", "removed", "undo"}, see restoreWith().
+        """
+        with zipfile.ZipFile(zipPath, 'r') as zipf:
+            wanted = {}
+            for info in zipf.infolist():
+                relPath = self.SafeRelPath(info.filename)
+                if relPath and not info.is_dir():
+                    wanted[relPath] = (info.file_size, info.CRC, info)
+
+            def __extract(relPath, targetPath):
+                with zipf.open(wanted[relPath][2]) as source, open(targetPath, 'wb') as target:
+                    shutil.copyfileobj(source, target, CHUNK_SIZE)
+
+            return self.__apply({relPath: entry[:2] for relPath, entry in wanted.items()}, __extract)
+
+    def restoreWith(self, extractAll):
+        """
+        Restore any backup format by unpacking it in full into the staging area first.
+
+        Args:
+            extractAll (callable): Writes the complete backup into the folder it is given.
+
+        Returns:
+            dict: {"changed": files rewritten, "unchanged": files left alone, "removed": files deleted,
+            "undo": path of the undo archive or None if nothing was replaced}.
+        """
+        unpacked = tempfile.mkdtemp(prefix=".gsv-unpack-", dir=self.__parentFolder())
+        try:
+            extractAll(unpacked)
+            wanted = {}
+            for filePath, relPath in scanFolder(unpacked):
+                wanted[relPath] = (os.path.getsize(filePath), self.FileCRC(filePath))
+
+            def __extract(relPath, targetPath):
+                os.replace(os.path.join(unpacked, relPath), targetPath)
+
+            return self.__apply(wanted, __extract)
+        finally:
+            shutil.rmtree(unpacked, ignore_errors=True)
+
+    def undo(self, undoPath):
+        """Revert a restore from its undo archive, then delete the archive."""
+        with zipfile.ZipFile(undoPath, 'r') as zipf:
+            added = json.loads(zipf.read(UNDO_MANIFEST)).get("added", [])
+            replaced = {}
+            for info in zipf.infolist():
+                relPath = self.SafeRelPath(info.filename)
+                if relPath and info.filename != UNDO_MANIFEST and not info.is_dir():
+                    replaced[relPath] = info
+
+            def __extract(relPath, targetPath):
+                with zipf.open(replaced[relPath]) as source, open(targetPath, 'wb') as target:
+                    shutil.copyfileobj(source, target, CHUNK_SIZE)
+
+            # Undoing keeps no undo archive of its own, the one it writes is only there to roll back from
+            self.__swap(list(replaced), [relPath for relPath in added if relPath not in replaced], __extract, keepUndo=False)
+        os.remove(undoPath)
+
+    def latestUndo(self):
+        """Return the newest undo archive, or None."""
+        undoFiles = self.__undoFiles()
+        return undoFiles[-1] if undoFiles else None
+
+    def __apply(self, wanted, extract):
+        live = {relPath: filePath for filePath, relPath in scanFolder(self.savePath)} if os.path.isdir(self.savePath) else {}
+
+        changed = []
+        for relPath, (size, crc) in wanted.items():
+            livePath = live.get(relPath)
+            # Size first, the CRC is only computed for files that could be identical
+            if livePath is None or os.path.getsize(livePath) != size or self.FileCRC(livePath) != crc:
+                changed.append(relPath)
+        removed = [relPath for relPath in live if relPath not in wanted]
+
+        undoPath = None
+        if changed or removed:
+            undoPath = self.__swap(changed, removed, extract)
+        return {"changed": len(changed), "unchanged": len(wanted) - len(changed), "removed": len(removed), "undo": undoPath}
+
+    def __swap(self, changed, removed, extract, keepUndo=True):
+        """
+        Stage the changed files, save what they replace, then commit them to the save folder.
+
+        The undo archive holds every live file that is replaced or removed, a failed commit is rolled
+        back from it. With keepUndo False it is deleted once the commit went through.
+
+        Returns:
+            str: The undo archive, None if keepUndo is False.
+
+        Raises:
+            PartialRestoreError: If the commit failed and the touched files could not all be put back.
+        """
+        os.makedirs(self.savePath, exist_ok=True)
+        staging = tempfile.mkdtemp(prefix=".gsv-restore-", dir=self.__parentFolder())
+        try:
+            # Stage everything first, a failing extraction leaves the save folder as it was
+            for index, relPath in enumerate(changed):
+                extract(relPath, os.path.join(staging, str(index)))
+
+            # A live file where the backup has a folder, or the files of a live folder where it has a file, have to go too
+            removed = list(removed)
+            known = set(removed)
+            for relPath in changed:
+                parts = relPath.split(os.sep)
+                blocking = [os.path.join(*parts[:depth]) for depth in range(1, len(parts))
+                            if os.path.isfile(os.path.join(self.savePath, *parts[:depth]))]
+                folder = os.path.join(self.savePath, relPath)
+                if os.path.isdir(folder):
+                    blocking += [os.path.join(relPath, subPath) for _, subPath in scanFolder(folder)]
+                removed += [path for path in blocking if path not in known]
+                known.update(blocking)
+
+            replaced = [relPath for relPath in changed + removed if os.path.isfile(os.path.join(self.savePath, relPath))]
+            replacedSet = set(replaced)
+            added = [relPath for relPath in changed if relPath not in replacedSet]
+            undoPath = self.__newUndoPath()
+            self.__writeArchive(undoPath, replaced, added)
+
+            touched = []
+            try:
+                # Removals first, they clear the way for files that take the place of a folder or the other way round
+                for relPath in removed:
+                    touched.append(relPath)
+                    try:
+                        os.remove(os.path.join(self.savePath, relPath))
+                    except FileNotFoundError:
+                        pass
+                for index, relPath in enumerate(changed):
+                    touched.append(relPath)
+                    targetPath = os.path.join(self.savePath, relPath)
+                    self.__removeEmptyFolders(targetPath)
+                    os.makedirs(os.path.dirname(targetPath), exist_ok=True)
+                    os.replace(os.path.join(staging, str(index)), targetPath)
+            except BaseException as error:
+                try:
+                    self.__rollback(undoPath, touched, set(added))
+                except Exception as rollbackError:
+                    raise PartialRestoreError(f"{error} Putting the replaced files back failed too ({rollbackError}), "
+                                              f"they are kept in '{undoPath}'.") from error
+                # Rolled back, the archive describes a restore that never happened
+                os.remove(undoPath)
+                raise
+
+            if not keepUndo:
+                os.remove(undoPath)
+                return None
+            for oldUndo in self.__undoFiles()[:-self.undoLimit]:
+                os.remove(oldUndo)
+            return undoPath
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+    def __rollback(self, undoPath, touched, added):
+        """Put the touched files back as the undo archive recorded them, newest change first."""
+        with zipfile.ZipFile(undoPath, 'r') as zipf:
+            for relPath in reversed(touched):
+                targetPath = os.path.join(self.savePath, relPath)
+                if relPath in added:
+                    if os.path.isfile(targetPath):
+                        os.remove(targetPath)
+                    continue
+                self.__removeEmptyFolders(targetPath)
+                os.makedirs(os.path.dirname(targetPath), exist_ok=True)
+                with zipf.open(relPath.replace(os.sep, "/")) as source, open(targetPath, 'wb') as target:
+                    shutil.copyfileobj(source, target, CHUNK_SIZE)
+
+    @staticmethod
+    def __removeEmptyFolders(path):
+        """Remove a folder tree that holds no files anymore; a folder with a file left in it raises OSError."""
+        if os.path.isdir(path) and not os.path.islink(path):
+            for folder, _, _ in os.walk(path, topdown=False):
+                os.rmdir(folder)
+
+    def __newUndoPath(self):
+        os.makedirs(self.undoFolder, exist_ok=True)
+        now = time.time()
+        return os.path.join(self.undoFolder, f"undo-{time.strftime('%Y%m%d-%H%M%S', time.localtime(now))}-{int(now * 1e6) % 1000000:06d}.zip")
+
+    def __writeArchive(self, archivePath, replaced, added):
+        with zipfile.ZipFile(archivePath, 'w', zipfile.ZIP_DEFLATED, strict_timestamps=False) as zipf:
+            for relPath in replaced:
+                zipf.write(os.path.join(self.savePath, relPath), relPath)
+            zipf.writestr(UNDO_MANIFEST, json.dumps({"added": added}))
+
+    def __undoFiles(self):
+        if not os.path.isdir(self.undoFolder):
+            return []
+        return sorted(os.path.join(self.undoFolder, name) for name in os.listdir(self.undoFolder)
+                      if name.startswith("undo-") and name.endswith(".zip"))
+
+    def __parentFolder(self):
+        # Staging next to the save folder keeps os.replace() on the same volume, where it is atomic
+        return os.path.dirname(os.path.abspath(self.savePath))
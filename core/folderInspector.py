@@ -0,0 +1,101 @@
+"""
+# Github Authors: https://github.com/JulianStiebler/
+# Github Contributors: https://github.com/JulianStiebler/
+
+# GitHub Repository: https://github.com/JulianStiebler/GameSaveVault
+# Github License: MIT // https://github.com/JulianStiebler/GameSaveVault/blob/main/LICENSE
+
+# Last Edited: 18.10.2026
+"""
+
+import os
+import threading
+
+
+class FolderInspector:
+    """
+    Lists save folders with recursive file counts and sizes, meant to run on a worker thread.
+
+    Every folder is read with one os.scandir pass, whose entries carry the stat results, and the listing
+    is cached per folder together with the folder's mtime. A folder's mtime changes when entries are
+    added, removed or renamed, so totals are revalidated with one stat per folder and only changed folders
+    are read again. A file rewritten in place keeps its folder's mtime; its new size shows once the
+    folder changes otherwise.
+    """
+
+    def __init__(self):
+        self.__folders = {}
+        self.__lock = threading.Lock()
+
+    def scan(self, folder):
+        """
+        Return the direct entries of a folder, from the cache while its mtime is unchanged.
+
+        Returns:
+            list: (name, isDir, size, mtime) tuples, size is 0 for folders.
+        """
+        mtime = os.stat(folder).st_mtime_ns
+        with self.__lock:
+            cached = self.__folders.get(folder)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        entries = []
+        with os.scandir(folder) as scanned:
+            for entry in scanned:
+                try:
+                    isDir = entry.is_dir(follow_symlinks=False)
+                    info = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                entries.append((entry.name, isDir, 0 if isDir else info.st_size, info.st_mtime))
+        with self.__lock:
+            self.__folders[folder] = (mtime, entries)
+        return entries
+
+    def totals(self, folder, checkCancelled=None):
+        """
+        Count the files and bytes below a folder.
+
+        Args:
+            folder (str): Folder to total.
+            checkCancelled (callable): Called once per folder, raises to stop early (e.g. Job.checkCancelled).
+
+        Returns:
+            tuple: (files, bytes)
+        """
+        files = size = 0
+        stack = [folder]
+        while stack:
+            current = stack.pop()
+            if checkCancelled:
+                checkCancelled()
+            try:
+                entries = self.scan(current)
+            except OSError:
+                continue
+            for name, isDir, entrySize, _ in entries:
+                if isDir:
+                    stack.append(os.path.join(current, name))
+                else:
+                    files += 1
+                    size += entrySize
+        return files, size
+
+    def inspect(self, folder, checkCancelled=None):
+        """
+        List a folder for display, subfolders with their recursive totals.
+
+        Returns:
+            list: {"name", "path", "isDir", "size", "files", "mtime"} dicts, folders first, then by name.
+            files is None for plain files.
+        """
+        rows = []
+        for name, isDir, size, mtime in self.scan(folder):
+            path = os.path.join(folder, name)
+            files = None
+            if isDir:
+                files, size = self.totals(path, checkCancelled)
+            rows.append({"name": name, "path": path, "isDir": isDir, "size": size, "files": files, "mtime": mtime})
+        rows.sort(key=lambda row: (not row["isDir"], row["name"].lower()))
+        return rows
@@ -0,0 +1,120 @@
+"""
+# Github Authors: https://github.com/JulianStiebler/
+# Github Contributors: https://github.com/JulianStiebler/
+
+# GitHub Repository: https://github.com/JulianStiebler/GameSaveVault
+# Github License: MIT // https://github.com/JulianStiebler/GameSaveVault/blob/main/LICENSE
+
+# Last Edited: 18.10.2026
+"""
+
+import os
+import unicodedata
+from collections import Counter
+
+# Dropped before normalizing, NFKC would otherwise turn them into letters ("TM")
+_TRADEMARKS = dict.fromkeys(map(ord, "™®©"), None)
+
+
+def normalizeName(name):
+    """
+    Join key of a game name: NFKC normalized, casefolded, only letters and digits.
+
+    ' Castle of Full Moon 月圆之堡' and 'Castle of Full Moon 月圆之堡' share a key,
+    as do 'Alpha Kimori™ Episode One ' and 'AlphaKimoriEpisodeOne'.
+    """
+    name = unicodedata.normalize("NFKC", name.translate(_TRADEMARKS)).casefold()
+    return "".join(char for char in name if char.isalnum())
+
+
+class GameMatcher:
+    """
+    Matches installed games to the names used by knownGamePaths.json.
+
+    Detectors name games differently (Epic by install folder, Steam by the ACF name) and the known
+    paths use display titles. The known names are hashed once by normalizeName; every installed game
+    then tries its aliases in order with one dictionary lookup each, which makes the join O(n + m):
+
+        exact       the detected name is a known name
+        normalized  the detected name matches after normalizeName
+        appid       the Steam app list name of the game's appid matches
+        installdir  the install folder name (or the ACF installdir) matches
+
+    When several known names share a key, the one equal to the alias after trimming wins, otherwise
+    the first in sort order; such matches are counted as ambiguous.
+    """
+
+    def __init__(self, knownNames):
+        """
+        Args:
+            knownNames (iterable): Game names of the known paths.
+        """
+        self.names = set(knownNames)
+        self.byKey = {}
+        for name in self.names:
+            self.byKey.setdefault(normalizeName(name), []).append(name)
+        for candidates in self.byKey.values():
+            candidates.sort()
+
+    @staticmethod
+    def Aliases(gameName, record, appNameFor=None):
+        """Yield (how, name) for every name a detected game may be known under, most reliable first."""
+        yield "exact", gameName
+        if appNameFor and record.get("appid"):
+            appName = appNameFor(record["appid"])
+            if appName:
+                yield "appid", appName
+        if record.get("installdir"):
+            yield "installdir", os.path.basename(os.path.normpath(record["installdir"]))
+        if record.get("install_path"):
+            yield "installdir", os.path.basename(os.path.normpath(record["install_path"]))
+
+    def resolve(self, gameName, record, appNameFor=None):
+        """
+        Find the known name of one detected game.
+
+        Returns:
+            tuple: (knownName, how, ambiguous), or (None, None, False) if no alias matched.
+        """
+        for how, alias in self.Aliases(gameName, record, appNameFor):
+            if alias in self.names:
+                return alias, how, False
+            candidates = self.byKey.get(normalizeName(alias))
+            if not candidates:
+                continue
+            how = "normalized" if how == "exact" else how
+            if len(candidates) == 1:
+                return candidates[0], how, False
+            trimmed = [name for name in candidates if name.strip() == alias.strip()]
+            return (trimmed or candidates)[0], how, True
+        return None, None, False
+
+    def match(self, installedGames, appNameFor=None):
+        """
+        Match every installed game and print how each match was found.
+
+        Args:
+            installedGames (dict): game name -> record, as detected.
+            appNameFor (callable): Returns the Steam app list name of an appid, e.g. SteamAppList.lookup.
+
+        Returns:
+            dict: installed game name -> {"known": known name, "how": resolution, "ambiguous": bool},
+            only for the games that matched.
+        """
+        matches = {}
+        counts = Counter()
+        for gameName, record in installedGames.items():
+            knownName, how, ambiguous = self.resolve(gameName, record, appNameFor)
+            if knownName is None:
+                counts["unmatched"] += 1
+                continue
+            matches[gameName] = {"known": knownName, "how": how, "ambiguous": ambiguous}
+            counts[how] += 1
+            counts["ambiguous"] += ambiguous
+            if how != "exact":
+                print(f"Matched '{gameName}' to known game '{knownName}' by {how}{' (ambiguous)' if ambiguous else ''}.")
+
+        resolved = ", ".join(f"{counts[how]} {how}" for how in ("exact", "normalized", "appid", "installdir") if counts[how])
+        print(f"Matched {len(matches)} of {len(installedGames)} installed games to known paths ({resolved or 'none'}), "
+              f"{counts['unmatched']} unmatched, {counts['ambiguous']} ambiguous.")
+        return matches
@@ -0,0 +1,78 @@
+"""
+# Github Authors: https://github.com/JulianStiebler/
+# Github Contributors: https://github.com/JulianStiebler/
+
+# GitHub Repository: https://github.com/JulianStiebler/GameSaveVault
+# Github License: MIT // https://github.com/JulianStiebler/GameSaveVault/blob/main/LICENSE
+
+# Last Edited: 18.10.2026
+"""
+
+from array import array
+
+GRAM_SIZE = 3
+
+
+class GameSearchIndex:
+    """
+    Case-insensitive substring search over the game list through a trigram index.
+
+    Every casefolded name is split into its overlapping trigrams, each trigram maps to the ascending
+    positions of the names containing it. A query of three or more characters only checks the names
+    listed under its rarest trigram instead of all of them. Shorter queries, which match most of the
+    list anyway, scan it; a query that extends the previous one only re-checks the previous matches.
+    Results keep the order of the names given to the index.
+
+    Building the trigrams takes a few hundred milliseconds for the full list, so it is a separate step
+    meant for a background thread; until it finished, search() scans.
+    """
+
+    def __init__(self, names):
+        """
+        Args:
+            names (list): Game names in display order.
+        """
+        self.names = list(names)
+        self.keys = [name.casefold() for name in self.names]
+        self.grams = None
+        self.__lastQuery = None
+        self.__lastResult = None
+
+    def buildGrams(self):
+        """Build the trigram postings, safe to run on another thread while search() is used."""
+        grams = {}
+        for position, key in enumerate(self.keys):
+            for gram in {key[index:index + GRAM_SIZE] for index in range(len(key) - GRAM_SIZE + 1)}:
+                postings = grams.get(gram)
+                if postings is None:
+                    postings = grams[gram] = array('i')
+                postings.append(position)
+        self.grams = grams
+        return len(grams)
+
+    def search(self, query):
+        """
+        Return the positions of all names containing query, ignoring case.
+
+        Returns:
+            list: Ascending positions into names, all of them for an empty query.
+        """
+        query = query.casefold()
+        if not query:
+            result = list(range(len(self.keys)))
+        else:
+            candidates = None
+            if self.__lastQuery and query.startswith(self.__lastQuery):
+                # Typing narrows the search: every match of the longer query matched the shorter one
+                candidates = self.__lastResult
+            grams = self.grams
+            if grams is not None and len(query) >= GRAM_SIZE:
+                rarest = min((grams.get(query[index:index + GRAM_SIZE], ()) for index in range(len(query) - GRAM_SIZE + 1)), key=len)
+                if candidates is None or len(rarest) < len(candidates):
+                    candidates = rarest
+            if candidates is None:
+                candidates = range(len(self.keys))
+            result = [position for position in candidates if query in self.keys[position]]
+
+        self.__lastQuery, self.__lastResult = query, result
+        return result
@@ -12,14 +12,26 @@ import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
 import os
 import shutil
+import threading
 from datetime import datetime
 from tkinter import filedialog, simpledialog, messagebox
 from tkinter.messagebox import showinfo
 
 from core.dataManager import DataManger
 import core.util as util
+from core.chunkStore import ChunkStore
+from core.compressionPolicy import PRESETS
+from core import archiveCodecs, backupTasks
+from core.backupTasks import BACKUP_MODES
+from core.differentialRestore import DifferentialRestore, PartialRestoreError
+from core.gameSearch import GameSearchIndex
+from core.folderInspector import FolderInspector
+from core.backupPreflight import estimateFolder
+from core.savePathIndex import pathKey
+from core.jobs import Job, JobScheduler, PRIORITY_BACKUP, PRIORITY_RESTORE
 from screen.dialog.namedBackup import NamedBackupDialog
 from screen.dialog.addMissingGame import AddMissingGameDialog
+from screen.widget.virtualList import VirtualList
 
 data = DataManger()
 
@@ -32,6 +44,10 @@ class SaveFileManager:
         self.root.minsize(self.data.WINDOW_SIZE_X, self.data.WINDOW_SIZE_Y)
         self.style = ttk.Style(self.data.WINDOW_STYLE)
         self.selectedGameToDisplayDetails = None
+        self.saveFolderNodes = {}
+        # Save folders are listed off the Tk thread, cached per folder and revalidated by mtime
+        self.folderInspector = FolderInspector()
+        self.inspectScheduler = JobScheduler(self.root, self.data.INSPECT_WORKERS, self.data.INSPECT_WORKERS)
         
         self.__setupGUI_searchBar()
         self.FRAME_main = ttk.Panedwindow(self.root, orient=HORIZONTAL)
@@ -44,6 +60,10 @@ class SaveFileManager:
         self.populateLIST_games()
         
         self.__setupGUI_footer()
+
+        # Backups and restores run on worker threads, at most JOBS_MAXIO of them touching the disk at once
+        self.scheduler = JobScheduler(self.root, self.data.JOBS_WORKERS, self.data.JOBS_MAXIO, onProgress=self.__onJobProgress)
+        self.root.protocol("WM_DELETE_WINDOW", self.__onClose)
         
         util.adjustTreeviewHeight(self.LIST_savePathContent)
         util.adjustTreeviewHeight(self.LIST_backupContents)
@@ -53,13 +73,16 @@ class SaveFileManager:
         if not selected:
             return
 
-        gameName = self.LIST_games.item(selected[0], "text")[2:].strip()
+        # With several games selected the details follow the one clicked last
+        focused = self.LIST_games.focus()
+        gameName = self.__gameName(focused if focused in selected else selected[0])
         self.LBL_gameTitle.config(text=gameName)
         self.selectedGameToDisplayDetails = gameName
 
         self.updatePaths()
         self.updateSaveFolderContents()
         self.updateLIST_backupContents()
+        self.loadBackupSettings()
         
     def populateLIST_games(self):
         self.gameList = []
@@ -72,107 +95,210 @@ class SaveFileManager:
         )
         self.gameList.extend(installedGames)
 
-        # Add known games only if not already in installed games, sorted alphabetically
+        # Add known games only if not already in installed games, also under a differently spelled name, sorted alphabetically
+        matchedKnownNames = {match["known"] for match in self.data.DATA_gameMatches.values()}
         knownGames = sorted(
-            [(game, False) for game, path in self.data.DATA_JSONknownGamePaths["Savepaths"].items() if game.lower() not in installedGameNames],
+            [(game, False) for game in self.data.DATA_JSONknownGamePaths["Savepaths"] if game.lower() not in installedGameNames and game not in matchedKnownNames],
             key=lambda x: x[0].lower()  # Sorting by the game name (case-insensitive)
         )
         self.gameList.extend(knownGames)
-        self.updateLIST_games()
+
+        # Positions change when the list is rebuilt, a stale selection would point at other games
+        self.LIST_games.selection_set()
+        self.gameSearch = GameSearchIndex([game for game, _ in self.gameList])
+        threading.Thread(target=self.gameSearch.buildGrams, name="GameSearchIndex", daemon=True).start()
+        self.filterLIST_games()
 
     def updateLIST_games(self, *args):
-        searchTerm = self.searchVar.get().lower()
-        for item in self.LIST_games.get_children():
-            self.LIST_games.delete(item)
+        # Debounced: a burst of keystrokes runs one search once typing pauses
+        if self.searchJob:
+            self.root.after_cancel(self.searchJob)
+        self.searchJob = self.root.after(int(self.data.SEARCH_DEBOUNCE * 1000), self.filterLIST_games)
 
-        sortedGames = sorted(self.gameList, key=lambda x: not x[1])
-        for game, is_installed in sortedGames:
-            if searchTerm in game.lower():
-                status = "\u2713" if is_installed else "\u2717"
-                self.LIST_games.insert("", "end", text=f"{status} {game}")
+    def filterLIST_games(self):
+        """Show the games matching the search bar, the list only redraws its visible rows."""
+        self.searchJob = None
+        self.LIST_games.setItems(self.gameSearch.search(self.searchVar.get()))
 
     def updatePaths(self):
         installPath = self.data.DATA_JSONinstalledGames.get(self.selectedGameToDisplayDetails, {}).get("install_path", None)
         savePath = self.data.DATA_JSONinstalledGames.get(self.selectedGameToDisplayDetails, {}).get("save_path", None)
-        knownSavePath = self.data.DATA_JSONknownGamePaths["Savepaths"].get(self.selectedGameToDisplayDetails, "Unknown Path")
+        knownSavePath = self.data.DATA_JSONknownGamePaths["Savepaths"].get(self.data.knownNameFor(self.selectedGameToDisplayDetails), "Unknown Path")
 
         self.LBL_installPath.config(text=f"Installation Folder: {installPath}" if installPath else "Installation folder not found.")
         self.LBL_savePath.config(text=f"Save Path: {savePath}" if savePath else f"Default Save Path: {knownSavePath}")
 
+        # Backups and restores of a shared folder affect every game using it
+        shared = self.data.DATA_sharedSavePaths.sharedWith(self.selectedGameToDisplayDetails, savePath) if savePath else []
+        self.LBL_sharedSavePath.config(text=f"This save folder is also used by: {', '.join(shared)}" if shared else "")
+
         self.BTN_openInstallPath.config(state=NORMAL if installPath else DISABLED)
         self.BTN_openSavePath.config(state=NORMAL if savePath else DISABLED)
 
     def updateSaveFolderContents(self):
         for item in self.LIST_savePathContent.get_children():
             self.LIST_savePathContent.delete(item)
+        self.saveFolderNodes = {}
+        # A listing still running for the previously selected game is no longer needed
+        for job in self.inspectScheduler.active():
+            self.inspectScheduler.cancel(job)
 
         savePath = self.data.DATA_JSONinstalledGames.get(self.selectedGameToDisplayDetails, {}).get("save_path", None)
-        if savePath and os.path.exists(savePath):
-            for file in os.listdir(savePath):
-                filePath = os.path.join(savePath, file)
-                modifiedTime = datetime.fromtimestamp(os.path.getmtime(filePath)).strftime("%d-%m-%Y %H:%M:%S")
-                self.LIST_savePathContent.insert("", "end", values=(file, modifiedTime))
+        if savePath:
+            self.__inspectFolder("", savePath)
 
         # Adjust the height of the Treeview
         util.adjustTreeviewHeight(self.LIST_savePathContent)
 
+    def __inspectFolder(self, parent, folder):
+        """List a folder on the inspector's worker threads and insert it below parent once read."""
+        placeholder = self.LIST_savePathContent.insert(parent, "end", text="Loading...")
+
+        def __done(job):
+            if not self.LIST_savePathContent.exists(placeholder):
+                return  # The list was cleared for another game meanwhile
+            self.LIST_savePathContent.delete(placeholder)
+            if job.state != "done":
+                return
+            for row in job.result:
+                modifiedTime = datetime.fromtimestamp(row["mtime"]).strftime("%d-%m-%Y %H:%M:%S")
+                item = self.LIST_savePathContent.insert(parent, "end", text=row["name"], values=(
+                    modifiedTime, util.formatSize(row["size"]), "" if row["files"] is None else row["files"]))
+                if row["isDir"]:
+                    # An empty child makes the folder expandable, its contents are read when it is opened
+                    self.LIST_savePathContent.insert(item, "end")
+                    self.saveFolderNodes[item] = row["path"]
+            util.adjustTreeviewHeight(self.LIST_savePathContent)
+
+        self.inspectScheduler.submit(Job(f"Inspect {folder}", lambda job: self.folderInspector.inspect(folder, job.checkCancelled), key=folder, onDone=__done))
+
+    def __openSaveFolderNode(self, event):
+        item = self.LIST_savePathContent.focus()
+        folder = self.saveFolderNodes.pop(item, None)
+        if folder is None:
+            return  # Not a folder, or already loaded
+        self.LIST_savePathContent.delete(*self.LIST_savePathContent.get_children(item))
+        self.__inspectFolder(item, folder)
 
     def updateLIST_backupContents(self):
+        # Metadata comes from the game's catalog, the folder is only listed when its mtime changed
+        self.backupEntries = self.data.backupCatalog(self.selectedGameToDisplayDetails).entries()
+        self.showLIST_backupContents()
+
+        backupFolder = os.path.join(data.FOLDER_SaveGames, util.sanitizeFolderName_fix(self.selectedGameToDisplayDetails))
+        undoFolder = os.path.join(backupFolder, "undo")
+        hasUndo = os.path.isdir(undoFolder) and any(name.startswith("undo-") for name in os.listdir(undoFolder))
+        self.BTN_undoRestore.config(state=NORMAL if hasUndo else DISABLED)
+
+    def showLIST_backupContents(self, *args):
+        """Redraw the backup list from the loaded catalog entries, filtered and sorted, without touching the disk."""
         for item in self.LIST_backupContents.get_children():
             self.LIST_backupContents.delete(item)
 
-        # Sanitize the selected game's name to ensure the folder name is valid
-        sanitizedGameName = util.sanitizeFolderName_fix(self.selectedGameToDisplayDetails)
-        backupFolder = os.path.join(data.FOLDER_SaveGames, sanitizedGameName)
-        
-        if os.path.exists(backupFolder):
-            for file in os.listdir(backupFolder):
-                if file.endswith(".zip"):
-                    self.LIST_backupContents.insert("", "end", text=file)
+        column, descending = self.backupSort
+        filterTerm = self.backupFilterVar.get().lower()
+        entries = [entry for entry in self.backupEntries if filterTerm in entry["name"].lower()]
+        # Entries without metadata (a backup still being written) go last
+        known = sorted((entry for entry in entries if entry[column] is not None), key=lambda entry: entry[column], reverse=descending)
+        entries = known + [entry for entry in entries if entry[column] is None]
+
+        for entry in entries:
+            created = datetime.fromtimestamp(entry["created"]).strftime("%d-%m-%Y %H:%M:%S") if entry["created"] else ""
+            self.LIST_backupContents.insert("", "end", text=entry["name"], values=(
+                created, util.formatSize(entry["size"]), util.formatSize(entry["rawSize"]),
+                "" if entry["files"] is None else entry["files"], entry["codec"] or ""))
 
         # Adjust the height of the Treeview
         util.adjustTreeviewHeight(self.LIST_backupContents)
 
+    def __sortLIST_backupContents(self, column):
+        # Clicking the sorted column again flips the order
+        column = "name" if column == "#0" else column
+        self.backupSort = (column, not self.backupSort[1] if self.backupSort[0] == column else column != "name")
+        self.showLIST_backupContents()
+
+    def loadBackupSettings(self):
+        """Restore the backup mode, codec and compression preset last used for the selected game."""
+        settings = backupTasks.loadSettings(self.data, self.selectedGameToDisplayDetails)
+        self.backupMode.set(settings["mode"])
+        self.backupCodec.set(settings["codec"])
+        self.compressionPreset.set(settings["compression"])
 
     def BackupCreate(self, isNamed=False):
-        sanitizedGameName = util.sanitizeFolderName_fix(self.selectedGameToDisplayDetails)
-        
-        savePath = self.data.DATA_JSONinstalledGames[self.selectedGameToDisplayDetails].get("save_path", "")
-        backupFolder = os.path.join(data.FOLDER_SaveGames, sanitizedGameName)
-        os.makedirs(backupFolder, exist_ok=True)
-        
+        gameName = self.selectedGameToDisplayDetails
+        savePath = self.data.DATA_JSONinstalledGames[gameName].get("save_path", "")
         if not savePath:
             return
-        
+
+        # Tk variables and dialogs are only touched here, the job itself runs on a worker thread
+        settings = {"mode": self.backupMode.get(), "codec": self.backupCodec.get(), "compression": self.compressionPreset.get()}
+        zipName = None
         if isNamed:
             # Prompt the user for a custom name
-            zipName = NamedBackupDialog(self.root, self.data, targetPath=backupFolder).result
+            backupFolder = os.path.join(data.FOLDER_SaveGames, util.sanitizeFolderName_fix(gameName))
+            os.makedirs(backupFolder, exist_ok=True)
+            zipName = NamedBackupDialog(self.root, self.data, targetPath=backupFolder, extension=backupTasks.backupExtension(settings)).result
             if not zipName:  # If the user cancels or leaves it empty, return
                 return
-        else:
-            timestamp = self.data.getTimestamp()
-            zipName = f"{sanitizedGameName}-{timestamp}.zip"
-            
-        zipPath = os.path.join(backupFolder, zipName)
-        
-        # Show and reset progress bar
-        self.PROG_backupProgress.pack(fill=X, padx=5, pady=5)
-        self.PROG_backupProgress['value'] = 0
-        
-        def __updateProgress(value):
-            self.PROG_backupProgress['value'] = value
-            self.root.update_idletasks()
-        
-        try:
-            util.zipFolder(savePath, zipPath, __updateProgress)
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to create backup: {str(e)}")
-        finally:
-            # Hide progress bar
-            self.PROG_backupProgress.pack_forget()
-        
-        self.updateLIST_backupContents()
-        messagebox.showinfo("Success", f"Backup '{zipName}' created successfully!")
+
+        def __done(job):
+            if job.state == "done":
+                messagebox.showinfo("Success", f"Backup '{job.result[0]}' created successfully!{job.result[1]}")
+            elif job.state == "failed":
+                messagebox.showerror("Error", f"Failed to create backup: {str(job.error)}")
+
+        # Nothing is compressed before the size check passed or its warning was confirmed
+        self.__preflightBackup(gameName, lambda: self.__submitBackup(gameName, settings, zipName, __done))
+
+    def BackupCreateSelected(self):
+        """Queue a timestamped backup of every game selected in the game list, each with its own last used settings."""
+        self.__backupGames([self.__gameName(item) for item in self.LIST_games.selection()], "Backup Selected Games")
+
+    def BackupCreateAll(self):
+        """Queue a timestamped backup of every installed game with a save path, the whole vault in one run."""
+        self.__backupGames(sorted(self.data.DATA_JSONinstalledGames, key=str.lower), "Backup All Games")
+
+    def __backupGames(self, games, title):
+        games = [game for game in games if self.data.DATA_JSONinstalledGames.get(game, {}).get("save_path")]
+        if not games:
+            messagebox.showinfo(title, "None of these games has a save path.")
+            return
+
+        # A directory several games point at is backed up once, under the first of them
+        groups = {}
+        for gameName in games:
+            groups.setdefault(pathKey(self.data.DATA_JSONinstalledGames[gameName]["save_path"]), []).append(gameName)
+        games = [group[0] for group in groups.values()]
+        shared = [f"{group[0]} (also {', '.join(group[1:])})" for group in groups.values() if len(group) > 1]
+
+        finished = []
+        skipped = []
+        def __summary():
+            if len(finished) + len(skipped) < len(games):
+                return
+            failed = [f"{other.key}: {other.error}" for other in finished if other.state == "failed"]
+            created = sum(other.state == "done" for other in finished)
+            summary = f"{created} of {len(games)} backups created."
+            if shared:
+                summary += f"\nShared save folders, backed up once: {'; '.join(shared)}"
+            if skipped:
+                summary += f"\nSkipped: {', '.join(skipped)}"
+            if failed:
+                messagebox.showerror(title, summary + "\n" + "\n".join(failed))
+            else:
+                messagebox.showinfo(title, summary)
+
+        def __done(job):
+            finished.append(job)
+            __summary()
+
+        def __skipped(job):
+            skipped.append(job.key)
+            __summary()
+
+        for gameName in games:
+            settings = backupTasks.loadSettings(self.data, gameName)
+            self.__preflightBackup(gameName, lambda gameName=gameName, settings=settings: self.__submitBackup(gameName, settings, onDone=__done), __skipped)
 
     def BackupApply(self):
         selected = self.LIST_backupContents.selection()
@@ -180,19 +306,218 @@ class SaveFileManager:
             return
 
         zipFile = self.LIST_backupContents.item(selected[0], "text")
-        
-        # Sanitize the selected game name for folder paths, but not for zip files
-        sanitizedGameName = util.sanitizeFolderName_fix(self.selectedGameToDisplayDetails)
-        backupFolder = os.path.join(data.FOLDER_SaveGames, sanitizedGameName)
-        zipPath = os.path.join(backupFolder, zipFile)
+        gameName = self.selectedGameToDisplayDetails
+        if not self.data.DATA_JSONinstalledGames[gameName].get("save_path", ""):
+            return
 
-        savePath = self.data.DATA_JSONinstalledGames[self.selectedGameToDisplayDetails].get("save_path", "")
-        if savePath:
-            shutil.rmtree(savePath)
-            os.makedirs(savePath, exist_ok=True)
-            util.extractZIPContent(zipPath, savePath)
+        def __run(job):
+            # Cancelling is only possible while queued, a running restore always completes or rolls back itself
+            job.progress(0, f"Restoring {zipFile}")
+            # Only files that differ are rewritten, the replaced ones are kept in an undo archive
+            return backupTasks.restoreBackup(self.data, gameName, zipFile)
+
+        def __done(job):
+            self.__refreshGame(gameName)
+            if job.state == "done":
+                stats = job.result
+                messagebox.showinfo("Success", f"Selected backup '{zipFile}' applied successfully!\n"
+                                               f"{stats['changed']} files restored, {stats['unchanged']} unchanged, {stats['removed']} removed.")
+            elif isinstance(job.error, PartialRestoreError):
+                messagebox.showerror("Error", f"Failed to apply backup, the save folder was partly changed: {str(job.error)}")
+            elif job.state == "failed":
+                messagebox.showerror("Error", f"Failed to apply backup, the save folder was not changed: {str(job.error)}")
+
+        self.scheduler.submit(Job(f"Restore {gameName}", __run, PRIORITY_RESTORE, key=gameName, onDone=__done))
+
+    def BackupUndoRestore(self):
+        gameName = self.selectedGameToDisplayDetails
+        savePath = self.data.DATA_JSONinstalledGames[gameName].get("save_path", "")
+        backupFolder = os.path.join(data.FOLDER_SaveGames, util.sanitizeFolderName_fix(gameName))
+        restore = DifferentialRestore(savePath, os.path.join(backupFolder, "undo"), self.data.RESTORE_UNDOLIMIT)
+        undoPath = restore.latestUndo()
+        if not savePath or not undoPath:
+            return
+        if not messagebox.askyesno("Undo Restore", "Revert the save folder to how it was before the last applied backup?"):
+            return
+
+        def __done(job):
+            self.__refreshGame(gameName)
+            if job.state == "failed":
+                messagebox.showerror("Error", f"Failed to undo the restore: {str(job.error)}")
+
+        self.scheduler.submit(Job(f"Undo restore {gameName}", lambda job: restore.undo(undoPath), PRIORITY_RESTORE, key=gameName, onDone=__done))
+
+    def BackupExport(self):
+        selected = self.LIST_backupContents.selection()
+        if not selected:
+            return
+
+        backupFile = self.LIST_backupContents.item(selected[0], "text")
+        if not ChunkStore.IsSnapshot(backupFile):
+            messagebox.showinfo("Export Backup", f"'{backupFile}' is a regular archive, only deduplicated snapshots need exporting.")
+            return
+
+        backupFolder = os.path.join(data.FOLDER_SaveGames, util.sanitizeFolderName_fix(self.selectedGameToDisplayDetails))
+        zipPath = filedialog.asksaveasfilename(defaultextension=".zip", filetypes=[("ZIP archive", "*.zip")],
+                                               initialfile=f"{os.path.splitext(backupFile)[0]}.zip")
+        if not zipPath:
+            return
+
+        def __run(job):
+            job.progress(0, f"Exporting {backupFile}")
+            # job.progress raises once cancelled, exportZip then removes the partial archive
+            self.data.chunkStore.exportZip(os.path.join(backupFolder, backupFile), zipPath, job.progress)
+
+        def __done(job):
+            if job.state == "done":
+                messagebox.showinfo("Success", f"Backup '{backupFile}' exported to '{zipPath}'.")
+            elif job.state == "failed":
+                messagebox.showerror("Error", f"Failed to export backup: {str(job.error)}")
+
+        self.scheduler.submit(Job(f"Export {backupFile}", __run, PRIORITY_BACKUP, key=self.selectedGameToDisplayDetails, onDone=__done))
+
+    def BackupDelete(self):
+        selected = self.LIST_backupContents.selection()
+        if not selected:
+            return
+
+        backupFile = self.LIST_backupContents.item(selected[0], "text")
+        gameName = self.selectedGameToDisplayDetails
+        # Later incremental backups take files from this one, they cannot outlive it
+        dependents = backupTasks.backupDependents(self.data, gameName, backupFile)
+        if dependents:
+            question = (f"The later incremental backups {', '.join(dependents)} take files from '{backupFile}' "
+                        f"and cannot be restored without it.\n\nDelete '{backupFile}' together with these {len(dependents)} backups?")
+        else:
+            question = f"Delete backup '{backupFile}'?"
+        if not messagebox.askyesno("Delete Backup", question):
+            return
+
+        try:
+            backupTasks.deleteBackup(self.data, gameName, backupFile)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to delete backup: {str(e)}")
         self.updateLIST_backupContents()
-        messagebox.showinfo("Success", f"Selected backup '{zipFile}' applied successfully!")
+
+    def __preflightBackup(self, gameName, onConfirmed, onSkipped=None):
+        """
+        Estimate a game's save folder on the job scheduler before backing it up.
+
+        A folder over the BACKUP_BUDGET limits, or one that looks like a game installation, is only
+        backed up after the user confirmed a warning with the estimate.
+
+        Args:
+            gameName (str): Game to check, it must have a save path.
+            onConfirmed (callable): Called on the Tk thread when the backup may start.
+            onSkipped (callable): Called on the Tk thread with the check's job when the backup will not start.
+        """
+        savePath = self.data.DATA_JSONinstalledGames[gameName].get("save_path", "")
+
+        def __run(job):
+            job.progress(0, f"Estimating {savePath}")
+            return estimateFolder(savePath, self.data.BACKUP_BUDGETBYTES, self.data.BACKUP_BUDGETFILES,
+                                  self.data.BACKUP_PREFLIGHTWORKERS, job.checkCancelled)
+
+        def __done(job):
+            if job.state == "failed":
+                messagebox.showerror("Error", f"Failed to read the save folder of '{gameName}': {str(job.error)}")
+            if job.state != "done":
+                if onSkipped:
+                    onSkipped(job)
+                return
+
+            stats = job.result
+            print(f"Estimated '{savePath}': {stats['files']} files, {stats['bytes']} bytes in {stats['elapsed']:.2f}s"
+                  f"{' (budget exceeded)' if stats['exceeded'] else ''}.")
+            if stats["exceeded"] or stats["markers"]:
+                size = f"{'more than ' if stats['exceeded'] else ''}{util.formatSize(stats['bytes'])} in {stats['files']} files"
+                reasons = []
+                if stats["exceeded"]:
+                    reasons.append(f"This is over the backup limit of {util.formatSize(self.data.BACKUP_BUDGETBYTES)} "
+                                   f"or {self.data.BACKUP_BUDGETFILES} files.")
+                if stats["markers"]:
+                    reasons.append("It looks like a game installation rather than a save folder:\n" + "\n".join(stats["markers"]))
+                if not messagebox.askyesno("Large Backup", f"The save folder of '{gameName}' holds {size}.\n{savePath}\n\n"
+                                                           + "\n\n".join(reasons) + "\n\nBack it up anyway?"):
+                    if onSkipped:
+                        onSkipped(job)
+                    return
+            onConfirmed()
+
+        self.scheduler.submit(Job(f"Check {gameName}", __run, PRIORITY_BACKUP, key=gameName, onDone=__done))
+
+    def __submitBackup(self, gameName, settings, zipName=None, onDone=None):
+        """
+        Queue a backup of one game on the job scheduler.
+
+        Args:
+            gameName (str): Game to back up, it must have a save path.
+            settings (dict): {"mode", "codec", "compression"}, see backupTasks.loadSettings().
+            zipName (str): File name of the backup, a timestamped name if None.
+            onDone (callable): Called on the Tk thread with the finished job, job.result is (zipName, details).
+        """
+        def __run(job):
+            # job.progress raises once cancelled, createBackup then removes the partial archive
+            result = backupTasks.createBackup(self.data, gameName, settings, zipName, job.progress)
+            return result["name"], result["details"]
+
+        def __done(job):
+            self.__refreshGame(gameName)
+            if onDone:
+                onDone(job)
+
+        return self.scheduler.submit(Job(f"Backup {gameName}", __run, PRIORITY_BACKUP, key=gameName, onDone=__done))
+
+    def __refreshGame(self, gameName):
+        """Redraw the details of a game after a job changed its files, if it is still the one shown."""
+        if gameName == self.selectedGameToDisplayDetails:
+            self.updateSaveFolderContents()
+            self.updateLIST_backupContents()
+
+    def __gameName(self, position):
+        return self.gameList[position][0]
+
+    def __gameRowText(self, position):
+        game, isInstalled = self.gameList[position]
+        status = "\u2713" if isInstalled else "\u2717"
+        return f"{status} {game}"
+
+    def __onJobProgress(self, job):
+        active = self.scheduler.active()
+        running = [other for other in active if other.state == "running"]
+        if not active:
+            self.PROG_backupProgress.pack_forget()
+            self.LBL_jobStatus.config(text="")
+            self.BTN_cancelJobs.config(state=DISABLED)
+            return
+
+        self.PROG_backupProgress.pack(fill=X, padx=5, pady=5, before=self.FRAME_jobs)
+        self.PROG_backupProgress['value'] = sum(other.percent for other in running) / len(running) if running else 0
+        status = ", ".join(f"{other.name} {other.percent:.0f}%" for other in running)
+        queued = len(active) - len(running)
+        self.LBL_jobStatus.config(text=f"{status}{f' ({queued} queued)' if queued else ''}")
+        self.BTN_cancelJobs.config(state=NORMAL)
+
+    def __cancelJobs(self):
+        self.scheduler.cancelAll()
+
+    def __onClose(self):
+        if self.scheduler.active() and not messagebox.askyesno("Quit", "Backups or restores are still running. Cancel them and quit?"):
+            return
+        self.scheduler.shutdown()
+        self.inspectScheduler.shutdown()
+        # Closing again while the jobs wind down changes nothing
+        self.root.protocol("WM_DELETE_WINDOW", lambda: None)
+        self.__closeWhenIdle()
+
+    def __closeWhenIdle(self):
+        # The workers are daemon threads: destroying the window now would end the process in the middle of a write.
+        # A cancelled backup stops at its next progress report and removes its archive, a restore completes or rolls back.
+        if self.scheduler.active():
+            self.LBL_jobStatus.config(text="Waiting for running jobs to finish before closing...")
+            self.root.after(100, self.__closeWhenIdle)
+            return
+        self.root.destroy()
 
     def __openInstallationFolder(self):
         installPath = self.data.DATA_JSONinstalledGames[self.selectedGameToDisplayDetails].get("install_path", None)
@@ -209,15 +534,16 @@ class SaveFileManager:
         if folder:
             self.data.DATA_JSONinstalledGames.setdefault(self.selectedGameToDisplayDetails, {})["install_path"] = folder
             self.updatePaths()
-            self.data.saveJSON(self.data.PATH_JSONinstalledGames, self.data.DATA_JSONinstalledGames)
+            self.data.detection.save()
 
     def __setSavePath(self):
         folder = filedialog.askdirectory(title="Select Save Path Folder")
         if folder:
             self.data.DATA_JSONinstalledGames.setdefault(self.selectedGameToDisplayDetails, {})["save_path"] = folder
+            self.data.indexSavePaths()
             self.updatePaths()
             self.updateSaveFolderContents()
-            self.data.saveJSON(self.data.PATH_JSONinstalledGames, self.data.DATA_JSONinstalledGames)
+            self.data.detection.save()
             
     def __addMissingGame(self):
         dialog = AddMissingGameDialog(self.root, self.data)
@@ -238,19 +564,19 @@ class SaveFileManager:
 
         # Update installedGames.json if the game is installed
         if isInstalled:
-            installedGames = self.data.loadJSON(self.data.PATH_installedGames) if os.path.exists(self.data.PATH_installedGames) else {}
-            installedGames[gameName] = {
+            self.data.detection.installedGames[gameName] = {
                 "platform": "Custom",
                 **({"install_path": installPath} if installPath else {}),
                 **({"save_path": savePath} if savePath else {})
             }
-            self.data.saveJSON(self.data.PATH_installedGames, installedGames)
+            self.data.detection.save()
 
         messagebox.showinfo("Success", f"Game '{gameName}' added successfully!")
         self.data.initApplication()
         self.populateLIST_games()
         
     def __setupGUI_searchBar(self):
+        self.searchJob = None
         self.searchVar = ttk.StringVar()
         self.searchVar.trace_add("write", self.updateLIST_games)
         INP_SearchBar = ttk.Entry(self.root, textvariable=self.searchVar, font=("Arial", 14))
@@ -285,6 +611,9 @@ class SaveFileManager:
         )
         self.LBL_savePath.pack(fill=X, padx=5, pady=2)
 
+        self.LBL_sharedSavePath = ttk.Label(self.FRAME_details, text="", font=("Arial", 10), anchor="w", bootstyle="warning", wraplength=500, justify="left")
+        self.LBL_sharedSavePath.pack(fill=X, padx=5, pady=2)
+
         self.FRAME_buttons = ttk.Frame(self.FRAME_details)
         self.FRAME_buttons.pack(fill=X, pady=5)
         
@@ -305,12 +634,30 @@ class SaveFileManager:
         self.BTN_setSavePath.pack(side=LEFT, expand=True, padx=5, pady=5)
 
         # File list for save path contents
-        self.LIST_savePathContent = ttk.Treeview(self.FRAME_details, columns=["Filename", "Modified Date"], show="headings", bootstyle="dark")
-        self.LIST_savePathContent.heading("Filename", text="Filename")
+        self.LIST_savePathContent = ttk.Treeview(self.FRAME_details, columns=["Modified Date", "Size", "Files"], show="tree headings", bootstyle="dark")
+        self.LIST_savePathContent.heading("#0", text="Filename")
         self.LIST_savePathContent.heading("Modified Date", text="Modified Date")
+        self.LIST_savePathContent.heading("Size", text="Size")
+        self.LIST_savePathContent.heading("Files", text="Files")
+        self.LIST_savePathContent.column("Size", width=80, stretch=False)
+        self.LIST_savePathContent.column("Files", width=60, stretch=False)
+        self.LIST_savePathContent.bind("<<TreeviewOpen>>", self.__openSaveFolderNode)
         self.LIST_savePathContent.pack(fill=BOTH, expand=True, padx=5, pady=5)
         
-        self.LIST_backupContents = ttk.Treeview(self.FRAME_details, show='tree', bootstyle="dark")
+        self.backupFilterVar = ttk.StringVar()
+        self.backupFilterVar.trace_add("write", self.showLIST_backupContents)
+        INP_backupFilter = ttk.Entry(self.FRAME_details, textvariable=self.backupFilterVar)
+        INP_backupFilter.pack(fill=X, padx=5, pady=(5, 0))
+
+        # Newest first until a heading is clicked
+        self.backupEntries = []
+        self.backupSort = ("created", True)
+        columns = {"created": "Created", "size": "Size", "rawSize": "Original", "files": "Files", "codec": "Format"}
+        self.LIST_backupContents = ttk.Treeview(self.FRAME_details, columns=list(columns), show='tree headings', bootstyle="dark")
+        self.LIST_backupContents.heading("#0", text="Backup", command=lambda: self.__sortLIST_backupContents("#0"))
+        for column, title in columns.items():
+            self.LIST_backupContents.heading(column, text=title, command=lambda column=column: self.__sortLIST_backupContents(column))
+            self.LIST_backupContents.column(column, width=140 if column == "created" else 80, stretch=False)
         self.LIST_backupContents.pack(fill=BOTH, expand=True, padx=5, pady=5)
 
         self.FRAME_backupButtons = ttk.Frame(self.FRAME_details)
@@ -322,34 +669,54 @@ class SaveFileManager:
         self.BTN_createBackup.pack(side=LEFT, expand=True, padx=5, pady=5)
         self.BTN_applyBackup = ttk.Button(self.FRAME_backupButtons, text="Apply Backup", bootstyle="danger", command=self.BackupApply)
         self.BTN_applyBackup.pack(side=LEFT, expand=True, padx=5, pady=5)
-        self.PROG_backupProgress.pack(fill=X, padx=5, pady=5)
+        self.BTN_exportBackup = ttk.Button(self.FRAME_backupButtons, text="Export as ZIP", bootstyle="secondary", command=self.BackupExport)
+        self.BTN_exportBackup.pack(side=LEFT, expand=True, padx=5, pady=5)
+        self.BTN_deleteBackup = ttk.Button(self.FRAME_backupButtons, text="Delete Backup", bootstyle="outline-danger", command=self.BackupDelete)
+        self.BTN_deleteBackup.pack(side=LEFT, expand=True, padx=5, pady=5)
+        self.BTN_undoRestore = ttk.Button(self.FRAME_backupButtons, text="Undo Restore", bootstyle="outline-warning", command=self.BackupUndoRestore, state=DISABLED)
+        self.BTN_undoRestore.pack(side=LEFT, expand=True, padx=5, pady=5)
+        self.backupMode = ttk.StringVar(value="Full")
+        self.CMB_backupMode = ttk.Combobox(self.FRAME_backupButtons, textvariable=self.backupMode, values=BACKUP_MODES, state="readonly", width=12)
+        self.CMB_backupMode.pack(side=LEFT, padx=5, pady=5)
+        self.backupCodec = ttk.StringVar(value=self.data.BACKUP_CODEC)
+        self.CMB_backupCodec = ttk.Combobox(self.FRAME_backupButtons, textvariable=self.backupCodec, values=list(archiveCodecs.CODECS), state="readonly", width=8)
+        self.CMB_backupCodec.pack(side=LEFT, padx=5, pady=5)
+        self.compressionPreset = ttk.StringVar(value=self.data.BACKUP_COMPRESSION)
+        self.CMB_compressionPreset = ttk.Combobox(self.FRAME_backupButtons, textvariable=self.compressionPreset, values=list(PRESETS), state="readonly", width=10)
+        self.CMB_compressionPreset.pack(side=LEFT, padx=5, pady=5)
+
+        self.FRAME_jobs = ttk.Frame(self.FRAME_details)
+        self.LBL_jobStatus = ttk.Label(self.FRAME_jobs, text="", font=("Arial", 10), anchor="w", bootstyle="secondary")
+        self.LBL_jobStatus.pack(side=LEFT, fill=X, expand=True, padx=5)
+        self.BTN_cancelJobs = ttk.Button(self.FRAME_jobs, text="Cancel", bootstyle="outline-danger", command=self.__cancelJobs, state=DISABLED)
+        self.BTN_cancelJobs.pack(side=RIGHT, padx=5)
 
         self.FRAME_backupButtons.pack(fill=X, pady=5)
+        self.FRAME_jobs.pack(fill=X, pady=2)
     
     def __setupGUI_FrameLeft(self):
         # Left panel for game list
         self.FRAME_left = ttk.Frame(self.FRAME_main)
         self.FRAME_main.add(self.FRAME_left, weight=1)
 
-                # Treeview for the game list
-        self.LIST_games = ttk.Treeview(self.FRAME_left, show='tree', selectmode='browse', bootstyle="info")
-        self.LIST_games.grid(row=0, column=0, sticky="nsew", padx=5, pady=5)  # Grid for Treeview to expand
+        # Virtualized game list, keyed by position in gameList; only the visible rows are widgets
+        self.LIST_games = VirtualList(self.FRAME_left, textFor=self.__gameRowText, bootstyle="info", scrollbarStyle="danger")
+        self.LIST_games.grid(row=0, column=0, columnspan=2, sticky="nsew", padx=5, pady=5)  # Grid for the list to expand
         self.LIST_games.bind("<<TreeviewSelect>>", self.onGameSelect)
 
-        # Scrollbar for the Treeview
-        scrollbar = ttk.Scrollbar(self.FRAME_left, orient=VERTICAL, command=self.LIST_games.yview, bootstyle="danger")
-        scrollbar.grid(row=0, column=1, sticky="ns")  # Place scrollbar in the same row as Treeview, stretching vertically
-
-        # Configure grid to make the Treeview expand properly
-        self.FRAME_left.grid_rowconfigure(0, weight=1)  # Row 0 (Treeview) expands to fill the space
-        self.FRAME_left.grid_columnconfigure(0, weight=1)  # Column 0 (Treeview) expands to fill the space
-
-        # Configure the Treeview to use the scrollbar
-        self.LIST_games.configure(yscrollcommand=scrollbar.set)
+        # Configure grid to make the list expand properly
+        self.FRAME_left.grid_rowconfigure(0, weight=1)  # Row 0 (list) expands to fill the space
+        self.FRAME_left.grid_columnconfigure(0, weight=1)  # Column 0 (list) expands to fill the space
 
         # Add the "Add Missing Game" button at the bottom
         self.BTN_addMissingGame = ttk.Button(self.FRAME_left, text="Add Missing Game", bootstyle="info", command=self.__addMissingGame)
         self.BTN_addMissingGame.grid(row=1, column=0, columnspan=2, padx=5, pady=5, sticky='ew')  # Button at the bottom
+
+        # Ctrl/Shift-click selects several games, backed up one job per game
+        self.BTN_backupSelected = ttk.Button(self.FRAME_left, text="Backup Selected Games", bootstyle="outline-info", command=self.BackupCreateSelected)
+        self.BTN_backupSelected.grid(row=2, column=0, columnspan=2, padx=5, pady=5, sticky='ew')
+        self.BTN_backupAll = ttk.Button(self.FRAME_left, text="Backup All Games", bootstyle="outline-info", command=self.BackupCreateAll)
+        self.BTN_backupAll.grid(row=3, column=0, columnspan=2, padx=5, pady=5, sticky='ew')
     
     def __setupGUI_footer(self):
         self.FRAME_footer = ttk.Frame(self.root)
@@ -0,0 +1,224 @@
+"""
+# Github Authors: https://github.com/JulianStiebler/
+# Github Contributors: https://github.com/JulianStiebler/
+
+# GitHub Repository: https://github.com/JulianStiebler/GameSaveVault
+# Github License: MIT // https://github.com/JulianStiebler/GameSaveVault/blob/main/LICENSE
+
+# Last Edited: 18.10.2026
+"""
+
+import os
+import json
+import shutil
+import hashlib
+import zipfile
+import time
+
+import core.util as util
+from core.backupStream import ProgressMeter, scanFolder
+
+# Stored inside every incremental archive, describes the complete save folder at backup time
+ARCHIVE_MANIFEST = ".gsv-manifest.json"
+# Stored next to the archives, the state of the latest incremental backup of the game
+STATE_MANIFEST = "manifest.json"
+MANIFEST_VERSION = 1
+
+
+class IncrementalBackup:
+    """
+    Incremental (delta) backups of one game, driven by a per-game file manifest.
+
+    Every backup is a regular zip holding only the files that changed since the previous backup,
+    plus a manifest of the whole save folder (path, size, mtime, sha256 and the archive holding the
+    content). The first backup, and every one after maxChainLength deltas, stores all files and
+    becomes the new base. Any backup of the chain can be restored from its manifest alone.
+    """
+
+    def __init__(self, backupFolder, maxChainLength=10, workers=1, policy=None):
+        self.backupFolder = backupFolder
+        self.maxChainLength = maxChainLength
+        self.workers = workers
+        self.policy = policy
+        self.statePath = os.path.join(backupFolder, STATE_MANIFEST)
+
+    @staticmethod
+    def IsIncremental(archivePath):
+        """Check whether an archive was written by IncrementalBackup."""
+        try:
+            with zipfile.ZipFile(archivePath, 'r') as zipf:
+                return ARCHIVE_MANIFEST in zipf.NameToInfo
+        except (OSError, zipfile.BadZipFile):
+            return False
+
+    @staticmethod
+    def ReadManifest(archivePath):
+        """The manifest stored in an incremental archive, None if the archive is not one or unreadable."""
+        try:
+            with zipfile.ZipFile(archivePath, 'r') as zipf:
+                return json.loads(zipf.read(ARCHIVE_MANIFEST))
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+            return None
+
+    @staticmethod
+    def HashFile(filePath):
+        digest = hashlib.sha256()
+        with open(filePath, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def create(self, savePath, archiveName, progressCallback=None):
+        """
+        Create the next backup of the chain.
+
+        Args:
+            savePath (str): The game's save folder.
+            archiveName (str): File name of the new archive inside the backup folder.
+            progressCallback (callable or ProgressMeter): Receives the progress in percent while the changed files are written.
+
+        Returns:
+            dict: {"base", "storedFiles", "totalFiles", "storedBytes", "totalBytes"}
+
+        Raises:
+            FileExistsError: If archiveName exists or is part of the chain, writing it would break the chain.
+        """
+        previous = self.__loadState()
+        archivePath = os.path.join(self.backupFolder, archiveName)
+        chain = set()
+        if previous:
+            chain = {entry["archive"] for entry in previous.get("files", {}).values()} | {previous.get("archive"), previous.get("base")}
+        if os.path.exists(archivePath) or archiveName in chain:
+            raise FileExistsError(f"Backup '{archiveName}' already exists.")
+        isBase = not previous or previous.get("chainLength", 0) >= self.maxChainLength
+        previousFiles = {} if isBase else previous.get("files", {})
+
+        files = {}
+        changed = []
+        for filePath, relPath in scanFolder(savePath):
+            relPath = relPath.replace(os.sep, "/")
+            info = os.stat(filePath)
+            entry = {"size": info.st_size, "mtime": info.st_mtime_ns}
+            known = previousFiles.get(relPath)
+
+            # Size and mtime unchanged: trust the recorded hash instead of reading the file again
+            if known and known["size"] == entry["size"] and known["mtime"] == entry["mtime"]:
+                entry["hash"] = known["hash"]
+            else:
+                entry["hash"] = self.HashFile(filePath)
+
+            if known and known["hash"] == entry["hash"]:
+                entry["archive"] = known["archive"]
+            else:
+                entry["archive"] = archiveName
+                changed.append((filePath, relPath))
+            files[relPath] = entry
+
+        manifest = {
+            "version": MANIFEST_VERSION,
+            "archive": archiveName,
+            "base": archiveName if isBase else previous["base"],
+            "parent": None if isBase else previous["archive"],
+            "chainLength": 0 if isBase else previous.get("chainLength", 0) + 1,
+            "created": time.time(),
+            "files": files,
+        }
+
+        meter = ProgressMeter.For(progressCallback)
+        for _, relPath in changed:
+            meter.expect(files[relPath]["size"])
+        util.zipFiles(changed, archivePath, meter, self.workers, self.policy)
+        with zipfile.ZipFile(archivePath, 'a', zipfile.ZIP_DEFLATED) as zipf:
+            zipf.writestr(ARCHIVE_MANIFEST, json.dumps(manifest))
+        util.writeJSONAtomic(self.statePath, manifest)
+
+        return {
+            "base": isBase,
+            "storedFiles": len(changed),
+            "totalFiles": len(files),
+            "storedBytes": sum(files[relPath]["size"] for _, relPath in changed),
+            "totalBytes": sum(entry["size"] for entry in files.values()),
+        }
+
+    def restore(self, archivePath, targetFolder):
+        """
+        Rebuild the save folder as it was when the given backup was taken.
+
+        Every file is read from the archive of the chain that holds its content.
+        The target folder must exist and is expected to be empty.
+        """
+        with zipfile.ZipFile(archivePath, 'r') as zipf:
+            manifest = json.loads(zipf.read(ARCHIVE_MANIFEST))
+
+        byArchive = {}
+        for relPath, entry in manifest["files"].items():
+            byArchive.setdefault(entry["archive"], []).append(relPath)
+
+        for archiveName, relPaths in byArchive.items():
+            sourcePath = os.path.join(os.path.dirname(archivePath), archiveName)
+            if not os.path.exists(sourcePath):
+                raise FileNotFoundError(f"Backup '{archiveName}' of this chain is missing.")
+
+            with zipfile.ZipFile(sourcePath, 'r') as zipf:
+                for relPath in relPaths:
+                    targetPath = os.path.join(targetFolder, *relPath.split("/"))
+                    os.makedirs(os.path.dirname(targetPath), exist_ok=True)
+                    with zipf.open(relPath) as source, open(targetPath, 'wb') as target:
+                        shutil.copyfileobj(source, target, 1 << 20)
+
+    def dependents(self, archiveName):
+        """
+        Find the backups that cannot be restored without archiveName.
+
+        A backup depends on every archive its manifest takes files from, and on everything those depend on.
+
+        Returns:
+            list: Names of the dependent archives, oldest first, without archiveName itself.
+        """
+        manifests = {}
+        for name in os.listdir(self.backupFolder):
+            if name != archiveName and name.lower().endswith(".zip"):
+                manifest = self.ReadManifest(os.path.join(self.backupFolder, name))
+                if manifest:
+                    manifests[name] = manifest
+
+        uses = {name: {entry["archive"] for entry in manifest.get("files", {}).values()} for name, manifest in manifests.items()}
+        needed = {archiveName}
+        found = True
+        while found:
+            found = False
+            for name, archives in uses.items():
+                if name not in needed and not archives.isdisjoint(needed):
+                    needed.add(name)
+                    found = True
+        needed.discard(archiveName)
+        return sorted(needed, key=lambda name: manifests[name].get("created", 0))
+
+    def detach(self, archiveName):
+        """
+        Stop the chain from building on archiveName, call it before the archive is deleted or replaced.
+
+        The next backup then starts a new base, instead of taking files from whatever archive gets
+        archiveName later.
+        """
+        try:
+            with open(self.statePath, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return
+        archives = {entry["archive"] for entry in state.get("files", {}).values()} | {state.get("archive")}
+        if archiveName in archives:
+            os.remove(self.statePath)
+
+    def __loadState(self):
+        try:
+            with open(self.statePath, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        # A chain whose archives were removed can no longer be extended, start a new base
+        archives = {entry["archive"] for entry in state.get("files", {}).values()} | {state.get("archive")}
+        if state.get("version") != MANIFEST_VERSION or not all(os.path.exists(os.path.join(self.backupFolder, name)) for name in archives if name):
+            return None
+        return state
@@ -0,0 +1,71 @@
+"""
+# Github Authors: https://github.com/JulianStiebler/
+# Github Contributors: https://github.com/JulianStiebler/
+
+# GitHub Repository: https://github.com/JulianStiebler/GameSaveVault
+# Github License: MIT // https://github.com/JulianStiebler/GameSaveVault/blob/main/LICENSE
+
+# Last Edited: 18.10.2026
+"""
+
+import queue
+import threading
+import time
+
+class InitExecutor:
+    """
+    Runs the initialization steps on a background thread and streams their progress to Tk.
+
+    The worker thread never touches a widget; it only puts events on a thread-safe queue,
+    which the Tk thread drains with root.after polling and forwards to the callbacks.
+    """
+
+    def __init__(self, root, steps, onProgress, onDone, pollInterval=50):
+        """
+        Args:
+            root: Tk widget used for after() polling.
+            steps (list): (text, func) tuples, each func may return the number of items it processed.
+            onProgress (callable): Called on the Tk thread as onProgress(percent, text).
+            onDone (callable): Called on the Tk thread once the last step finished.
+            pollInterval (int): Queue polling interval in milliseconds.
+        """
+        self.root = root
+        self.steps = steps
+        self.onProgress = onProgress
+        self.onDone = onDone
+        self.pollInterval = pollInterval
+        self.events = queue.Queue()
+        self.thread = threading.Thread(target=self.__run, name="GameSaveVault-init", daemon=True)
+
+    def start(self):
+        self.thread.start()
+        self.root.after(self.pollInterval, self.__poll)
+
+    def __run(self):
+        total = len(self.steps)
+        for index, (text, func) in enumerate(self.steps):
+            self.events.put(("progress", index * 100 / total, text))
+            start = time.perf_counter()
+            try:
+                items = func()
+            except Exception as e:
+                print(f"Error during initialization: {e}")
+                items = None
+
+            elapsed = time.perf_counter() - start
+            detail = f"{text.rstrip('.')}: {items} items in {elapsed:.2f}s" if isinstance(items, int) else text
+            print(detail)
+            self.events.put(("progress", (index + 1) * 100 / total, detail))
+        self.events.put(("done",))
+
+    def __poll(self):
+        try:
+            while True:
+                event = self.events.get_nowait()
+                if event[0] == "done":
+                    self.onDone()
+                    return
+                self.onProgress(event[1], event[2])
+        except queue.Empty:
+            pass
+        self.root.after(self.pollInterval, self.__poll)
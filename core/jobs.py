@@ -0,0 +1,209 @@
+"""
+# Github Authors: https://github.com/JulianStiebler/
+# Github Contributors: https://github.com/JulianStiebler/
+
+# GitHub Repository: https://github.com/JulianStiebler/GameSaveVault
+# Github License: MIT // https://github.com/JulianStiebler/GameSaveVault/blob/main/LICENSE
+
+# Last Edited: 18.10.2026
+"""
+
+import queue
+import heapq
+import itertools
+import threading
+
+PRIORITY_RESTORE = 0
+PRIORITY_BACKUP = 10
+
+
+class JobCancelled(Exception):
+    pass
+
+
+class Job:
+    """
+    One unit of background work, e.g. backing up or restoring a game.
+
+    func(job) runs on a worker thread; it reports progress with job.progress() and should call
+    job.checkCancelled() between steps. Both are safe from any thread and never touch Tk.
+    """
+
+    def __init__(self, name, func, priority=PRIORITY_BACKUP, io=True, key=None, onDone=None):
+        """
+        Args:
+            name (str): Shown in the UI.
+            func (callable): func(job) -> result.
+            priority (int): Lower runs first, equal priorities run in submission order.
+            io (bool): Counts against the scheduler's cap on concurrent I/O jobs.
+            key (str): Jobs with the same key never run at the same time (e.g. the game name).
+            onDone (callable): Called on the Tk thread with the finished job.
+        """
+        self.name = name
+        self.func = func
+        self.priority = priority
+        self.io = io
+        self.key = key
+        self.onDone = onDone
+        self.state = "queued"
+        self.percent = 0.0
+        self.text = ""
+        self.result = None
+        self.error = None
+        self.__cancelled = threading.Event()
+        self.__events = None
+
+    def progress(self, percent, text=None):
+        """Report progress, raises JobCancelled once the job was cancelled."""
+        self.checkCancelled()
+        if self.__events is not None:
+            self.__events.put(("progress", self, percent, text))
+
+    def checkCancelled(self):
+        if self.__cancelled.is_set():
+            raise JobCancelled(f"'{self.name}' was cancelled.")
+
+    def cancel(self):
+        self.__cancelled.set()
+
+    @property
+    def cancelled(self):
+        return self.__cancelled.is_set()
+
+    def _attach(self, events):
+        self.__events = events
+
+
+class JobScheduler:
+    """
+    Priority queue of Jobs executed by a pool of worker threads.
+
+    Progress and completion events go through a thread-safe queue that the Tk thread drains with
+    root.after polling, the same way InitExecutor reports to the loading screen. At most maxIOJobs
+    I/O jobs run at once, so a batch of backups does not thrash the disk.
+    """
+
+    def __init__(self, root, workers=4, maxIOJobs=2, onProgress=None, pollInterval=50):
+        """
+        Args:
+            root: Tk widget used for after() polling.
+            workers (int): Worker threads.
+            maxIOJobs (int): Cap on concurrently running jobs with io=True.
+            onProgress (callable): Called on the Tk thread as onProgress(job) after every progress or state change.
+            pollInterval (int): Event polling interval in milliseconds.
+        """
+        self.root = root
+        self.maxIOJobs = max(1, maxIOJobs)
+        self.onProgress = onProgress
+        self.pollInterval = pollInterval
+        self.events = queue.Queue()
+        self.jobs = []
+        self.__heap = []
+        self.__order = itertools.count()
+        self.__runningIO = 0
+        self.__runningKeys = set()
+        self.__closed = False
+        self.__condition = threading.Condition()
+        self.__threads = [threading.Thread(target=self.__work, name=f"GameSaveVault-job-{index}", daemon=True) for index in range(max(1, workers))]
+        for thread in self.__threads:
+            thread.start()
+        self.root.after(self.pollInterval, self.__poll)
+
+    def submit(self, job):
+        job._attach(self.events)
+        with self.__condition:
+            heapq.heappush(self.__heap, (job.priority, next(self.__order), job))
+            self.jobs.append(job)
+            self.__condition.notify()
+        self.events.put(("state", job))
+        return job
+
+    def cancel(self, job):
+        """Cancel a job: a queued job never starts, a running one stops at its next progress report."""
+        job.cancel()
+        with self.__condition:
+            self.__condition.notify_all()
+
+    def cancelAll(self):
+        for job in self.active():
+            self.cancel(job)
+
+    def active(self):
+        """Jobs that are queued or running."""
+        return [job for job in self.jobs if job.state in ("queued", "running")]
+
+    def shutdown(self):
+        self.cancelAll()
+        with self.__condition:
+            self.__closed = True
+            self.__condition.notify_all()
+
+    def __next(self):
+        """Pop the first job allowed to run now, cancelled jobs are finished on the way. Lock must be held."""
+        blocked = []
+        job = None
+        while self.__heap:
+            entry = heapq.heappop(self.__heap)
+            candidate = entry[2]
+            if candidate.cancelled:
+                candidate.state = "cancelled"
+                self.events.put(("done", candidate))
+                continue
+            if (candidate.io and self.__runningIO >= self.maxIOJobs) or (candidate.key is not None and candidate.key in self.__runningKeys):
+                blocked.append(entry)
+                continue
+            job = candidate
+            break
+        for entry in blocked:
+            heapq.heappush(self.__heap, entry)
+        return job
+
+    def __work(self):
+        while True:
+            with self.__condition:
+                job = self.__next()
+                while job is None:
+                    if self.__closed:
+                        return
+                    self.__condition.wait()
+                    job = self.__next()
+                job.state = "running"
+                self.__runningIO += job.io
+                if job.key is not None:
+                    self.__runningKeys.add(job.key)
+            self.events.put(("state", job))
+
+            try:
+                job.result = job.func(job)
+                job.state = "done"
+            except JobCancelled:
+                job.state = "cancelled"
+            except Exception as e:
+                print(f"Job '{job.name}' failed: {e}")
+                job.error = e
+                job.state = "failed"
+
+            with self.__condition:
+                self.__runningIO -= job.io
+                self.__runningKeys.discard(job.key)
+                self.__condition.notify_all()
+            self.events.put(("done", job))
+
+    def __poll(self):
+        try:
+            while True:
+                event = self.events.get_nowait()
+                job = event[1]
+                if event[0] == "progress":
+                    job.percent = event[2]
+                    if event[3] is not None:
+                        job.text = event[3]
+                if self.onProgress:
+                    self.onProgress(job)
+                if event[0] == "done":
+                    self.jobs = [other for other in self.jobs if other.state in ("queued", "running")]
+                    if job.onDone:
+                        job.onDone(job)
+        except queue.Empty:
+            pass
+        self.root.after(self.pollInterval, self.__poll)
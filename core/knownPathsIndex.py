@@ -0,0 +1,292 @@
+"""
+# Github Authors: https://github.com/JulianStiebler/
+# Github Contributors: https://github.com/JulianStiebler/
+
+# GitHub Repository: https://github.com/JulianStiebler/GameSaveVault
+# Github License: MIT // https://github.com/JulianStiebler/GameSaveVault/blob/main/LICENSE
+
+# Last Edited: 18.10.2026
+"""
+
+import os
+import re
+import sys
+import json
+import mmap
+import struct
+import bisect
+import hashlib
+from array import array
+from collections.abc import Mapping
+
+# Compiled layout (native byte order, every section 4-byte aligned):
+#   header      MAGIC, source mtime_ns, source size, source sha1, stringCount, entryCount, templateCount, tokenCount
+#   strings     (stringCount + 1) uint32 offsets into the utf-8 blob, then the blob, every string ends with a NUL
+#   names       entryCount uint32 string ids, sorted by game name
+#   entries     entryCount uint32 template ids, entries with the same token sequence share one template
+#   templates   (templateCount + 1) uint32 offsets into tokens, then tokenCount uint32 string ids, every
+#               template ends with the id stringCount, which stands for a NUL and is not in the string table
+MAGIC = b"GSVKPI3" + (b"L" if sys.byteorder == "little" else b"B")
+HEADER = struct.Struct("=8sqq20sIIII")
+
+# Strings and templates decoded per call on a full scan
+DECODE_BLOCK = 2048
+
+# A template token is one path segment including its trailing separator, e.g. "%userprofile%/"
+TOKEN_PATTERN = re.compile(r"[^/\\]*[/\\]|[^/\\]+$")
+
+
+class KnownGamePathsIndex(Mapping):
+    """
+    Read-only, memory-mapped view on the compiled knownGamePaths index.
+
+    Behaves like the former "Savepaths" dictionary (game name -> path template). Point lookups
+    binary-search the interned string table and uint32 arrays and decode only the entry asked for.
+    The first full scan decodes the string table in one call and joins all distinct templates in one more,
+    the names and templates are kept for the session. templateGroups() groups the games by template id,
+    so SavePathIndex keys every shared template once.
+    """
+
+    def __init__(self, indexPath):
+        with open(indexPath, "rb") as f:
+            self.__map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        _, _, _, _, stringCount, entryCount, templateCount, tokenCount = HEADER.unpack_from(self.__map, 0)
+        view = self.__view = memoryview(self.__map)
+        offset = HEADER.size
+
+        self.__stringOffsets = view[offset:offset + (stringCount + 1) * 4].cast("I")
+        offset += (stringCount + 1) * 4
+        self.__blobStart = offset
+        offset += self.__align(self.__stringOffsets[-1])
+
+        self.__names = view[offset:offset + entryCount * 4].cast("I")
+        offset += entryCount * 4
+        self.__templateIds = view[offset:offset + entryCount * 4].cast("I")
+        offset += entryCount * 4
+        self.__tokenOffsets = view[offset:offset + (templateCount + 1) * 4].cast("I")
+        offset += (templateCount + 1) * 4
+        self.__tokens = view[offset:offset + tokenCount * 4].cast("I")
+        self.__nameList = None
+        self.__templateList = None
+
+    def __len__(self):
+        return len(self.__names)
+
+    def __iter__(self):
+        return iter(self.names())
+
+    def __getitem__(self, game):
+        position = self.__find(game)
+        if position is None:
+            raise KeyError(game)
+        return self.template(position)
+
+    def __contains__(self, game):
+        return self.__find(game) is not None
+
+    def names(self):
+        """Game names in sorted order, decoded on the first full scan and kept for the session."""
+        if self.__nameList is None:
+            self.__decode()
+        return self.__nameList
+
+    def templates(self):
+        """Every distinct template by template id, decoded on the first full scan and kept for the session."""
+        if self.__templateList is None:
+            self.__decode()
+        return self.__templateList
+
+    def items(self):
+        """(game, template) pairs in name order."""
+        return zip(self.names(), map(self.templates().__getitem__, self.__templateIds))
+
+    def templateGroups(self):
+        """Yield (template, games) once per distinct template, games in name order."""
+        groups = [[] for _ in range(len(self.__tokenOffsets) - 1)]
+        for game, templateId in zip(self.names(), self.__templateIds):
+            groups[templateId].append(game)
+        return zip(self.templates(), groups)
+
+    def template(self, position):
+        """Rebuild the path template of the entry at the given position from its tokens."""
+        templateId = self.__templateIds[position]
+        if self.__templateList is not None:
+            return self.__templateList[templateId]
+        start, end = self.__tokenOffsets[templateId], self.__tokenOffsets[templateId + 1] - 1
+        return "".join(self.__string(self.__tokens[i]) for i in range(start, end))
+
+    def __find(self, game):
+        if self.__nameList is not None:
+            position = bisect.bisect_left(self.__nameList, game)
+            found = position < len(self.__nameList) and self.__nameList[position] == game
+            return position if found else None
+        names = self.__names
+        lo, hi = 0, len(names)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.__string(names[mid]) < game:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(names) and self.__string(names[lo]) == game:
+            return lo
+        return None
+
+    def __decode(self):
+        # Strings and templates are decoded in blocks: one call per block, the NUL terminators split it back
+        # into single strings. Blocks keep the temporary text small, a single emoji widens a whole block.
+        # The id after the last string stands for a NUL, it ends every template in the token array.
+        strings = []
+        stringOffsets = self.__stringOffsets
+        for first, last in self.__blocks(len(stringOffsets) - 1):
+            block = self.__view[self.__blobStart + stringOffsets[first]:self.__blobStart + stringOffsets[last] - 1]
+            strings += str(block, "utf-8").split("\0")
+        strings.append("\0")
+        self.__nameList = list(map(strings.__getitem__, self.__names))
+
+        templates = []
+        tokenOffsets = self.__tokenOffsets
+        for first, last in self.__blocks(len(tokenOffsets) - 1):
+            tokens = self.__tokens[tokenOffsets[first]:tokenOffsets[last] - 1]
+            templates += "".join(map(strings.__getitem__, tokens)).split("\0")
+        self.__templateList = templates
+
+    @staticmethod
+    def __blocks(count):
+        return [(first, min(first + DECODE_BLOCK, count)) for first in range(0, count, DECODE_BLOCK)]
+
+    def __string(self, stringId):
+        start = self.__blobStart + self.__stringOffsets[stringId]
+        end = self.__blobStart + self.__stringOffsets[stringId + 1] - 1
+        return self.__map[start:end].decode("utf-8")
+
+    @staticmethod
+    def __align(size):
+        return (size + 3) & ~3
+
+
+def fileHash(filePath):
+    """Return the sha1 digest of a file."""
+    digest = hashlib.sha1()
+    with open(filePath, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def compileIndex(sourcePath, indexPath):
+    """
+    Compile the knownGamePaths JSON into the binary index format.
+
+    Args:
+        sourcePath (str): Path to knownGamePaths.json.
+        indexPath (str): Path the compiled index is written to (atomically).
+    """
+    stat = os.stat(sourcePath)
+    with open(sourcePath, "rb") as f:
+        raw = f.read()
+    savePaths = json.loads(raw).get("Savepaths", {})
+
+    stringIds = {}
+    strings = []
+
+    def intern(value):
+        if "\0" in value:
+            raise ValueError(f"NUL character in known game path entry {value!r}.")
+        stringId = stringIds.get(value)
+        if stringId is None:
+            stringId = stringIds[value] = len(strings)
+            strings.append(value)
+        return stringId
+
+    names = array("I")
+    templateIds = array("I")
+    templateIdOf = {}
+    for game in sorted(savePaths):
+        names.append(intern(game))
+        templateTokens = tuple(intern(token) for token in TOKEN_PATTERN.findall(savePaths[game]))
+        templateIds.append(templateIdOf.setdefault(templateTokens, len(templateIdOf)))
+
+    # The terminator id is only known once every string is interned
+    tokenOffsets = array("I", [0])
+    tokens = array("I")
+    for templateTokens in templateIdOf:
+        tokens.extend(templateTokens)
+        tokens.append(len(strings))
+        tokenOffsets.append(len(tokens))
+
+    stringOffsets = array("I", [0])
+    blob = bytearray()
+    for value in strings:
+        blob += value.encode("utf-8") + b"\0"
+        stringOffsets.append(len(blob))
+    blob += b"\0" * (-len(blob) % 4)
+
+    header = HEADER.pack(MAGIC, stat.st_mtime_ns, stat.st_size, hashlib.sha1(raw).digest(), len(strings), len(names),
+                         len(templateIdOf), len(tokens))
+    tempPath = f"{indexPath}.tmp"
+    with open(tempPath, "wb") as f:
+        f.write(header)
+        f.write(stringOffsets.tobytes())
+        f.write(blob)
+        f.write(names.tobytes())
+        f.write(templateIds.tobytes())
+        f.write(tokenOffsets.tobytes())
+        f.write(tokens.tobytes())
+    os.replace(tempPath, indexPath)
+
+
+def isIndexCurrent(sourcePath, indexPath):
+    """
+    Check whether the compiled index still matches its source JSON.
+
+    The stored mtime and size are compared first; if they differ the source is hashed,
+    so a touched but unchanged file does not force a rebuild.
+    """
+    try:
+        with open(indexPath, "rb") as f:
+            header = f.read(HEADER.size)
+        magic, mtime, size, digest, *_ = HEADER.unpack(header)
+    except (OSError, struct.error):
+        return False
+
+    if magic != MAGIC:
+        return False
+
+    stat = os.stat(sourcePath)
+    if stat.st_mtime_ns == mtime and stat.st_size == size:
+        return True
+    if stat.st_size != size or fileHash(sourcePath) != digest:
+        return False
+
+    # Same content with a new mtime, remember it so the next launch skips hashing again
+    try:
+        with open(indexPath, "r+b") as f:
+            f.write(HEADER.pack(magic, stat.st_mtime_ns, size, digest, *HEADER.unpack(header)[4:]))
+    except OSError:
+        pass
+    return True
+
+
+def loadKnownGamePaths(sourcePath, indexPath):
+    """
+    Load the known game paths through the compiled index, rebuilding it when the source changed.
+
+    Args:
+        sourcePath (str): Path to knownGamePaths.json.
+        indexPath (str): Path of the compiled index.
+
+    Returns:
+        Mapping: game name -> save path template, or an empty dictionary if nothing could be loaded.
+    """
+    try:
+        if not isIndexCurrent(sourcePath, indexPath):
+            print(f"Compiling {sourcePath} to {indexPath}.")
+            compileIndex(sourcePath, indexPath)
+        return KnownGamePathsIndex(indexPath)
+    except FileNotFoundError:
+        print(f"File not found: {sourcePath}")
+    except (OSError, ValueError) as e:
+        print(f"Error loading known game paths from {sourcePath}: {e}")
+    return {}
@@ -0,0 +1,198 @@
+"""
+# Github Authors: https://github.com/JulianStiebler/
+# Github Contributors: https://github.com/JulianStiebler/
+
+# GitHub Repository: https://github.com/JulianStiebler/GameSaveVault
+# Github License: MIT // https://github.com/JulianStiebler/GameSaveVault/blob/main/LICENSE
+
+# Last Edited: 18.10.2026
+"""
+
+import os
+import zlib
+import struct
+import zipfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from core.backupStream import ProgressMeter, CHUNK_SIZE
+
+# Zip record layouts (APPNOTE.TXT 4.3), all little-endian
+LOCAL_HEADER = struct.Struct("<IHHHHHIIIHH")
+CENTRAL_HEADER = struct.Struct("<IHHHHHHIIIHHHHHII")
+END_RECORD = struct.Struct("<IHHHHIIH")
+ZIP64_END_RECORD = struct.Struct("<IQHHIIQQQQ")
+ZIP64_LOCATOR = struct.Struct("<IIQI")
+ZIP64_LIMIT = (1 << 31) - 1
+
+FLAG_UTF8 = 0x800
+METHOD_STORED = 0
+METHOD_DEFLATED = 8
+# Deflate looks back at most 32 KiB, priming a block with the tail of the previous one keeps the ratio
+WINDOW_SIZE = 1 << 15
+
+
+def zipFilesParallel(files, zipFilePath, progressCallback=None, workers=None, level=6, blockSize=CHUNK_SIZE, policy=None):
+    """
+    Compress files into a zip archive on a worker pool.
+
+    Files are read sequentially and cut into blocks; each block is deflated on its own thread (zlib
+    releases the GIL) into a raw stream ending on a byte boundary, so the blocks of a file concatenate
+    into one valid deflate stream. The CRC is computed while reading. A single writer emits the blocks
+    in order and finishes the archive with the central directory, using zip64 records where needed.
+    Files the policy decides to store are copied without a compression job.
+
+    Args:
+        files (iterable): (filePath, arcname) tuples, a list or a stream from scanFolder.
+        zipFilePath (str): Archive to create.
+        progressCallback (callable or ProgressMeter): Receives the progress in percent as blocks are written.
+        workers (int): Compression threads, defaults to the number of CPUs.
+        level (int): zlib compression level.
+        blockSize (int): Bytes compressed per job, larger files are split.
+        policy (CompressionPolicy): Chooses deflate or store (and the level) per file, overrides level.
+    """
+    workers = max(1, workers or os.cpu_count() or 1)
+    maxInFlight = workers * 4
+    pending = deque()
+    entries = []
+    meter = ProgressMeter.For(progressCallback, files)
+
+    with open(zipFilePath, 'wb') as archive, ThreadPoolExecutor(max_workers=workers) as executor:
+        def __drain(limit):
+            while len(pending) > limit:
+                kind, value = pending.popleft()
+                if kind == "start":
+                    _writeLocalHeader(archive, value)
+                elif kind == "block":
+                    entry, data, rawSize = value
+                    if entry["method"] == METHOD_DEFLATED:
+                        data = data.result()
+                    archive.write(data)
+                    entry["compressSize"] += len(data)
+                    meter.advance(rawSize)
+                else:
+                    _finishEntry(archive, value)
+                    if policy and value["method"] == METHOD_DEFLATED:
+                        policy.record(value["zinfo"].filename, value["fileSize"], value["compressSize"])
+
+        for filePath, arcname in files:
+            zinfo = zipfile.ZipInfo.from_file(filePath, arcname, strict_timestamps=False)
+            entry = {"zinfo": zinfo, "crc": 0, "fileSize": 0, "compressSize": 0, "zip64": zinfo.file_size * 1.05 > ZIP64_LIMIT,
+                     "method": METHOD_STORED if zinfo.is_dir() else METHOD_DEFLATED}
+            fileLevel = level
+            if policy and not zinfo.is_dir():
+                compressType, fileLevel = policy.choose(filePath, arcname)
+                if compressType == zipfile.ZIP_STORED:
+                    entry["method"] = METHOD_STORED
+            pending.append(("start", entry))
+            entries.append(entry)
+
+            if not zinfo.is_dir():
+                with open(filePath, 'rb') as f:
+                    previous = b""
+                    data = f.read(blockSize)
+                    while True:
+                        following = f.read(blockSize) if data else b""
+                        entry["crc"] = zlib.crc32(data, entry["crc"])
+                        entry["fileSize"] += len(data)
+                        if entry["method"] == METHOD_DEFLATED:
+                            future = executor.submit(_compressBlock, data, previous[-WINDOW_SIZE:], fileLevel, not following)
+                            pending.append(("block", (entry, future, len(data))))
+                        elif data:
+                            pending.append(("block", (entry, data, len(data))))
+                        __drain(maxInFlight)
+                        if not following:
+                            break
+                        previous, data = data, following
+
+            pending.append(("end", entry))
+            __drain(maxInFlight)
+        __drain(0)
+
+        _writeCentralDirectory(archive, entries)
+    meter.finish()
+
+
+def _compressBlock(data, dictionary, level, isLast):
+    if dictionary:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -15, zdict=dictionary)
+    else:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+    return compressor.compress(data) + compressor.flush(zlib.Z_FINISH if isLast else zlib.Z_SYNC_FLUSH)
+
+
+def _encodeName(zinfo):
+    try:
+        return zinfo.filename.encode("ascii"), 0
+    except UnicodeEncodeError:
+        return zinfo.filename.encode("utf-8"), FLAG_UTF8
+
+
+def _dosTime(zinfo):
+    year, month, day, hour, minute, second = zinfo.date_time
+    return (hour << 11) | (minute << 5) | (second // 2), ((year - 1980) << 9) | (month << 5) | day
+
+
+def _writeLocalHeader(archive, entry):
+    zinfo = entry["zinfo"]
+    name, flags = _encodeName(zinfo)
+    dosTime, dosDate = _dosTime(zinfo)
+    entry["offset"] = archive.tell()
+    # Sizes and CRC are patched in once the data is written, zip64 entries carry them in the extra field
+    extra = struct.pack("<HHQQ", 1, 16, 0, 0) if entry["zip64"] else b""
+    size = 0xFFFFFFFF if entry["zip64"] else 0
+    archive.write(LOCAL_HEADER.pack(0x04034B50, 45 if entry["zip64"] else 20, flags, entry["method"], dosTime, dosDate,
+                                    0, size, size, len(name), len(extra)))
+    archive.write(name + extra)
+
+
+def _finishEntry(archive, entry):
+    if entry["zinfo"].is_dir():
+        return
+    end = archive.tell()
+    archive.seek(entry["offset"] + 14)
+    if entry["zip64"]:
+        archive.write(struct.pack("<I", entry["crc"]))
+        name, _ = _encodeName(entry["zinfo"])
+        archive.seek(entry["offset"] + LOCAL_HEADER.size + len(name) + 4)
+        archive.write(struct.pack("<QQ", entry["fileSize"], entry["compressSize"]))
+    elif entry["fileSize"] > ZIP64_LIMIT or entry["compressSize"] > ZIP64_LIMIT:
+        raise OverflowError(f"{entry['zinfo'].filename} grew past 2 GiB while it was being archived.")
+    else:
+        archive.write(struct.pack("<III", entry["crc"], entry["compressSize"], entry["fileSize"]))
+    archive.seek(end)
+
+
+def _writeCentralDirectory(archive, entries):
+    start = archive.tell()
+    for entry in entries:
+        zinfo = entry["zinfo"]
+        name, flags = _encodeName(zinfo)
+        dosTime, dosDate = _dosTime(zinfo)
+
+        fields = []
+        fileSize, compressSize, offset = entry["fileSize"], entry["compressSize"], entry["offset"]
+        if fileSize > ZIP64_LIMIT:
+            fields.append(fileSize)
+            fileSize = 0xFFFFFFFF
+        if compressSize > ZIP64_LIMIT:
+            fields.append(compressSize)
+            compressSize = 0xFFFFFFFF
+        if offset > ZIP64_LIMIT:
+            fields.append(offset)
+            offset = 0xFFFFFFFF
+        extra = struct.pack(f"<HH{len(fields)}Q", 1, 8 * len(fields), *fields) if fields else b""
+        version = 45 if fields or entry["zip64"] else 20
+
+        archive.write(CENTRAL_HEADER.pack(0x02014B50, version | (zinfo.create_system << 8), version, flags, entry["method"],
+                                          dosTime, dosDate, entry["crc"], compressSize, fileSize,
+                                          len(name), len(extra), 0, 0, 0, zinfo.external_attr, offset))
+        archive.write(name + extra)
+
+    end = archive.tell()
+    count, size = len(entries), end - start
+    if count >= 0xFFFF or size > ZIP64_LIMIT or start > ZIP64_LIMIT:
+        archive.write(ZIP64_END_RECORD.pack(0x06064B50, ZIP64_END_RECORD.size - 12, 45, 45, 0, 0, count, count, size, start))
+        archive.write(ZIP64_LOCATOR.pack(0x07064B50, 0, end, 1))
+        count, size, start = min(count, 0xFFFF), min(size, 0xFFFFFFFF), min(start, 0xFFFFFFFF)
+    archive.write(END_RECORD.pack(0x06054B50, 0, 0, count, count, size, start, 0))
@@ -0,0 +1,77 @@
+"""
+# Github Authors: https://github.com/JulianStiebler/
+# Github Contributors: https://github.com/JulianStiebler/
+
+# GitHub Repository: https://github.com/JulianStiebler/GameSaveVault
+# Github License: MIT // https://github.com/JulianStiebler/GameSaveVault/blob/main/LICENSE
+
+# Last Edited: 18.10.2026
+"""
+
+import os
+
+
+def pathKey(path):
+    """Key of a save path: normalized and casefolded, without a trailing separator, like Windows compares paths."""
+    return os.path.normpath(path.replace("/", os.sep).replace("\\", os.sep)).rstrip(os.sep).casefold()
+
+
+class SavePathIndex:
+    """
+    Reverse index: save path -> the games using it.
+
+    Many known entries share a path (generic Unity "LocalLow/Saves" folders, identical "%gameinstall%/SavesDir"
+    templates), so probing or backing up per game does the same work several times. Built from the known
+    templates it groups games that share a template; built from the detected save paths it groups games
+    whose folders are the same directory.
+    """
+
+    def __init__(self):
+        self.paths = {}
+        self.games = {}
+
+    @staticmethod
+    def FromTemplates(knownGamePaths):
+        """Group the known games by save path template, templates are compared like paths."""
+        index = SavePathIndex()
+        # The compiled index groups the games by template id, each distinct template is keyed once
+        if hasattr(knownGamePaths, "templateGroups"):
+            for template, games in knownGamePaths.templateGroups():
+                index.add(games, template)
+            return index
+        for game, template in knownGamePaths.items():
+            index.add([game], template)
+        return index
+
+    @staticmethod
+    def FromInstalled(installedGames):
+        """Group the installed games by their detected or manually set save path."""
+        index = SavePathIndex()
+        for game, record in installedGames.items():
+            if record.get("save_path"):
+                index.add([game], record["save_path"])
+        return index
+
+    def add(self, games, path):
+        """Add games using path, the list is kept by the index."""
+        key = pathKey(path)
+        if key in self.games:
+            self.games[key].extend(games)
+        else:
+            self.paths[key] = path
+            self.games[key] = games
+
+    def gamesFor(self, path):
+        return self.games.get(pathKey(path), [])
+
+    def sharedWith(self, game, path):
+        """Other games using the same path as game."""
+        return [other for other in self.gamesFor(path) if other != game]
+
+    def items(self):
+        """Yield (path, games) once per distinct path, path as first seen."""
+        for key, games in self.games.items():
+            yield self.paths[key], games
+
+    def __len__(self):
+        return len(self.games)
@@ -9,9 +9,14 @@
 """
 
 import os
+import json
 import zipfile
+import tempfile
 import re
 
+from core.parallelZip import zipFilesParallel
+from core.backupStream import ProgressMeter, scanFolder, CHUNK_SIZE
+
 invalidChars = r'[\/:*?"<>|]'
 
 @staticmethod
@@ -19,21 +24,82 @@ def openFolderInExplorer(path):
     os.startfile(os.path.expandvars(path))
 
 @staticmethod
-def zipFolder(sourceFolder, zipFilePath, progressCallback=None):
-    # Count total files first
-    total_files = sum([len(files) for _, _, files in os.walk(sourceFolder)])
-    current_file = 0
-    
-    with zipfile.ZipFile(zipFilePath, 'w', zipfile.ZIP_DEFLATED) as zipf:
-        for root, _, files in os.walk(sourceFolder):
-            for file in files:
-                filepath = os.path.join(root, file)
-                arcname = os.path.relpath(filepath, sourceFolder)
-                zipf.write(filepath, arcname)
-                current_file += 1
-                if progressCallback:
-                    progress = (current_file / total_files) * 100
-                    progressCallback(progress)
+def writeJSONAtomic(filePath, data, indent=4):
+    """
+    Write JSON to a temporary file next to the target and rename it into place,
+    so a crash never leaves a half-written file behind.
+    """
+    directory = os.path.dirname(os.path.abspath(filePath))
+    os.makedirs(directory, exist_ok=True)
+    fd, tempPath = tempfile.mkstemp(prefix=".tmp-", suffix=".json", dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            # json.dumps goes through the C encoder when indent is None, json.dump never does
+            f.write(json.dumps(data, indent=indent))
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp creates owner-only files, keep the permissions of the file being replaced instead
+        os.chmod(tempPath, os.stat(filePath).st_mode & 0o777 if os.path.exists(filePath) else 0o644)
+        os.replace(tempPath, filePath)
+    except BaseException:
+        if os.path.exists(tempPath):
+            os.remove(tempPath)
+        raise
+
+@staticmethod
+def listFolder(sourceFolder):
+    """Return (filePath, arcname) tuples for every file below sourceFolder."""
+    return list(scanFolder(sourceFolder))
+
+@staticmethod
+def zipFolder(sourceFolder, zipFilePath, progressCallback=None, workers=1, policy=None):
+    meter = ProgressMeter.For(progressCallback)
+    zipFiles(scanFolder(sourceFolder, meter), zipFilePath, meter, workers, policy)
+
+@staticmethod
+def zipFiles(files, zipFilePath, progressCallback=None, workers=1, policy=None):
+    """
+    Compress the given files into a new zip archive.
+
+    Args:
+        files (iterable): (filePath, arcname) tuples, a list or a stream from scanFolder.
+        zipFilePath (str): Archive to create.
+        progressCallback (callable or ProgressMeter): Receives the progress in percent, by bytes and throttled.
+        workers (int): Compression threads, more than one uses the parallel writer.
+        policy (CompressionPolicy): Chooses deflate or store and the level per file, deflates everything if None.
+    """
+    meter = ProgressMeter.For(progressCallback, files)
+    if workers > 1:
+        zipFilesParallel(files, zipFilePath, meter, workers, policy=policy)
+        return
+
+    with zipfile.ZipFile(zipFilePath, 'w', zipfile.ZIP_DEFLATED, strict_timestamps=False) as zipf:
+        for filepath, arcname in files:
+            zinfo = zipfile.ZipInfo.from_file(filepath, arcname, strict_timestamps=False)
+            zinfo.compress_type = zipfile.ZIP_DEFLATED
+            if policy:
+                zinfo.compress_type, level = policy.choose(filepath, arcname)
+                setCompressLevel(zinfo, level)
+            with open(filepath, 'rb') as source, zipf.open(zinfo, 'w', force_zip64=zinfo.file_size * 1.05 > zipfile.ZIP64_LIMIT) as target:
+                for chunk in iter(lambda: source.read(CHUNK_SIZE), b""):
+                    target.write(chunk)
+                    meter.advance(len(chunk))
+            if policy and zinfo.compress_type == zipfile.ZIP_DEFLATED:
+                policy.record(arcname, zinfo.file_size, zinfo.compress_size)
+    meter.finish()
+
+@staticmethod
+def setCompressLevel(zinfo, level):
+    """
+    Set the compression level ZipFile.open() uses when writing zinfo.
+
+    ZipFile.open() takes the level of a ZipInfo from the ZipInfo only. Python 3.13 made it public as
+    compress_level; before that it is the CPython-internal _compresslevel, the only way to set it per file.
+    """
+    if hasattr(zipfile.ZipInfo, "compress_level"):
+        zinfo.compress_level = level
+    else:
+        zinfo._compresslevel = level
 
 @staticmethod
 def extractZIPContent(zipFilePath, targetFolder):
@@ -50,6 +116,16 @@ def sanitizeFolderName_contains(name):
         # List of invalid characters in windows filenames
         return bool(re.search(invalidChars, name))
 
+@staticmethod
+def formatSize(size):
+    """Format a byte count for display, e.g. 1.5 MB."""
+    if size is None:
+        return ""
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+
 @staticmethod
 def adjustTreeviewHeight(treeview, maxItems=10):
         """Adjust the height of a Treeview dynamically."""
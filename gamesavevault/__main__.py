@@ -0,0 +1,228 @@
+"""
+# Github Authors: https://github.com/JulianStiebler/
+# Github Contributors: https://github.com/JulianStiebler/
+
+# GitHub Repository: https://github.com/JulianStiebler/GameSaveVault
+# Github License: MIT // https://github.com/JulianStiebler/GameSaveVault/blob/main/LICENSE
+
+# Last Edited: 18.10.2026
+"""
+
+# Headless command line for scheduled backups, run from the repository root:
+#   python -m gamesavevault detect [--rescan]
+#   python -m gamesavevault list [--backups]
+#   python -m gamesavevault backup (--all | GAME...) [--mode M] [--codec C] [--compression P] [--force]
+#   python -m gamesavevault restore GAME [--backup NAME]
+#   python -m gamesavevault verify (--all | GAME...)
+# The result is printed to stdout as JSON, log messages go to stderr. The exit code is 1 if any game failed.
+# Tk is never imported and every command imports only the modules it uses, see benchmarks/benchColdStart.py.
+
+import os
+import sys
+import json
+import time
+import argparse
+import contextlib
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def loadData():
+    """Create the DataManger with the installed games of the last detection run."""
+    from core.dataManager import DataManger
+
+    data = DataManger()
+    data.loadInstalledGames()
+    return data
+
+
+def resolveGames(data, args):
+    """Map the GAME arguments to installed game names, exact first, then ignoring case. Unknown names map to None."""
+    if args.all:
+        return {gameName: gameName for gameName in sorted(data.DATA_JSONinstalledGames, key=str.lower)}
+    byCase = {gameName.casefold(): gameName for gameName in data.DATA_JSONinstalledGames}
+    return {game: game if game in data.DATA_JSONinstalledGames else byCase.get(game.casefold()) for game in args.games}
+
+
+def commandDetect(args):
+    from core.dataManager import DataManger
+
+    start = time.perf_counter()
+    try:
+        data = DataManger()
+        data.DETECT_FORCERESCAN = args.rescan
+        records = data.initLibraries()
+        games = data.initApplication()
+    except Exception as e:
+        # e.g. an unreadable library or a data folder that cannot be written
+        return {"status": "failed", "error": str(e)}, False
+    withSavePath = sum(bool(record.get("save_path")) for record in data.DATA_JSONinstalledGames.values())
+    return {"games": games, "records": records, "withSavePath": withSavePath, "matched": len(data.DATA_gameMatches),
+            "timings": data.detection.timings, "elapsed": time.perf_counter() - start}, True
+
+
+def commandList(args):
+    data = loadData()
+    games = []
+    for gameName in sorted(data.DATA_JSONinstalledGames, key=str.lower):
+        record = data.DATA_JSONinstalledGames[gameName]
+        savePath = record.get("save_path", "")
+        game = {"name": gameName, "platform": record.get("platform"), "installPath": record.get("install_path"), "savePath": savePath,
+                "sharedWith": data.DATA_sharedSavePaths.sharedWith(gameName, savePath) if savePath else []}
+        if args.backups:
+            # Served from the catalogs, no archive is opened unless a backup folder changed by hand
+            game["backups"] = sorted(data.backupCatalog(gameName).entries(), key=lambda entry: entry["created"] or 0)
+        games.append(game)
+    return {"games": games}, True
+
+
+def commandBackup(args):
+    from core import archiveCodecs, backupTasks
+    from core.compressionPolicy import PRESETS
+    from core.backupPreflight import estimateFolder
+    from core.savePathIndex import pathKey
+
+    for option, choices in (("mode", backupTasks.BACKUP_MODES), ("codec", archiveCodecs.CODECS), ("compression", PRESETS)):
+        value = getattr(args, option)
+        if value and value not in choices:
+            return {"error": f"Unknown {option} '{value}', expected one of {', '.join(choices)}."}, False
+
+    data = loadData()
+    results = []
+    backedUp = {}
+    for game, gameName in resolveGames(data, args).items():
+        if gameName is None:
+            results.append({"game": game, "status": "failed", "error": "Not an installed game."})
+            continue
+        savePath = data.DATA_JSONinstalledGames[gameName].get("save_path", "")
+        if not savePath:
+            results.append({"game": gameName, "status": "skipped", "reason": "No save path."})
+            continue
+        # A directory several games point at is backed up once, under the first of them
+        key = pathKey(savePath)
+        if key in backedUp:
+            results.append({"game": gameName, "status": "shared", "backedUpAs": backedUp[key]})
+            continue
+        backedUp[key] = gameName
+
+        settings = backupTasks.loadSettings(data, gameName)
+        for option in ("mode", "codec", "compression"):
+            if getattr(args, option):
+                settings[option] = getattr(args, option)
+        if args.codec and settings["mode"] != "Full":
+            # Incremental chains are always zip and snapshots have no codec, the backup would silently ignore it
+            results.append({"game": gameName, "status": "failed",
+                            "error": f"--codec only applies to Full backups, the mode is {settings['mode']}. Add --mode Full."})
+            continue
+
+        stats = estimateFolder(savePath, data.BACKUP_BUDGETBYTES, data.BACKUP_BUDGETFILES, data.BACKUP_PREFLIGHTWORKERS)
+        estimate = {"files": stats["files"], "bytes": stats["bytes"], "exceeded": stats["exceeded"], "markers": stats["markers"]}
+        if (stats["exceeded"] or stats["markers"]) and not args.force:
+            reason = "Over the backup limit." if stats["exceeded"] else "Looks like a game installation."
+            results.append({"game": gameName, "status": "skipped", "reason": f"{reason} Use --force to back it up anyway.", "estimate": estimate})
+            continue
+
+        start = time.perf_counter()
+        try:
+            backup = backupTasks.createBackup(data, gameName, settings)
+        except Exception as e:
+            results.append({"game": gameName, "status": "failed", "error": str(e)})
+            continue
+        backup.pop("details")
+        results.append({"game": gameName, "status": "created", **backup, "elapsed": time.perf_counter() - start})
+    return {"results": results}, all(result["status"] != "failed" for result in results)
+
+
+def commandRestore(args):
+    from core import backupTasks
+    from core.differentialRestore import PartialRestoreError
+
+    data = loadData()
+    gameName = resolveGames(data, args)[args.games[0]]
+    if gameName is None:
+        return {"game": args.games[0], "status": "failed", "error": "Not an installed game."}, False
+    entries = data.backupCatalog(gameName).entries()
+    if args.backup:
+        entries = [entry for entry in entries if entry["name"] == args.backup]
+    if not entries:
+        return {"game": gameName, "status": "failed", "error": f"No backup{' named ' + args.backup if args.backup else ''} found."}, False
+
+    # Without a name the newest backup is restored
+    backupName = max(entries, key=lambda entry: entry["created"] or 0)["name"]
+    try:
+        stats = backupTasks.restoreBackup(data, gameName, backupName)
+    except PartialRestoreError as e:
+        return {"game": gameName, "backup": backupName, "status": "failed", "error": f"{e} The save folder was partly changed."}, False
+    except Exception as e:
+        # Anything else failed before the commit or was rolled back, see DifferentialRestore
+        return {"game": gameName, "backup": backupName, "status": "failed", "error": f"{e} The save folder was not changed."}, False
+    return {"game": gameName, "backup": backupName, "status": "restored", **stats}, True
+
+
+def commandVerify(args):
+    from core import backupTasks
+
+    data = loadData()
+    results = []
+    for game, gameName in resolveGames(data, args).items():
+        if gameName is None:
+            results.append({"game": game, "backup": None, "ok": False, "error": "Not an installed game."})
+            continue
+        for entry in sorted(data.backupCatalog(gameName).entries(), key=lambda entry: entry["created"] or 0):
+            error = backupTasks.verifyBackup(data, gameName, entry)
+            results.append({"game": gameName, "backup": entry["name"], "ok": error is None, "error": error})
+    return {"results": results}, all(result["ok"] for result in results)
+
+
+def buildParser():
+    parser = argparse.ArgumentParser(prog="python -m gamesavevault", description="Back up and restore game saves without the GUI.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    detect = commands.add_parser("detect", help="Detect installed games and their save folders.")
+    detect.add_argument("--rescan", action="store_true", help="Run every detector, ignoring the detection cache.")
+    detect.set_defaults(func=commandDetect)
+
+    listGames = commands.add_parser("list", help="List the installed games of the last detection run.")
+    listGames.add_argument("--backups", action="store_true", help="Include the backups of every game.")
+    listGames.set_defaults(func=commandList)
+
+    # --mode, --codec and --compression are checked by the backup command, their tables are not loaded for the others
+    backup = commands.add_parser("backup", help="Back up the save folders of games.")
+    backup.add_argument("games", nargs="*", metavar="GAME")
+    backup.add_argument("--all", action="store_true", help="Back up every installed game with a save path.")
+    backup.add_argument("--mode", help="Full, Incremental or Deduplicated, defaults to the game's last used mode.")
+    backup.add_argument("--codec", help="Archive codec of Full backups, defaults to the game's last used codec.")
+    backup.add_argument("--compression", help="Compression preset, defaults to the game's last used preset.")
+    backup.add_argument("--force", action="store_true", help="Back up folders over the backup limit or looking like an installation.")
+    backup.set_defaults(func=commandBackup)
+
+    restore = commands.add_parser("restore", help="Restore a backup into a game's save folder.")
+    restore.add_argument("games", nargs=1, metavar="GAME")
+    restore.add_argument("--backup", metavar="NAME", help="Backup file name, defaults to the newest backup.")
+    restore.set_defaults(func=commandRestore, all=False)
+
+    verify = commands.add_parser("verify", help="Check that backups are readable and unchanged.")
+    verify.add_argument("games", nargs="*", metavar="GAME")
+    verify.add_argument("--all", action="store_true", help="Verify the backups of every installed game.")
+    verify.set_defaults(func=commandVerify)
+    return parser
+
+
+def main(argv=None):
+    parser = buildParser()
+    args = parser.parse_args(argv)
+    if args.command in ("backup", "verify") and not args.all and not args.games:
+        parser.error(f"{args.command}: name at least one GAME or pass --all")
+
+    # The data folder is relative, like for the GUI
+    os.chdir(ROOT)
+    # Everything the modules print is a log message, stdout only carries the JSON result
+    with contextlib.redirect_stdout(sys.stderr):
+        result, ok = args.func(args)
+    json.dump(result, sys.stdout, indent=2, ensure_ascii=False)
+    sys.stdout.write("\n")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
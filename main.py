@@ -11,29 +11,24 @@
 from core.gui import SaveFileManager
 from screen.splash import SplashScreen
 from core.dataManager import DataManger
+from core.initExecutor import InitExecutor
 import ttkbootstrap as ttk
+import sys
 
 def initGameSaveVault(splash, steps, root, data):
-    def step(index):
-        if index < len(steps):
-            text, func = steps[index]
-            splash.progressUpdate((index + 1) * (100 // len(steps)), text)
-            try:
-                func()
-            except Exception as e:
-                print(f"Error during initialization: {e}")
-            root.after(1000, step, index + 1)
-        else:
-            splash.close()
-            root.deiconify()
-            SaveFileManager(root, data)
-
-    step(0)
+    def onDone():
+        splash.close()
+        root.deiconify()
+        SaveFileManager(root, data)
+
+    # The steps run off the Tk thread, the splash only receives their progress events
+    InitExecutor(root, steps, splash.progressUpdate, onDone).start()
 
 
 if __name__ == "__main__":
     # Create main window first but don't show it
     data = DataManger()
+    data.DETECT_FORCERESCAN = "--rescan" in sys.argv
     ROOT_main = ttk.Window(themename=data.WINDOW_STYLE)
     ROOT_main.withdraw()
 
@@ -42,9 +37,7 @@ if __name__ == "__main__":
     splash = SplashScreen(ROOT_splash)
 
     steps = [
-        ("Initializing Epic Library...", data.initEpicLibrary),
-        ("Initializing Steam Library...", data.initSteamLibrary),
-        ("Initializing General Library...", data.initGeneralLibrary),
+        ("Detecting Epic, Steam and General Libraries...", data.initLibraries),
         ("Loading Application Data...", data.initApplication)
     ]
 
@@ -13,6 +13,9 @@ import os
 import winreg
 
 class DetectGamesEpic:
+    PLATFORM = "Epic"
+    DEPENDS = ()
+
     def __init__(self):
         pass
 
@@ -29,30 +32,37 @@ class DetectGamesEpic:
             return None
 
     @staticmethod
-    def GetInstalledGames(epicPath, outputFile):
-        """Fetch and save installed games from the LauncherInstalled.dat file."""
-        if epicPath is None:
-            print("Epic Games path is None.")
-            return
-
+    def GetLauncherInstalledPath(epicPath):
+        """Return the path of the LauncherInstalled.dat file that lists the installed games."""
         # Go back two folders from the epic_path
         basePath = os.path.abspath(os.path.join(epicPath, "..", ".."))
         
         # Path to the LauncherInstalled.dat file
-        epicGamesInfoFile = os.path.join(basePath, "UnrealEngineLauncher", "LauncherInstalled.dat")
+        return os.path.join(basePath, "UnrealEngineLauncher", "LauncherInstalled.dat")
+
+    @staticmethod
+    def GetInstalledGames(epicPath):
+        """
+        Read the installed games from the LauncherInstalled.dat file.
+
+        Args:
+            epicPath (str): Epic Games AppDataPath from the registry.
+
+        Returns:
+            dict: game name -> {"install_path": ...}, empty if nothing could be read.
+        """
+        installedGames = {}
+        if epicPath is None:
+            print("Epic Games path is None.")
+            return installedGames
+
+        epicGamesInfoFile = DetectGamesEpic.GetLauncherInstalledPath(epicPath)
         
         if not os.path.exists(epicGamesInfoFile):
             print(f"LauncherInstalled.dat not found at {epicGamesInfoFile}.")
-            return
+            return installedGames
 
         try:
-            # Load existing installed games from the shared file
-            if os.path.exists(outputFile):
-                with open(outputFile, 'r', encoding='utf-8') as file:
-                    installedGames = json.load(file)
-            else:
-                installedGames = {}
-
             # Open and load the JSON content from LauncherInstalled.dat
             with open(epicGamesInfoFile, 'r', encoding='utf-8') as file:
                 data = json.load(file)
@@ -69,27 +79,12 @@ class DetectGamesEpic:
 
                 if appName and installLocation:
                     gameName = os.path.basename(installLocation)
+                    installedGames[gameName] = {
+                        "install_path": os.path.normpath(installLocation),
+                    }
 
-                    # Add or update game entry with Epic-specific details
-                    if gameName in installedGames:
-                        # Update platform only if it's not set or empty
-                        if installedGames[gameName].get('platform', "") in ["General", ""]:
-                            installedGames[gameName]['platform'] = "Epic"
-
-                        installedGames[gameName].update({
-                            "install_path": os.path.normpath(installLocation),
-                        })
-                    else:
-                        installedGames[gameName] = {
-                            "platform": "Epic",
-                            "install_path": os.path.normpath(installLocation),
-                        }
-
-            # Save the updated games data back to the shared file
-            with open(outputFile, 'w', encoding='utf-8') as file:
-                json.dump(installedGames, file, indent=4)
-
-            print(f"Installed games saved to {outputFile}.")
+            print(f"Found {len(installedGames)} installed Epic games.")
         except Exception as e:
             print(f"Error reading or parsing {epicGamesInfoFile}: {e}")
 
+        return installedGames
@@ -9,15 +9,58 @@
 """
 
 import os
-import json
-from pathlib import Path
+import time
+from modules.pathResolver import PathResolver
+from core.savePathIndex import SavePathIndex, pathKey
 
 class DetectGamesGeneral:
+    PLATFORM = "General"
+    # "%gameinstall%" templates need the install paths found by these detectors
+    DEPENDS = ("Epic", "Steam")
+
     def __init__(self):
         pass
         
     @staticmethod
-    def GetSaveFolders(knownGamePaths, outputFile):
+    def ProbePaths(paths, resolver):
+        """
+        Check a list of paths for existence, listing each shared directory once on a bounded thread pool.
+
+        Args:
+            paths (list): Paths to check.
+            resolver (PathResolver): Resolver doing the directory reads, configured with the worker count.
+
+        Returns:
+            list: One boolean per input path, in input order.
+        """
+        if not paths:
+            return []
+
+        start = time.perf_counter()
+        results = resolver.Exists(paths)
+
+        elapsed = time.perf_counter() - start
+        rate = len(paths) / elapsed if elapsed > 0 else float("inf")
+        print(f"Probed {len(paths)} save paths with {resolver.workers} workers and {resolver.directoryReads} directory reads in {elapsed:.2f}s ({rate:.0f} entries/s).")
+        return results
+
+    @staticmethod
+    def GetSaveFolders(knownGamePaths, installedGames, resolver=None, matches=None, templateIndex=None):
+        """
+        Detect existing save folders for all known games.
+
+        Args:
+            knownGamePaths (Mapping): game name -> save path template, as loaded by DataManger.loadKnownGamePaths.
+            installedGames (dict): The installed games detected so far, used to resolve '%gameinstall%'.
+            resolver (PathResolver): Resolver used for the existence checks, a default one if omitted.
+            matches (dict): installed game name -> {"known": known game name, ...} from GameMatcher.match,
+                for installed games whose detected name differs from their known name.
+            templateIndex (SavePathIndex): knownGamePaths grouped by template, built here if omitted.
+
+        Returns:
+            dict: game name -> {"save_path": ...} for every save path that exists, keyed by the installed
+            game's name where a match exists so the save path lands on the detected entry.
+        """
         def helper_expandPath(path: str, installedGames: dict, game: str) -> str:
             """Helper function to expand path and resolve '%gameinstall%'."""
             # Check if the path contains '%gameinstall%' and resolve it
@@ -28,65 +71,49 @@ class DetectGamesGeneral:
                     install_path = installedGames[game]['install_path']
                     path = path.replace("%gameinstall%", install_path)
                 else:
-                    print(f"Install path for '{game}' not found in installedGames.json.")
                     return None
             # Normalize and expand the path
             expandedPath = os.path.expandvars(path)
             return os.path.normpath(expandedPath)
 
-        # Read the input JSON file containing save paths
-        try:
-            with open(knownGamePaths, 'r') as f:
-                inputData = json.load(f)
-        except FileNotFoundError:
-            print(f"Input JSON file '{knownGamePaths}' not found.")
-            return
+        saveFolders = {}
+        if not knownGamePaths:
+            print("No known game paths loaded.")
+            return saveFolders
         
-        try:
-            with open(outputFile, 'r') as f:
-                installedGames = json.load(f)
-        except FileNotFoundError:
-            print(f"Installed games file '{outputFile}' not found.")
-            return
-        except Exception as e:
-            print(f"Error reading '{outputFile}': {e}")
-            return
-        
-        # Iterate through the game paths in the input JSON and check if they exist
-        for game, path in inputData.get("Savepaths", {}).items():
-            # Get the expanded save path
-            expandedPath = helper_expandPath(path, installedGames, game)
-
-            if expandedPath is None:
-                continue
-
-            # Debugging: print the expanded path to check if it's correct
-            print(f"Checking save path for '{game}': {expandedPath}")
-
-            # Ensure path ends with a backslash
-            if not expandedPath.endswith(os.sep):
-                expandedPath = expandedPath + os.sep
-
-            # Check if the path exists
-            if Path(expandedPath).exists():
-                print(f"Found valid save path for '{game}': {expandedPath}")
-                
-                # Add or update the save path for the game in installedGames
-                if game in installedGames:
-                    installedGames[game]['save_path'] = expandedPath  # Update save_path
-                else:
-                    # If the game does not exist, create a new entry with save_path only
-                    installedGames[game] = {"save_path": expandedPath}
-                    
-                if 'platform' not in installedGames[game] or not installedGames[game]['platform']:
-                    installedGames[game]['platform'] = "General"  # Update platform only if not already set
+        # Known name -> installed name, where the detectors named the game differently
+        installedNames = {match["known"]: game for game, match in (matches or {}).items()}
+
+        # Games sharing a template are expanded once; every distinct expanded path is probed once
+        # and the result fanned out to all games using it
+        candidates = {}
+        for template, knownGames in (templateIndex or SavePathIndex.FromTemplates(knownGamePaths)).items():
+            games = [installedNames.get(knownGame, knownGame) for knownGame in knownGames]
+            if "%gameinstall%" in template:
+                expanded = [(game, helper_expandPath(template, installedGames, game)) for game in games]
             else:
-                print(f"Save path does not exist for '{game}': {expandedPath}")
-
-        # Write the updated installedGames data back to the file
-        try:
-            with open(outputFile, 'w') as f:
-                json.dump(installedGames, f, indent=4)
-            print(f"Games saved to {outputFile}")
-        except Exception as e:
-            print(f"Error writing to '{outputFile}': {e}")
+                sharedPath = helper_expandPath(template, installedGames, None)
+                expanded = [(game, sharedPath) for game in games]
+
+            for game, expandedPath in expanded:
+                if expandedPath is None:
+                    continue
+
+                # Ensure path ends with a backslash
+                if not expandedPath.endswith(os.sep):
+                    expandedPath = expandedPath + os.sep
+
+                candidates.setdefault(pathKey(expandedPath), (expandedPath, []))[1].append(game)
+
+        # Results come back in input order, so the outcome does not depend on which probe finishes first
+        distinct = list(candidates.values())
+        existsResults = DetectGamesGeneral.ProbePaths([expandedPath for expandedPath, _ in distinct], resolver or PathResolver())
+        print(f"{len(distinct)} distinct save paths for {sum(len(games) for _, games in distinct)} known games.")
+
+        for (expandedPath, games), exists in zip(distinct, existsResults):
+            if exists:
+                for game in games:
+                    print(f"Found valid save path for '{game}': {expandedPath}")
+                    saveFolders[game] = {"save_path": expandedPath}
+
+        return saveFolders
@@ -8,29 +8,29 @@
 # Last Edited: 11.01.2025
 """
 
-import requests
-import json
 import os
 import winreg
 
+from modules import vdfParser
+from modules.steamManifests import SteamManifestCache
+
 class DetectGamesSteam:
+    PLATFORM = "Steam"
+    DEPENDS = ()
+
     @staticmethod
-    def GetAppIDList(url, outputFile):
-        response = requests.get(url)
-
-        if response.status_code == 200:
-            data = response.json()
-            
-            # Sort apps by appid
-            apps = sorted(data['applist']['apps'], key=lambda x: x['appid'])
-            
-            # Create a dictionary where appid is the key and name is the value
-            output = {str(app['appid']): app['name'] for app in apps}
-            
-            with open(outputFile, 'w') as file:
-                json.dump({'steamAppIDList': output}, file, indent=4)
-        else:
-            print(f"Error fetching API data. Status Code: {response.status_code}")
+    def GetAppIDList(url, appList, force=False):
+        """
+        Refresh the local Steam app list (appid -> name) if its TTL expired.
+
+        Args:
+            url (str): ISteamApps/GetAppList endpoint.
+            appList (SteamAppList): The local app list to refresh.
+            force (bool): Ignore the TTL.
+        """
+        result = appList.refresh(url, force)
+        print(f"Steam app list: {result}.")
+        return result
 
     @staticmethod
     def GetInstallPath(regKey):
@@ -42,57 +42,61 @@ class DetectGamesSteam:
             print("Steam path not found in the registry.")
             return None
 
+    @staticmethod
+    def GetLibraryFoldersPath(steamPath):
+        """Return the path of the libraryfolders.vdf file that lists all Steam libraries."""
+        return os.path.join(steamPath, "steamapps", "libraryfolders.vdf")
+
     @staticmethod
     def GetLibraryPath(steamPath):
-        libraryFolderPath = os.path.join(steamPath, "steamapps", "libraryfolders.vdf")
+        libraryFolderPath = DetectGamesSteam.GetLibraryFoldersPath(steamPath)
 
         if not os.path.exists(libraryFolderPath):
             print(f"libraryfolders.vdf not found in {steamPath}.")
             return []
 
-        # Read and parse the VDF file manually (as a normal text file)
-        libraryPaths = []
-        with open(libraryFolderPath, 'r', encoding='utf-8') as file:
-            data = file.read()
+        try:
+            document = vdfParser.loadFile(libraryFolderPath, lowerKeys=True)
+        except (OSError, vdfParser.VDFError) as e:
+            print(f"Error reading {libraryFolderPath}: {e}")
+            return []
 
-        # Extract library paths from the "path" key
-        for line in data.splitlines():
-            if '"path"' in line:
-                parts = line.split('"')
-                if len(parts) > 3:
-                    path = parts[3].strip()
-                    libraryPaths.append(path)
+        # Current format: "libraryfolders" { "0" { "path" "..." } }, older clients stored "1" "D:\\Library" directly
+        libraryPaths = []
+        for key, value in document.get("libraryfolders", {}).items():
+            if isinstance(value, dict) and isinstance(value.get("path"), str):
+                libraryPaths.append(value["path"])
+            elif isinstance(value, str) and key.isdigit():
+                libraryPaths.append(value)
 
         return libraryPaths
 
     @staticmethod
-    def GetInstalledGames(libraryPath, outputFile):
-        def helper_ParseACFFile(ACFFilePath):
-            gameDetails = {}
-            
-            try:
-                with open(ACFFilePath, 'r', encoding='utf-8') as file:
-                    lines = file.readlines()
-
-                for i, line in enumerate(lines):
-                    if '"appid"' in line:
-                        gameDetails['appid'] = line.split('"')[3]
-                    elif '"name"' in line:
-                        gameDetails['name'] = line.split('"')[3]
-                    elif '"installdir"' in line:
-                        gameDetails['installdir'] = line.split('"')[3]
-
-            except Exception as e:
-                print(f"Error reading {ACFFilePath}: {e}")
-
-            return gameDetails
-        
-        # Check if the output file already exists and load the existing data
-        if os.path.exists(outputFile):
-            with open(outputFile, 'r', encoding='utf-8') as file:
-                installedGames = json.load(file)
-        else:
-            installedGames = {}
+    def GetManifestPaths(libraryPath):
+        """Return every steamapps folder and the .acf manifests inside them, the inputs GetInstalledGames reads."""
+        paths = []
+        for library in libraryPath:
+            steamAppsPath = os.path.join(library, "steamapps")
+            paths.append(steamAppsPath)
+            if os.path.isdir(steamAppsPath):
+                paths.extend(os.path.join(steamAppsPath, file) for file in os.listdir(steamAppsPath) if file.endswith(".acf"))
+        return paths
+
+    @staticmethod
+    def GetInstalledGames(libraryPath, manifestCache=None):
+        """
+        Read the installed games from the ACF manifests of every Steam library.
+
+        Args:
+            libraryPath (list): Steam library folders, as returned by GetLibraryPath.
+            manifestCache (SteamManifestCache): Parses the manifests and caches them per file,
+                an uncached one is used if omitted.
+
+        Returns:
+            dict: game name -> {"appid", "name", "installdir", "install_path"}.
+        """
+        manifestCache = manifestCache or SteamManifestCache()
+        manifests = []
 
         for paths in libraryPath:
             steamAppsPaths = os.path.join(paths, "steamapps")
@@ -105,42 +109,22 @@ class DetectGamesSteam:
             # Look for .acf files
             for ACFFile in os.listdir(steamAppsPaths):
                 if ACFFile.endswith(".acf"):
-                    ACFFilePath = os.path.join(steamAppsPaths, ACFFile)
-                    gameDetails = helper_ParseACFFile(ACFFilePath)
-
-                    if gameDetails:
-                        # Ensure we preserve the game name if already exists
-                        gameName = gameDetails.get("name")
-
-                        # Determine the full install path
-                        installDir = gameDetails.get('installdir')
-                        if installDir:
-                            if os.path.isabs(installDir):
-                                gameDetails['install_path'] = os.path.normpath(installDir)
-                            else:
-                                gameDetails['install_path'] = os.path.normpath(os.path.join(paths, "steamapps", "common", installDir))
-
-                            # If game already exists, update only non-existing fields, preserving save_path if exists
-                            if gameName in installedGames:
-                                if installedGames[gameName].get('platform', "") in ["General", ""]:
-                                    installedGames[gameName]['platform'] = "Steam"
-                                if 'save_path' in installedGames[gameName]:
-                                    gameDetails['save_path'] = installedGames[gameName]['save_path']
-                                # Update only fields that are not present
-                                installedGames[gameName].update({
-                                    'appid': gameDetails['appid'],
-                                    'install_path': gameDetails['install_path'],
-                                    'installdir': gameDetails['installdir'],
-                                    'name': gameName  # Add name if not already present
-                                })
-                            else:
-                                # If the game is new, add all the data
-                                installedGames[gameName] = gameDetails
-
-        # Write the updated games data back to the output file
-        with open(outputFile, 'w', encoding='utf-8') as file:
-            json.dump(installedGames, file, indent=4)
-        print(f"\nInstalled games saved to {outputFile}.")
-        return installedGames
+                    manifests.append((paths, os.path.join(steamAppsPaths, ACFFile)))
+
+        installedGames = {}
+        for (paths, _), details in zip(manifests, manifestCache.parseAll([ACFFilePath for _, ACFFilePath in manifests])):
+            gameName = details.get("name")
+            installDir = details.get('installdir')
+            if not gameName or not installDir:
+                continue
 
+            # Determine the full install path
+            gameDetails = dict(details)
+            if os.path.isabs(installDir):
+                gameDetails['install_path'] = os.path.normpath(installDir)
+            else:
+                gameDetails['install_path'] = os.path.normpath(os.path.join(paths, "steamapps", "common", installDir))
+            installedGames[gameName] = gameDetails
 
+        print(f"Found {len(installedGames)} installed Steam games ({manifestCache.parsed} manifests parsed, {manifestCache.reused} cached).")
+        return installedGames
@@ -0,0 +1,130 @@
+"""
+# Github Authors: https://github.com/JulianStiebler/
+# Github Contributors: https://github.com/JulianStiebler/
+
+# GitHub Repository: https://github.com/JulianStiebler/GameSaveVault
+# Github License: MIT // https://github.com/JulianStiebler/GameSaveVault/blob/main/LICENSE
+
+# Last Edited: 18.10.2026
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+class PathResolver:
+    """
+    Answers existence checks for many paths by listing every shared directory only once.
+
+    The paths are grouped into a prefix trie, each trie level is read with os.scandir
+    (one read per real directory, spread over a thread pool) and the children are then
+    matched case-insensitively against the in-memory listing, like Windows does.
+    """
+
+    def __init__(self, workers=8):
+        """
+        Args:
+            workers (int): Maximum number of threads listing directories.
+
+        After Exists() ran, directoryReads counts the folders that were listed and decidingDirectories
+        holds those whose listing ended a path: a probed path found in it, or a component missing from it.
+        """
+        self.workers = max(1, workers)
+        self.directoryReads = 0
+        self.decidingDirectories = []
+
+    @staticmethod
+    def SplitPath(path):
+        """
+        Split a path into its anchor (drive and root) and its remaining components.
+
+        Args:
+            path (str): Path to split, relative paths are resolved against the working directory.
+
+        Returns:
+            tuple: (anchor, [components])
+        """
+        drive, rest = os.path.splitdrive(os.path.abspath(path))
+        return drive + os.sep, [part for part in rest.split(os.sep) if part]
+
+    def Exists(self, paths):
+        """
+        Check which of the given paths exist.
+
+        Args:
+            paths (list): Paths to check.
+
+        Returns:
+            list: One boolean per input path, in input order.
+        """
+        results = [False] * len(paths)
+        self.directoryReads = 0
+        self.decidingDirectories = []
+
+        # Build the prefix trie, keyed case-insensitively on every level
+        anchors = {}
+        for index, path in enumerate(paths):
+            anchor, parts = self.SplitPath(path)
+            node = anchors.setdefault(anchor.casefold(), self.__newNode(anchor))
+            for part in parts:
+                node = node["children"].setdefault(part.casefold(), self.__newNode(part))
+            node["paths"].append(index)
+
+        level = []
+        for node in anchors.values():
+            if os.path.isdir(node["name"]):
+                node["real"] = node["name"]
+                for index in node["paths"]:
+                    results[index] = True
+                if node["children"]:
+                    level.append(node)
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            while level:
+                listings = list(executor.map(self.__listDirectory, [node["real"] for node in level]))
+                self.directoryReads += len(level)
+
+                nextLevel = []
+                for node, listing in zip(level, listings):
+                    # A folder only passed through changes nothing by itself: a folder below it that
+                    # decides a path stops existing when it is removed
+                    decides = False
+                    for key, child in node["children"].items():
+                        entries = listing.get(key)
+                        if not entries:
+                            decides = True
+                            continue
+
+                        # Prefer the exact spelling should a case-sensitive filesystem hold several
+                        actualName, isDir = next((entry for entry in entries if entry[0] == child["name"]), entries[0])
+                        child["real"] = os.path.join(node["real"], actualName)
+                        for index in child["paths"]:
+                            results[index] = True
+                        if child["paths"] or not isDir:
+                            decides = True
+                        if child["children"] and isDir:
+                            nextLevel.append(child)
+                    if decides:
+                        self.decidingDirectories.append(node["real"])
+                level = nextLevel
+
+        return results
+
+    @staticmethod
+    def __newNode(name):
+        return {"name": name, "children": {}, "paths": [], "real": None}
+
+    @staticmethod
+    def __listDirectory(path):
+        """List a directory once as {casefoldedName: [(name, isDir), ...]}."""
+        listing = {}
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    try:
+                        isDir = entry.is_dir()
+                    except OSError:
+                        isDir = False
+                    listing.setdefault(entry.name.casefold(), []).append((entry.name, isDir))
+        except OSError:
+            pass
+        return listing
@@ -0,0 +1,259 @@
+"""
+# Github Authors: https://github.com/JulianStiebler/
+# Github Contributors: https://github.com/JulianStiebler/
+
+# GitHub Repository: https://github.com/JulianStiebler/GameSaveVault
+# Github License: MIT // https://github.com/JulianStiebler/GameSaveVault/blob/main/LICENSE
+
+# Last Edited: 18.10.2026
+"""
+
+import os
+import sys
+import json
+import codecs
+import mmap
+import time
+import struct
+from array import array
+from bisect import bisect_left
+
+
+# Binary layout (native byte order, 4-byte aligned):
+#   header      MAGIC, appCount, metadataLength
+#   metadata    utf-8 JSON {"etag", "lastModified", "fetchedAt"} in a fixed block, patched in place on a 304
+#   appids      appCount sorted uint32
+#   offsets     (appCount + 1) uint32 offsets into the name blob
+#   names       utf-8 blob
+MAGIC = b"GSVAPP1" + (b"L" if sys.byteorder == "little" else b"B")
+HEADER = struct.Struct("=8sII")
+METADATA_SIZE = 1024
+
+
+class SteamAppList:
+    """
+    Local copy of the Steam app list (appid -> name) with a refresh policy.
+
+    The list is only downloaded again once it is older than the TTL, and then with
+    If-None-Match / If-Modified-Since so an unchanged list costs a 304 instead of ~200k entries.
+    It is stored as sorted appid / name arrays, lookups are binary searches on the memory-mapped file.
+    """
+
+    def __init__(self, indexPath, ttl=7 * 24 * 3600, timeout=(5, 60), session=None):
+        self.indexPath = indexPath
+        self.ttl = ttl
+        self.timeout = timeout
+        # requests costs most of the import time, it is only loaded once the list is refreshed
+        self.__session = session
+        self.__map = None
+        self.__appids = None
+        self.__offsets = None
+        self.__namesStart = 0
+
+    @property
+    def session(self):
+        if self.__session is None:
+            self.__session = self.CreateSession()
+        return self.__session
+
+    @staticmethod
+    def CreateSession(retries=3, poolSize=4):
+        """Create a pooled session that retries transient connection and server errors."""
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        session = requests.Session()
+        retry = Retry(total=retries, backoff_factor=0.5, status_forcelist=(500, 502, 503, 504), allowed_methods=("GET",))
+        adapter = HTTPAdapter(pool_connections=poolSize, pool_maxsize=poolSize, max_retries=retry)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def refresh(self, url, force=False):
+        """
+        Update the local app list if it is missing, older than the TTL or forced.
+
+        Args:
+            url (str): ISteamApps/GetAppList endpoint.
+            force (bool): Ignore the TTL (conditional headers are still sent).
+
+        Returns:
+            str: "fresh" (within TTL), "notModified" (304), "updated" or "failed".
+        """
+        import requests
+
+        metadata = self.metadata()
+        if not force and metadata and time.time() - metadata.get("fetchedAt", 0) < self.ttl:
+            return "fresh"
+
+        headers = {}
+        if metadata.get("etag"):
+            headers["If-None-Match"] = metadata["etag"]
+        if metadata.get("lastModified"):
+            headers["If-Modified-Since"] = metadata["lastModified"]
+
+        try:
+            with self.session.get(url, headers=headers, timeout=self.timeout, stream=True) as response:
+                if response.status_code == 304:
+                    metadata["fetchedAt"] = time.time()
+                    self.__writeMetadata(metadata)
+                    return "notModified"
+
+                if response.status_code != 200:
+                    print(f"Error fetching API data. Status Code: {response.status_code}")
+                    return "failed"
+
+                apps = {}
+                for app in self.IterApps(response.iter_content(chunk_size=1 << 16)):
+                    if isinstance(app.get("appid"), int) and isinstance(app.get("name"), str):
+                        apps[app["appid"]] = app["name"]
+
+                self.__write(apps, {
+                    "etag": response.headers.get("ETag"),
+                    "lastModified": response.headers.get("Last-Modified"),
+                    "fetchedAt": time.time(),
+                })
+                print(f"Steam app list updated with {len(apps)} apps.")
+                return "updated"
+        except (requests.RequestException, ValueError) as e:
+            print(f"Error fetching Steam app list: {e}")
+            return "failed"
+
+    @staticmethod
+    def IterApps(chunks):
+        """
+        Decode the {"applist": {"apps": [...]}} response incrementally.
+
+        Args:
+            chunks (iterable): Raw response body chunks (bytes).
+
+        Yields:
+            dict: One app object at a time, without holding the whole document in memory.
+        """
+        decoder = json.JSONDecoder()
+        textDecoder = codecs.getincrementaldecoder("utf-8")()
+        buffer = ""
+        inList = False
+        for chunk in chunks:
+            buffer += textDecoder.decode(chunk)
+            if not inList:
+                start = buffer.find('"apps"')
+                bracket = buffer.find("[", start) if start >= 0 else -1
+                if bracket < 0:
+                    continue
+                buffer = buffer[bracket + 1:]
+                inList = True
+
+            pos = 0
+            while True:
+                while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+                    pos += 1
+                if pos >= len(buffer):
+                    break
+                if buffer[pos] == "]":
+                    return
+                try:
+                    app, pos = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    break  # The object continues in the next chunk
+                yield app
+            buffer = buffer[pos:]
+
+        raise ValueError("Steam app list response ended unexpectedly.")
+
+    def metadata(self):
+        """Return the stored download metadata, or an empty dictionary if there is no local list."""
+        try:
+            with open(self.indexPath, "rb") as f:
+                magic, _, metadataLength = HEADER.unpack(f.read(HEADER.size))
+                if magic != MAGIC:
+                    return {}
+                return json.loads(f.read(metadataLength))
+        except (OSError, struct.error, ValueError):
+            return {}
+
+    def lookup(self, appid):
+        """Return the name of a Steam appid, or None if it is unknown."""
+        if self.__appids is None and not self.__open():
+            return None
+        appid = int(appid)
+        position = bisect_left(self.__appids, appid)
+        if position == len(self.__appids) or self.__appids[position] != appid:
+            return None
+        start = self.__namesStart + self.__offsets[position]
+        end = self.__namesStart + self.__offsets[position + 1]
+        return self.__map[start:end].decode("utf-8")
+
+    def __len__(self):
+        if self.__appids is None and not self.__open():
+            return 0
+        return len(self.__appids)
+
+    def __open(self):
+        try:
+            with open(self.indexPath, "rb") as f:
+                self.__map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return False
+
+        magic, count, metadataLength = HEADER.unpack_from(self.__map, 0)
+        if magic != MAGIC:
+            return False
+        view = memoryview(self.__map)
+        offset = HEADER.size + METADATA_SIZE
+        self.__appids = view[offset:offset + count * 4].cast("I")
+        offset += count * 4
+        self.__offsets = view[offset:offset + (count + 1) * 4].cast("I")
+        self.__namesStart = offset + (count + 1) * 4
+        return True
+
+    def __write(self, apps, metadata):
+        """Write the whole index atomically."""
+        appids = array("I", sorted(apps))
+        offsets = array("I", [0])
+        names = bytearray()
+        for appid in appids:
+            names += apps[appid].encode("utf-8")
+            offsets.append(len(names))
+
+        metadataBytes = self.__encodeMetadata(metadata)
+
+        # Release our own mapping first, Windows cannot replace a mapped file
+        self.__close()
+        directory = os.path.dirname(os.path.abspath(self.indexPath))
+        os.makedirs(directory, exist_ok=True)
+        tempPath = f"{self.indexPath}.tmp"
+        with open(tempPath, "wb") as f:
+            f.write(HEADER.pack(MAGIC, len(appids), len(metadataBytes)))
+            f.write(metadataBytes.ljust(METADATA_SIZE, b"\0"))
+            f.write(appids.tobytes())
+            f.write(offsets.tobytes())
+            f.write(names)
+        os.replace(tempPath, self.indexPath)
+
+    def __writeMetadata(self, metadata):
+        """Replace only the metadata block of an existing index."""
+        metadataBytes = self.__encodeMetadata(metadata)
+        with open(self.indexPath, "r+b") as f:
+            _, count, _ = HEADER.unpack(f.read(HEADER.size))
+            f.seek(0)
+            f.write(HEADER.pack(MAGIC, count, len(metadataBytes)))
+            f.write(metadataBytes.ljust(METADATA_SIZE, b"\0"))
+
+    @staticmethod
+    def __encodeMetadata(metadata):
+        metadataBytes = json.dumps(metadata).encode("utf-8")
+        if len(metadataBytes) > METADATA_SIZE:
+            # Oversized validators are dropped, the next refresh then simply downloads unconditionally
+            metadataBytes = json.dumps({"fetchedAt": metadata.get("fetchedAt", 0)}).encode("utf-8")
+        return metadataBytes
+
+    def __close(self):
+        for view in (self.__appids, self.__offsets):
+            if view is not None:
+                view.release()
+        self.__appids = self.__offsets = None
+        if self.__map is not None:
+            self.__map.close()
+            self.__map = None
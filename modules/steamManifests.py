@@ -0,0 +1,115 @@
+"""
+# Github Authors: https://github.com/JulianStiebler/
+# Github Contributors: https://github.com/JulianStiebler/
+
+# GitHub Repository: https://github.com/JulianStiebler/GameSaveVault
+# Github License: MIT // https://github.com/JulianStiebler/GameSaveVault/blob/main/LICENSE
+
+# Last Edited: 18.10.2026
+"""
+
+import os
+import json
+
+import core.util as util
+from modules import vdfParser
+
+CACHE_VERSION = 1
+
+class SteamManifestCache:
+    """
+    Parses appmanifest_*.acf files and remembers the result per file.
+
+    A file is only parsed again when its (mtime, size) differs from the cached entry. Parsing is
+    pure Python and holds the GIL, so the files are parsed one after the other.
+    """
+
+    def __init__(self, cachePath=None):
+        self.cachePath = cachePath
+        self.parsed = 0
+        self.reused = 0
+        self.__entries = self.__load()
+
+    @staticmethod
+    def ParseManifest(ACFFilePath):
+        """
+        Parse one ACF file.
+
+        Returns:
+            dict: The "appid", "name" and "installdir" found in its AppState section (missing keys are left out).
+        """
+        # Subsections are left out, every value left in AppState is a string
+        appState = vdfParser.loadFile(ACFFilePath, lowerKeys=True, maxDepth=1).get("appstate")
+        if not isinstance(appState, dict):
+            return {}
+        return {key: appState[key] for key in ("appid", "name", "installdir") if key in appState}
+
+    def parseAll(self, ACFFilePaths):
+        """
+        Parse many ACF files, reusing cached results for unchanged ones.
+
+        Args:
+            ACFFilePaths (list): Paths of the ACF files.
+
+        Returns:
+            list: One details dictionary per path, in input order (empty if the file could not be parsed).
+        """
+        self.parsed = 0
+        self.reused = 0
+        results = [None] * len(ACFFilePaths)
+        live = {}
+
+        for index, path in enumerate(ACFFilePaths):
+            try:
+                info = os.stat(path)
+            except OSError as e:
+                print(f"Error reading {path}: {e}")
+                results[index] = {}
+                continue
+
+            key = [info.st_mtime_ns, info.st_size]
+            entry = self.__entries.get(path)
+            if entry and entry["stat"] == key:
+                results[index] = entry["details"]
+                live[path] = entry
+                self.reused += 1
+            else:
+                results[index] = self.__parseSafe(path)
+                live[path] = {"stat": key, "details": results[index]}
+                self.parsed += 1
+
+        # Manifests that vanished drop out of the cache
+        if self.parsed or len(live) != len(self.__entries):
+            self.__entries = live
+            self.save()
+        return results
+
+    def save(self):
+        if not self.cachePath:
+            return
+        try:
+            util.writeJSONAtomic(self.cachePath, {"version": CACHE_VERSION, "manifests": self.__entries}, indent=None)
+        except Exception as e:
+            print(f"Error writing ACF cache '{self.cachePath}': {e}")
+
+    @staticmethod
+    def __parseSafe(path):
+        try:
+            return SteamManifestCache.ParseManifest(path)
+        except Exception as e:
+            print(f"Error reading {path}: {e}")
+            return {}
+
+    def __load(self):
+        if not self.cachePath:
+            return {}
+        try:
+            with open(self.cachePath, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") == CACHE_VERSION:
+                return data.get("manifests", {})
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Ignoring unreadable ACF cache '{self.cachePath}': {e}")
+        return {}
@@ -0,0 +1,234 @@
+"""
+# Github Authors: https://github.com/JulianStiebler/
+# Github Contributors: https://github.com/JulianStiebler/
+
+# GitHub Repository: https://github.com/JulianStiebler/GameSaveVault
+# Github License: MIT // https://github.com/JulianStiebler/GameSaveVault/blob/main/LICENSE
+
+# Last Edited: 18.10.2026
+"""
+
+import os
+import re
+import codecs
+from itertools import chain, compress, count
+
+# Valve KeyValues text format as used by libraryfolders.vdf and appmanifest_*.acf:
+# quoted or bare strings, { } for nested sections, // line comments and [$PLATFORM] conditionals.
+# Each match skips the whitespace before one token. Comments and conditionals match with all groups
+# empty, any other character lands in the error group, so findall never steps over input silently.
+# The closing quote has its own group, an empty quoted string "" still counts as a string.
+TOKEN_PATTERN = re.compile(r'''
+    \s*
+    (?:
+        "([^"\\]*(?:\\.[^"\\]*)*)(")
+      | ([{}])
+      | //[^\n]*
+      | \[[^\]\n]*\]
+      | ([^\s{}"\[\]]+)
+      | (\S)
+    )
+''', re.VERBOSE | re.DOTALL)
+
+ESCAPE_PATTERN = re.compile(r'\\(.)', re.DOTALL)
+ESCAPES = {"n": "\n", "t": "\t", "\\": "\\", '"': '"'}
+
+# What may stand between the quoted strings of a document without comments or bare strings:
+# whitespace and braces, the NUL separators are added by _loadQuoted
+WHITESPACE = str.maketrans("", "", " \t\r\n\f\v")
+BRACES = str.maketrans("", "", "{}\0")
+
+CHUNK_SIZE = 1 << 16
+OPEN_FLAGS = os.O_RDONLY | getattr(os, "O_BINARY", 0)
+
+
+class VDFError(ValueError):
+    pass
+
+
+def load(stream, lowerKeys=False, maxDepth=None):
+    """
+    Parse a KeyValues document into nested dictionaries.
+
+    A document that fits in one chunk and holds only quoted strings and braces (every ACF manifest)
+    is split on its quotes with str.split; anything else is streamed through the tokenizer.
+
+    Args:
+        stream: Text file object.
+        lowerKeys (bool): Lowercase all keys, KeyValues keys are case-insensitive.
+        maxDepth (int): Leave out the sections nested deeper than this, 1 keeps the top-level sections
+            without their subsections. They are still checked for errors, only no dictionaries are built.
+
+    Returns:
+        dict: The parsed document, later duplicate keys win.
+    """
+    # read(size) on a text stream only returns less than size at the end of the stream
+    first = stream.read(CHUNK_SIZE)
+    if len(first) < CHUNK_SIZE:
+        return _loadText(first, lowerKeys, maxDepth)
+    return _loadTokens(chain([first], iter(lambda: stream.read(CHUNK_SIZE), "")), lowerKeys, maxDepth)
+
+
+def loadFile(filePath, lowerKeys=False, maxDepth=None):
+    """
+    Parse a KeyValues file, see load().
+
+    The file is read with os.read and decoded per chunk, opening a buffered text stream costs more
+    than parsing a manifest.
+    """
+    fd = os.open(filePath, OPEN_FLAGS)
+    try:
+        first = os.read(fd, CHUNK_SIZE)
+        if len(first) < CHUNK_SIZE:
+            return _loadText(first.decode("utf-8", "replace"), lowerKeys, maxDepth)
+        decoder = codecs.getincrementaldecoder("utf-8")("replace")
+        chunks = chain([first], iter(lambda: os.read(fd, CHUNK_SIZE), b""))
+        return _loadTokens(chain(map(decoder.decode, chunks), [decoder.decode(b"", True)]), lowerKeys, maxDepth)
+    finally:
+        os.close(fd)
+
+
+def _loadText(text, lowerKeys, maxDepth):
+    document = _loadQuoted(text, lowerKeys, maxDepth)
+    return document if document is not None else _loadTokens([text], lowerKeys, maxDepth)
+
+
+def _unescape(value):
+    return ESCAPE_PATTERN.sub(lambda m: ESCAPES.get(m.group(1), m.group(0)), value)
+
+
+def _loadQuoted(text, lowerKeys, maxDepth):
+    """
+    Parse a document of quoted strings and braces without the tokenizer, None if it has anything else.
+
+    Escaped backslashes and quotes are swapped for NUL pairs first, so every quote left starts or ends
+    a string and str.split does the tokenizing. Unescaping and lowercasing run once over all strings
+    joined by NUL separators. The strings between two brace groups are key/value pairs of the current
+    section and go in with one dict.update; an odd one out is the key of the section the next brace opens.
+    Sections past maxDepth are None on the stack, their strings go nowhere.
+    """
+    if "\0" in text:
+        return None
+    escaped = "\\" in text
+    if escaped:
+        text = text.replace("\\\\", "\0\0").replace('\\"', "\0\1")
+    parts = text.split('"')
+    if len(parts) % 2 == 0:
+        return None
+    # parts[0::2] stand before each string, stripped of whitespace a non-empty piece ends a run of strings
+    braces = "\0".join(parts[0::2]).translate(WHITESPACE)
+    if braces.translate(BRACES):
+        return None
+    braces = braces.split("\0")
+    strings = parts[1::2]
+    if escaped and strings:
+        # A backslash left is followed by a character of its own string, never by a separator
+        joined = _unescape("\0\2".join(strings)) if "\\" in text else "\0\2".join(strings)
+        joined = joined.replace("\0\0", "\\").replace("\0\1", '"')
+        strings = joined.split("\0\2")
+        keys = joined.lower().split("\0\2") if lowerKeys else strings
+    else:
+        keys = "\0".join(strings).lower().split("\0") if lowerKeys and strings else strings
+
+    if maxDepth is None:
+        maxDepth = float("inf")
+    root = section = {}
+    stack = []
+    start = 0
+    for end in compress(count(), braces):
+        run = end - start
+        if run > 1 and section is not None:
+            section.update(zip(keys[start:end:2], strings[start + 1:end:2]))
+        key = keys[end - 1] if run % 2 else None
+        for brace in braces[end]:
+            if brace == "{":
+                if key is None:
+                    raise VDFError("Section without a key.")
+                stack.append(section)
+                if section is not None and len(stack) <= maxDepth:
+                    section[key] = section = {}
+                else:
+                    section = None
+                key = None
+            else:
+                if key is not None or not stack:
+                    raise VDFError("Unexpected '}'.")
+                section = stack.pop()
+        start = end
+
+    if stack or (len(strings) - start) % 2:
+        raise VDFError("Unexpected end of document.")
+    section.update(zip(keys[start::2], strings[start + 1::2]))
+    return root
+
+
+def _tokenBatches(chunks):
+    """
+    Tokenize text chunks in batches, without joining them in full.
+
+    Yields:
+        list: (quoted, closingQuote, brace, bare, error) per token, see TOKEN_PATTERN. Only the tokens
+        that cannot continue into the next chunk are taken, the last chunk goes in one findall call.
+    """
+    buffer = ""
+    chunks = iter(chunks)
+    chunk = next(chunks, "")
+    while True:
+        nextChunk = next(chunks, "") if chunk else ""
+        buffer += chunk
+        if not nextChunk:
+            yield TOKEN_PATTERN.findall(buffer)
+            return
+
+        pos = 0
+        batch = []
+        for match in TOKEN_PATTERN.finditer(buffer):
+            # A token touching the end of the buffer may continue in the next chunk, so may an open quote
+            if match.end() == len(buffer) or match.lastindex == 5:
+                break
+            batch.append(match.groups())
+            pos = match.end()
+        yield batch
+        buffer = buffer[pos:]
+        chunk = nextChunk
+
+
+def _loadTokens(chunks, lowerKeys, maxDepth):
+    # Sections past maxDepth are None on the stack, as in _loadQuoted
+    if maxDepth is None:
+        maxDepth = float("inf")
+    root = {}
+    stack = [root]
+    key = None
+    for batch in _tokenBatches(chunks):
+        for quoted, quote, brace, bare, error in batch:
+            if quote or bare:
+                if quote:
+                    value = _unescape(quoted) if "\\" in quoted else quoted
+                else:
+                    value = bare
+                if key is None:
+                    key = value.lower() if lowerKeys else value
+                else:
+                    if stack[-1] is not None:
+                        stack[-1][key] = value
+                    key = None
+            elif brace == "{":
+                if key is None:
+                    raise VDFError("Section without a key.")
+                section = None
+                if stack[-1] is not None and len(stack) <= maxDepth:
+                    section = {}
+                    stack[-1][key] = section
+                stack.append(section)
+                key = None
+            elif brace:
+                if key is not None or len(stack) == 1:
+                    raise VDFError("Unexpected '}'.")
+                stack.pop()
+            elif error:
+                raise VDFError(f"Unexpected {error!r}.")
+
+    if key is not None or len(stack) != 1:
+        raise VDFError("Unexpected end of document.")
+    return root
@@ -19,10 +19,11 @@ from core.util import sanitizeFolderName_contains
 
 
 class NamedBackupDialog:
-    def __init__(self, parent, data, targetPath):
+    def __init__(self, parent, data, targetPath, extension=".zip"):
         self.result = None  # To store the final result
         self.data = data
         self.targetPath = targetPath
+        self.extension = extension
         self.dialog = ttk.Toplevel(parent)
         self.dialog.title("Custom Backup Name")
         self.dialog.geometry("400x250")  # Increased height to accommodate the warning label
@@ -95,9 +96,9 @@ class NamedBackupDialog:
         if name:  # Ensure name is not empty
             if self.CHK_timestamp_value.get():
                 # Add the timestamp if checkbox is checked
-                fileName = f"{name}-{timestamp}.zip"
+                fileName = f"{name}-{timestamp}{self.extension}"
             else:
-                fileName = f"{name}.zip"
+                fileName = f"{name}{self.extension}"
 
             targetPath = os.path.join(self.targetPath, fileName)
             
@@ -0,0 +1,203 @@
+"""
+# Github Authors: https://github.com/JulianStiebler/
+# Github Contributors: https://github.com/JulianStiebler/
+
+# GitHub Repository: https://github.com/JulianStiebler/GameSaveVault
+# Github License: MIT // https://github.com/JulianStiebler/GameSaveVault/blob/main/LICENSE
+
+# Last Edited: 18.10.2026
+"""
+
+import ttkbootstrap as ttk
+from ttkbootstrap.constants import *
+import tkinter.font as tkfont
+
+
+class VirtualList(ttk.Frame):
+    """
+    Scrollable single-column list that only creates widgets for the rows on screen.
+
+    The rows are a model of keys plus a function that turns a key into the row text, so the list costs
+    the same whether it holds a hundred or a hundred thousand entries. A small pool of labels, the visible
+    rows plus an overscan buffer, is recycled while scrolling.
+
+    Selection follows a Treeview with selectmode='extended': click selects one row, Ctrl-click toggles,
+    Shift-click and Shift+arrows extend from the anchor, Ctrl+A selects all. Every change of the selection
+    generates <<TreeviewSelect>>, and selection() and focus() return keys like a Treeview returns item ids.
+    """
+
+    def __init__(self, master, textFor=str, overscan=4, bootstyle="info", scrollbarStyle="danger", **kwargs):
+        """
+        Args:
+            master: Parent widget.
+            textFor (callable): Returns the text shown for a key.
+            overscan (int): Rows kept rendered above and below the visible ones.
+            bootstyle (str): Color of the selected rows.
+            scrollbarStyle (str): Bootstyle of the scrollbar.
+        """
+        super().__init__(master, takefocus=True, **kwargs)
+        self.textFor = textFor
+        self.overscan = overscan
+        self.items = []
+        self.selected = set()
+        self.focusKey = None
+        self.anchor = None
+        self.__positions = {}
+        self.__offset = 0
+        self.__rows = []
+        self.__selectedStyle = f"inverse-{bootstyle}"
+
+        font = tkfont.nametofont("TkDefaultFont")
+        self.rowHeight = font.metrics("linespace") + 6
+
+        self.viewport = ttk.Frame(self)
+        self.viewport.grid(row=0, column=0, sticky="nsew")
+        self.scrollbar = ttk.Scrollbar(self, orient=VERTICAL, command=self.yview, bootstyle=scrollbarStyle)
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+        self.grid_rowconfigure(0, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+
+        self.viewport.bind("<Configure>", lambda e: self.__render())
+        for widget in (self, self.viewport):
+            self.__bindMouse(widget)
+        self.bind("<Up>", lambda e: self.__step(-1, e))
+        self.bind("<Down>", lambda e: self.__step(1, e))
+        self.bind("<Prior>", lambda e: self.__step(-self.__visibleRows(), e))
+        self.bind("<Next>", lambda e: self.__step(self.__visibleRows(), e))
+        self.bind("<Home>", lambda e: self.__step(-len(self.items), e))
+        self.bind("<End>", lambda e: self.__step(len(self.items), e))
+        self.bind("<Control-a>", lambda e: self.__selectAll())
+
+    def setItems(self, items):
+        """Replace the model, keeping the selection of keys that are still listed."""
+        self.items = list(items)
+        self.__positions = {key: index for index, key in enumerate(self.items)}
+        self.__offset = 0
+        self.__render()
+
+    def selection(self):
+        """Selected keys that are currently listed, in list order."""
+        return tuple(sorted((key for key in self.selected if key in self.__positions), key=self.__positions.get))
+
+    def focus(self):
+        return self.focusKey
+
+    def selection_set(self, *keys):
+        self.selected = set(keys)
+        self.__selectionChanged()
+
+    def see(self, key):
+        """Scroll just enough to make the row of key visible."""
+        index = self.__positions.get(key)
+        if index is None:
+            return
+        top = index * self.rowHeight
+        height = self.viewport.winfo_height()
+        if top < self.__offset:
+            self.__offset = top
+        elif top + self.rowHeight > self.__offset + height:
+            self.__offset = top + self.rowHeight - height
+        self.__render()
+
+    def yview(self, *args):
+        """Scrollbar protocol: ('moveto', fraction) or ('scroll', count, 'units' | 'pages')."""
+        total = len(self.items) * self.rowHeight
+        if args[0] == "moveto":
+            self.__offset = int(float(args[1]) * total)
+        elif args[0] == "scroll":
+            step = self.viewport.winfo_height() if args[2] == "pages" else self.rowHeight
+            self.__offset += int(args[1]) * step
+        self.__render()
+
+    def __render(self):
+        height = max(self.viewport.winfo_height(), 1)
+        total = len(self.items) * self.rowHeight
+        self.__offset = max(0, min(self.__offset, total - height))
+
+        first = max(0, self.__offset // self.rowHeight - self.overscan)
+        last = min(len(self.items), (self.__offset + height) // self.rowHeight + 1 + self.overscan)
+        while len(self.__rows) < last - first:
+            self.__rows.append(self.__createRow())
+
+        for row, index in zip(self.__rows, range(first, last)):
+            key = self.items[index]
+            row.key = key
+            row.configure(text=self.textFor(key))
+            isSelected = key in self.selected
+            if row.isSelected != isSelected:
+                # ttkbootstrap builds the style on first use, switching it is the expensive part of a row update
+                row.configure(bootstyle=self.__selectedStyle if isSelected else "default")
+                row.isSelected = isSelected
+            row.place(x=0, y=index * self.rowHeight - self.__offset, relwidth=1, height=self.rowHeight)
+        # Rows the pool has no item for stay around for the next scroll, just out of sight
+        for row in self.__rows[last - first:]:
+            row.key = None
+            row.place_forget()
+
+        if total:
+            self.scrollbar.set(self.__offset / total, min(1.0, (self.__offset + height) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def __createRow(self):
+        row = ttk.Label(self.viewport, anchor="w", padding=(4, 0), bootstyle="default")
+        row.key = None
+        row.isSelected = False
+        row.bind("<Button-1>", lambda e: self.__click(row.key, "select"))
+        row.bind("<Control-Button-1>", lambda e: self.__click(row.key, "toggle"))
+        row.bind("<Shift-Button-1>", lambda e: self.__click(row.key, "extend"))
+        self.__bindMouse(row)
+        return row
+
+    def __bindMouse(self, widget):
+        # Windows and macOS report wheel deltas, X11 sends button 4 and 5
+        widget.bind("<MouseWheel>", lambda e: self.yview("scroll", -3 if e.delta > 0 else 3, "units"))
+        widget.bind("<Button-4>", lambda e: self.yview("scroll", -3, "units"))
+        widget.bind("<Button-5>", lambda e: self.yview("scroll", 3, "units"))
+
+    def __click(self, key, mode):
+        if key is None:
+            return
+        self.focus_set()
+        if mode == "toggle":
+            self.selected ^= {key}
+            self.anchor = key
+        elif mode == "extend" and self.anchor in self.__positions:
+            self.selected = set(self.__range(self.anchor, key))
+        else:
+            self.selected = {key}
+            self.anchor = key
+        self.focusKey = key
+        self.__selectionChanged()
+
+    def __step(self, delta, event):
+        if not self.items:
+            return "break"
+        index = self.__positions.get(self.focusKey, -1 if delta > 0 else len(self.items))
+        key = self.items[max(0, min(index + delta, len(self.items) - 1))]
+        self.focusKey = key
+        # Shift held: extend the selection from the anchor like Shift-click
+        if event.state & 0x0001 and self.anchor in self.__positions:
+            self.selected = set(self.__range(self.anchor, key))
+        else:
+            self.selected = {key}
+            self.anchor = key
+        self.see(key)
+        self.__selectionChanged()
+        return "break"
+
+    def __selectAll(self):
+        self.selected = set(self.items)
+        self.__selectionChanged()
+        return "break"
+
+    def __visibleRows(self):
+        return max(1, self.viewport.winfo_height() // self.rowHeight)
+
+    def __range(self, fromKey, toKey):
+        start, end = sorted((self.__positions[fromKey], self.__positions[toKey]))
+        return self.items[start:end + 1]
+
+    def __selectionChanged(self):
+        self.__render()
+        self.event_generate("<<TreeviewSelect>>")